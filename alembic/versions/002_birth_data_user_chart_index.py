@@ -0,0 +1,27 @@
+"""Add composite index on birth_data user_id and chart_id (superseded)
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# The index became redundant once birth_data.user_id was made the primary key
+# (005), so this revision no longer creates it; it is kept for the revision
+# chain. Databases that already built it have it dropped by 005.
+
+
+def upgrade() -> None:
+    pass
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,59 @@
+"""Store birth_data birth_date and birth_time as native DATE/TIME
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'birth_data', 'birth_date',
+        existing_type=sa.String(length=10),
+        type_=sa.Date(),
+        existing_nullable=False,
+        comment='Birth date',
+        existing_comment='Birth date in YYYY-MM-DD format',
+        postgresql_using='birth_date::date',
+    )
+    op.alter_column(
+        'birth_data', 'birth_time',
+        existing_type=sa.String(length=8),
+        type_=sa.Time(),
+        existing_nullable=False,
+        comment='Birth time (local to timezone)',
+        existing_comment='Birth time in HH:MM:SS format',
+        postgresql_using='birth_time::time',
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'birth_data', 'birth_time',
+        existing_type=sa.Time(),
+        type_=sa.String(length=8),
+        existing_nullable=False,
+        comment='Birth time in HH:MM:SS format',
+        existing_comment='Birth time (local to timezone)',
+        postgresql_using="to_char(birth_time, 'HH24:MI:SS')",
+    )
+    op.alter_column(
+        'birth_data', 'birth_date',
+        existing_type=sa.Date(),
+        type_=sa.String(length=10),
+        existing_nullable=False,
+        comment='Birth date in YYYY-MM-DD format',
+        existing_comment='Birth date',
+        postgresql_using="to_char(birth_date, 'YYYY-MM-DD')",
+    )
@@ -0,0 +1,42 @@
+"""Generate created_at/updated_at defaults in the database
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ('users', 'birth_data')
+_COLUMNS = ('created_at', 'updated_at')
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        for column in _COLUMNS:
+            op.alter_column(
+                table, column,
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+                server_default=sa.text("timezone('UTC', now())"),
+            )
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        for column in _COLUMNS:
+            op.alter_column(
+                table, column,
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+                server_default=None,
+            )
@@ -0,0 +1,35 @@
+"""Use birth_data.user_id as the primary key
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # user_id was already unique and non-null; promote it to the primary key
+    op.drop_constraint('birth_data_pkey', 'birth_data', type_='primary')
+    op.drop_column('birth_data', 'id')
+    op.create_primary_key('birth_data_pkey', 'birth_data', ['user_id'])
+    op.drop_index(op.f('ix_birth_data_user_id'), table_name='birth_data')
+    # Lookups by user now hit the primary key, so the composite index only
+    # adds write overhead; it exists where 002 ran before it stopped creating it
+    op.execute('DROP INDEX IF EXISTS ix_birth_data_user_chart')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_birth_data_user_id'), 'birth_data', ['user_id'], unique=True)
+    op.drop_constraint('birth_data_pkey', 'birth_data', type_='primary')
+    # SERIAL recreates the sequence and numbers the existing rows
+    op.execute('ALTER TABLE birth_data ADD COLUMN id SERIAL NOT NULL')
+    op.create_primary_key('birth_data_pkey', 'birth_data', ['id'])
@@ -2,15 +2,84 @@
 
 import logging
 import base64
+import random
+import threading
 import time
 from typing import Dict, List, Optional, Literal
-from io import BytesIO
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 
 logger = logging.getLogger(__name__)
 
+# Aspect types drawn on every chart
+_ASPECT_TYPES = {
+    "conjunction": {"enabled": True},
+    "opposition": {"enabled": True},
+    "trine": {"enabled": True},
+    "square": {"enabled": True},
+    "sextile": {"enabled": True},
+}
+
+# Biwheel charts only show transit-to-natal aspects
+_TRANSIT_ASPECT_SETTINGS = {
+    "natal": {
+        "enabled": False,  # Don't show natal-to-natal aspects
+        "orb": 6,
+    },
+    "transit": {
+        "enabled": False,  # Don't show transit-to-transit aspects
+        "orb": 6,
+    },
+    "natalToTransit": {
+        "enabled": True,  # Show transit-to-natal aspects (main focus)
+        "orb": 3,
+        "types": _ASPECT_TYPES,
+    },
+}
+
+
+# Transient statuses worth another attempt (rate limit, render/gateway failures)
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Longest Retry-After the client will sleep through before giving up
+_MAX_RETRY_AFTER = 10.0
+
+
+def _backoff(attempt: int) -> float:
+    """Exponential backoff with full jitter, so workers don't retry in lockstep."""
+    return random.uniform(0, 2**attempt)
+
+
+class _RateLimiter:
+    """Token bucket spacing requests to one host across worker threads."""
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Args:
+            rate: Requests allowed per second on average
+            burst: Requests that may go out back to back after an idle period
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve a token even when none is left; the debt sets the wait
+            self._tokens -= 1
+            wait = -self._tokens / self.rate
+        if wait > 0:
+            time.sleep(wait)
+
 
 class ChartServiceError(Exception):
     """Base exception for Chart Service errors."""
@@ -31,6 +100,8 @@ class ChartServiceClient:
         api_key: str,
         timeout: int = 60,
         max_retries: int = 3,
+        pool_maxsize: int = 16,
+        max_rate: float = 10.0,
     ):
         """
         Initialize Chart Service Client.
@@ -40,17 +111,44 @@ class ChartServiceClient:
             api_key: API key for authentication
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
+            pool_maxsize: Maximum number of pooled keep-alive connections
+            max_rate: Render requests allowed per second on average
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
         self.max_retries = max_retries
+        # The client talks to a single host, so one bucket limits that host
+        self._limiter = _RateLimiter(rate=max_rate, burst=max(1, int(max_rate)))
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update({
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         })
 
+    @staticmethod
+    def _retry_delay(response: requests.Response, attempt: int) -> Optional[float]:
+        """
+        Get the delay before retrying a transient failure.
+
+        Honors the Retry-After header sent with 429 responses and falls back
+        to jittered exponential backoff otherwise.
+
+        Returns:
+            Delay in seconds, or None if the service asks to wait too long
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is None:
+            return _backoff(attempt)
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            return _backoff(attempt)
+        return delay if delay <= _MAX_RETRY_AFTER else None
+
     def render_chart(
         self,
         planets: Dict[str, Dict[str, float]],
@@ -87,13 +185,7 @@ class ChartServiceClient:
             "aspectSettings": {
                 "enabled": True,
                 "orb": aspect_orb,
-                "types": {
-                    "conjunction": {"enabled": True},
-                    "opposition": {"enabled": True},
-                    "trine": {"enabled": True},
-                    "square": {"enabled": True},
-                    "sextile": {"enabled": True},
-                },
+                "types": _ASPECT_TYPES,
             },
             "renderOptions": {
                 "format": format,
@@ -104,33 +196,52 @@ class ChartServiceClient:
             },
         }
 
+        # Serialize once; retries resend the same body
+        body = orjson.dumps(payload)
+
         for attempt in range(self.max_retries):
             try:
-                logger.info(f"Requesting chart render (attempt {attempt + 1}/{self.max_retries})")
-                logger.debug(f"Chart render request payload: {payload}") # Log the payload
+                logger.info("Requesting chart render (attempt %s/%s)", attempt + 1, self.max_retries)
+                logger.debug("Chart render request payload: %s", payload)
 
+                self._limiter.acquire()
+                started = time.perf_counter_ns()
                 response = self.session.post(
                     url,
-                    json=payload,
+                    data=body,
                     timeout=self.timeout,
                 )
+                elapsed_ms = (time.perf_counter_ns() - started) / 1e6
+
+                if response.status_code in _RETRY_STATUSES and attempt < self.max_retries - 1:
+                    delay = self._retry_delay(response, attempt)
+                    if delay is not None:
+                        logger.warning(
+                            "Chart service returned %s, retrying in %.1fs (attempt %d)",
+                            response.status_code,
+                            delay,
+                            attempt + 1,
+                        )
+                        time.sleep(delay)
+                        continue
 
                 if response.status_code == 200:
-                    data = response.json()
-                    image_base64 = data["data"]["image"]
-                    image_bytes = base64.b64decode(image_base64)
+                    data = orjson.loads(response.content)
+                    # The API only returns JSON, so the image arrives base64-encoded
+                    image_bytes = base64.b64decode(data["data"]["image"])
 
                     logger.info(
-                        f"Chart rendered successfully: "
-                        f"{data['data']['size']} bytes, "
-                        f"{data['meta']['renderTime']}ms"
+                        "Chart rendered successfully: %s bytes, %sms render, %.0fms round trip",
+                        data["data"]["size"],
+                        data["meta"]["renderTime"],
+                        elapsed_ms,
                     )
 
                     return image_bytes
 
                 elif response.status_code == 429:
                     retry_after = response.headers.get("Retry-After", 60)
-                    logger.warning(f"Rate limit exceeded, retry after {retry_after}s")
+                    logger.warning("Rate limit exceeded, retry after %ss", retry_after)
                     raise ChartServiceError(
                         "Rate limit exceeded",
                         code="RATE_LIMIT_EXCEEDED",
@@ -139,7 +250,7 @@ class ChartServiceClient:
 
                 elif response.status_code >= 400:
                     try:
-                        error_data = response.json()
+                        error_data = orjson.loads(response.content)
                         error_info = error_data.get("error", {})
                         raise ChartServiceError(
                             error_info.get("message", "Unknown error"),
@@ -155,16 +266,16 @@ class ChartServiceClient:
                         )
 
             except requests.exceptions.Timeout:
-                logger.warning(f"Request timeout (attempt {attempt + 1})")
+                logger.warning("Request timeout (attempt %s)", attempt + 1)
                 if attempt == self.max_retries - 1:
                     raise ChartServiceError("Service timeout", code="TIMEOUT")
-                time.sleep(2**attempt)
+                time.sleep(_backoff(attempt))
 
             except requests.exceptions.ConnectionError as e:
-                logger.error(f"Connection error: {e}")
+                logger.error("Connection error: %s", e)
                 if attempt == self.max_retries - 1:
                     raise ChartServiceError("Service unavailable", code="CONNECTION_ERROR")
-                time.sleep(2**attempt)
+                time.sleep(_backoff(attempt))
 
         raise ChartServiceError("Max retries exceeded", code="MAX_RETRIES")
 
@@ -209,27 +320,7 @@ class ChartServiceClient:
                 "planets": transit_planets,
                 "datetime": transit_datetime,
             },
-            "aspectSettings": {
-                "natal": {
-                    "enabled": False,  # Don't show natal-to-natal aspects
-                    "orb": 6,
-                },
-                "transit": {
-                    "enabled": False,  # Don't show transit-to-transit aspects
-                    "orb": 6,
-                },
-                "natalToTransit": {
-                    "enabled": True,  # Show transit-to-natal aspects (main focus)
-                    "orb": 3,
-                    "types": {
-                        "conjunction": {"enabled": True},
-                        "opposition": {"enabled": True},
-                        "trine": {"enabled": True},
-                        "square": {"enabled": True},
-                        "sextile": {"enabled": True},
-                    },
-                },
-            },
+            "aspectSettings": _TRANSIT_ASPECT_SETTINGS,
             "renderOptions": {
                 "format": format,
                 "width": width,
@@ -239,33 +330,52 @@ class ChartServiceClient:
             },
         }
 
+        # Serialize once; retries resend the same body
+        body = orjson.dumps(payload)
+
         for attempt in range(self.max_retries):
             try:
-                logger.info(f"Requesting transit chart render (attempt {attempt + 1}/{self.max_retries})")
-                logger.debug(f"Transit chart render payload: {payload}")
+                logger.info("Requesting transit chart render (attempt %s/%s)", attempt + 1, self.max_retries)
+                logger.debug("Transit chart render payload: %s", payload)
 
+                self._limiter.acquire()
+                started = time.perf_counter_ns()
                 response = self.session.post(
                     url,
-                    json=payload,
+                    data=body,
                     timeout=self.timeout,
                 )
+                elapsed_ms = (time.perf_counter_ns() - started) / 1e6
+
+                if response.status_code in _RETRY_STATUSES and attempt < self.max_retries - 1:
+                    delay = self._retry_delay(response, attempt)
+                    if delay is not None:
+                        logger.warning(
+                            "Chart service returned %s, retrying in %.1fs (attempt %d)",
+                            response.status_code,
+                            delay,
+                            attempt + 1,
+                        )
+                        time.sleep(delay)
+                        continue
 
                 if response.status_code == 200:
-                    data = response.json()
-                    image_base64 = data["data"]["image"]
-                    image_bytes = base64.b64decode(image_base64)
+                    data = orjson.loads(response.content)
+                    # The API only returns JSON, so the image arrives base64-encoded
+                    image_bytes = base64.b64decode(data["data"]["image"])
 
                     logger.info(
-                        f"Transit chart rendered successfully: "
-                        f"{data['data']['size']} bytes, "
-                        f"{data['meta']['renderTime']}ms"
+                        "Transit chart rendered successfully: %s bytes, %sms render, %.0fms round trip",
+                        data["data"]["size"],
+                        data["meta"]["renderTime"],
+                        elapsed_ms,
                     )
 
                     return image_bytes
 
                 elif response.status_code == 429:
                     retry_after = response.headers.get("Retry-After", 60)
-                    logger.warning(f"Rate limit exceeded, retry after {retry_after}s")
+                    logger.warning("Rate limit exceeded, retry after %ss", retry_after)
                     raise ChartServiceError(
                         "Rate limit exceeded",
                         code="RATE_LIMIT_EXCEEDED",
@@ -274,7 +384,7 @@ class ChartServiceClient:
 
                 elif response.status_code >= 400:
                     try:
-                        error_data = response.json()
+                        error_data = orjson.loads(response.content)
                         error_info = error_data.get("error", {})
                         raise ChartServiceError(
                             error_info.get("message", "Unknown error"),
@@ -289,16 +399,16 @@ class ChartServiceClient:
                         )
 
             except requests.exceptions.Timeout:
-                logger.warning(f"Request timeout (attempt {attempt + 1})")
+                logger.warning("Request timeout (attempt %s)", attempt + 1)
                 if attempt == self.max_retries - 1:
                     raise ChartServiceError("Service timeout", code="TIMEOUT")
-                time.sleep(2**attempt)
+                time.sleep(_backoff(attempt))
 
             except requests.exceptions.ConnectionError as e:
-                logger.error(f"Connection error: {e}")
+                logger.error("Connection error: %s", e)
                 if attempt == self.max_retries - 1:
                     raise ChartServiceError("Service unavailable", code="CONNECTION_ERROR")
-                time.sleep(2**attempt)
+                time.sleep(_backoff(attempt))
 
         raise ChartServiceError("Max retries exceeded", code="MAX_RETRIES")
 
@@ -311,9 +421,9 @@ class ChartServiceClient:
         """
         try:
             url = f"{self.base_url}/health"
-            response = requests.get(url, timeout=5)
+            response = self.session.get(url, timeout=5)
             return response.status_code == 200
         except Exception as e:
-            logger.error(f"Health check failed: {e}")
+            logger.error("Health check failed: %s", e)
             return False
 
@@ -2,10 +2,13 @@
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 
 logger = logging.getLogger(__name__)
@@ -31,6 +34,7 @@ class NocturnaClient:
         service_token: Optional[str] = None,
         timeout: int = 30,
         max_retries: int = 3,
+        pool_maxsize: int = 16,
     ):
         """
         Initialize Nocturna API client.
@@ -40,12 +44,16 @@ class NocturnaClient:
             service_token: Service token for authentication
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
+            pool_maxsize: Maximum number of pooled keep-alive connections
         """
         self.api_url = api_url.rstrip("/")
         self.service_token = service_token
         self.timeout = timeout
         self.max_retries = max_retries
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         
         headers = {
             "Content-Type": "application/json",
@@ -92,6 +100,11 @@ class NocturnaClient:
         """
         url = f"{self.api_url}{endpoint}"
 
+        # Serialize the JSON body once for all attempts
+        # (the session already sends Content-Type: application/json)
+        if "json" in kwargs:
+            kwargs["data"] = orjson.dumps(kwargs.pop("json"))
+
         for attempt in range(self.max_retries + 1):
             try:
                 response = self.session.request(
@@ -107,7 +120,8 @@ class NocturnaClient:
                     continue
 
                 response.raise_for_status()
-                return response.json()
+                # Empty bodies (e.g. 204 on DELETE) are not worth retrying
+                return orjson.loads(response.content) if response.content else {}
 
             except requests.exceptions.Timeout:
                 if attempt < self.max_retries:
@@ -121,7 +135,7 @@ class NocturnaClient:
                 if 400 <= e.response.status_code < 500:
                     error_body = ""
                     try:
-                        error_data = e.response.json()
+                        error_data = orjson.loads(e.response.content)
                         error_body = f"\nAPI Response: {error_data}"
                     except Exception:
                         error_body = f"\nResponse Text: {e.response.text}"
@@ -136,7 +150,7 @@ class NocturnaClient:
                     continue
                 raise NocturnaAPIError(f"Request failed: {str(e)}")
             
-            except requests.exceptions.RequestException as e:
+            except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
                 if attempt < self.max_retries:
                     logger.warning(f"Request error, retrying (attempt {attempt + 1})")
                     time.sleep(2**attempt)
@@ -145,69 +159,19 @@ class NocturnaClient:
 
         raise NocturnaAPIError("Max retries exceeded")
 
-    def calculate_planetary_positions(
-        self,
-        date: str,
-        time: str,
-        latitude: float,
-        longitude: float,
-        timezone: str,
-        planets: Optional[List[str]] = None,
-    ) -> Dict[str, Any]:
+    def warm_up(self) -> bool:
         """
-        Calculate current planetary positions.
-
-        Args:
-            date: Date in YYYY-MM-DD format
-            time: Time in HH:MM:SS format
-            latitude: Geographic latitude in degrees
-            longitude: Geographic longitude in degrees
-            timezone: Timezone string (e.g., "Europe/Moscow")
-            planets: List of planet names (default: all major planets)
+        Open a pooled connection to the API before the first real request.
 
         Returns:
-            Dictionary with planetary positions
+            bool: True if the API answered, False otherwise
         """
-        if planets is None:
-            planets = [
-                "SUN",
-                "MOON",
-                "MERCURY",
-                "VENUS",
-                "MARS",
-                "JUPITER",
-                "SATURN",
-                "URANUS",
-                "NEPTUNE",
-                "PLUTO",
-            ]
-
-        payload = {
-            "date": date,
-            "time": time,
-            "latitude": latitude,
-            "longitude": longitude,
-            "timezone": timezone,
-            "planets": planets,
-            "include_retrograde": True,
-            "include_speed": True,
-        }
-
-        response = self._make_request(
-            "POST", "/calculations/planetary-positions", json=payload
-        )
-
-        # Direct calculations endpoint returns data directly without wrapper
-        # Check if response has 'success' field (wrapped format) or direct data
-        if "success" in response:
-            if response.get("success"):
-                return response.get("data", {})
-            else:
-                error = response.get("error", {})
-                raise NocturnaAPIError(f"API error: {self._handle_error_response(error)}")
-        else:
-            # Direct format - return as is
-            return response
+        try:
+            self.session.head(self.api_url, timeout=5)
+            return True
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Nocturna API warm-up failed: {str(e)}")
+            return False
 
     def calculate_aspects(
         self,
@@ -327,6 +291,50 @@ class NocturnaClient:
             # Direct format - return as is
             return response
 
+    def calculate_chart(
+        self,
+        date: str,
+        time: str,
+        latitude: float,
+        longitude: float,
+        timezone: str,
+    ) -> Dict[str, Any]:
+        """
+        Calculate planetary positions and house cusps for one moment.
+
+        The API has no combined endpoint, so both requests are issued
+        concurrently over the pooled session.
+
+        Args:
+            date: Date in YYYY-MM-DD format
+            time: Time in HH:MM:SS format
+            latitude: Geographic latitude in degrees
+            longitude: Geographic longitude in degrees
+            timezone: Timezone string
+
+        Returns:
+            Dictionary with "positions" and "houses" lists
+        """
+        request_kwargs = dict(
+            date=date,
+            time=time,
+            latitude=latitude,
+            longitude=longitude,
+            timezone=timezone,
+        )
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            positions_future = executor.submit(
+                self.calculate_planetary_positions, **request_kwargs
+            )
+            houses_future = executor.submit(self.calculate_houses, **request_kwargs)
+            positions_data = positions_future.result()
+            houses_data = houses_future.result()
+
+        return {
+            "positions": positions_data.get("positions", []),
+            "houses": houses_data.get("houses", []),
+        }
+
     def create_chart(
         self,
         date: str,
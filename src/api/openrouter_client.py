@@ -1,7 +1,9 @@
 """Client for OpenRouter API."""
 
 import logging
-from typing import List, Dict, Optional
+import threading
+import time
+from typing import Iterator, List, Dict, Optional
 
 from openai import OpenAI
 import httpx
@@ -10,6 +12,12 @@ import httpx
 logger = logging.getLogger(__name__)
 
 
+class OpenRouterUnavailableError(Exception):
+    """Raised without calling the API while the circuit breaker is open."""
+
+    pass
+
+
 class OpenRouterClient:
     """
     Client for interacting with OpenRouter API.
@@ -17,6 +25,22 @@ class OpenRouterClient:
     Uses OpenAI SDK with custom base URL for OpenRouter.
     """
 
+    # Consecutive failed calls that open the circuit breaker, and how long
+    # calls then fail fast before the API is tried again
+    FAILURE_THRESHOLD = 5
+    COOLDOWN_SECONDS = 60.0
+
+    # Retries are left to the SDK alone (it backs off on 429/5xx and
+    # connection errors). A non-streaming completion sends nothing until it
+    # is finished, so its read timeout must cover a whole natal reading;
+    # a stream only waits between chunks. With the per-attempt timeouts
+    # this bounds a completion to about REQUEST_DEADLINE seconds; streams
+    # are cut off at the deadline explicitly.
+    MAX_RETRIES = 1
+    REQUEST_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+    STREAM_TIMEOUT = httpx.Timeout(40.0, connect=5.0)
+    REQUEST_DEADLINE = 125.0
+
     def __init__(self, api_key: str, model: str = "anthropic/claude-haiku-4.5"):
         """
         Initialize OpenRouter client.
@@ -27,23 +51,117 @@ class OpenRouterClient:
         """
         self.model = model
         
-        # Create HTTP client without proxies to avoid conflicts
+        # Create HTTP client without proxies to avoid conflicts.
+        # One long-lived pool serves every interpretation, so TLS handshakes
+        # are paid once per connection rather than once per request; a short
+        # connect timeout fails fast instead of eating the read budget.
         http_client = httpx.Client(
-            timeout=60.0,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
+            timeout=self.REQUEST_TIMEOUT,
+            limits=httpx.Limits(
+                max_keepalive_connections=20, max_connections=32, keepalive_expiry=60.0
+            ),
         )
         
         self.client = OpenAI(
             base_url="https://openrouter.ai/api/v1",
             api_key=api_key,
             http_client=http_client,
+            timeout=self.REQUEST_TIMEOUT,
+            max_retries=self.MAX_RETRIES,
         )
 
+        self._failures = 0
+        self._open_until = 0.0
+        self._breaker_lock = threading.Lock()
+
+    def _check_circuit(self) -> None:
+        """Fail fast while the circuit breaker is open."""
+        if time.monotonic() < self._open_until:
+            raise OpenRouterUnavailableError(
+                "OpenRouter API disabled after repeated failures, retrying later"
+            )
+
+    def _record_success(self) -> None:
+        """Close the circuit breaker after a successful call."""
+        with self._breaker_lock:
+            self._failures = 0
+
+    def _record_failure(self) -> None:
+        """Count a failed call, opening the circuit breaker at the threshold."""
+        with self._breaker_lock:
+            self._failures += 1
+            if self._failures >= self.FAILURE_THRESHOLD:
+                # The count is kept, so the first failure after the
+                # cooldown opens the breaker again straight away
+                self._open_until = time.monotonic() + self.COOLDOWN_SECONDS
+                logger.warning(
+                    "OpenRouter failed %d times in a row, pausing calls for %.0fs",
+                    self._failures,
+                    self.COOLDOWN_SECONDS,
+                )
+
+    def _with_prompt_caching(
+        self, messages: List[Dict[str, str]], model: str
+    ) -> List[Dict]:
+        """
+        Mark system prompts as cacheable for Anthropic models.
+
+        OpenAI-family models cache long identical prefixes automatically;
+        Anthropic models routed through OpenRouter need an explicit
+        cache_control breakpoint on the content block.
+        """
+        if not model.startswith("anthropic/"):
+            return messages
+
+        return [
+            {
+                "role": "system",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": message["content"],
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ],
+            }
+            if message["role"] == "system" and isinstance(message["content"], str)
+            else message
+            for message in messages
+        ]
+
+    def _routing_params(self, model: Optional[str]) -> Dict:
+        """
+        Choose the model for a request.
+
+        A model other than the client default gets the default as an
+        OpenRouter fallback, so an outage of the routed model still
+        produces an answer.
+        """
+        params: Dict = {"model": model or self.model}
+        if model and model != self.model:
+            params["extra_body"] = {"models": [model, self.model]}
+        return params
+
+    @staticmethod
+    def _optional_params(
+        stop: Optional[List[str]], frequency_penalty: Optional[float]
+    ) -> Dict:
+        """Collect sampling parameters that are only sent when set."""
+        params: Dict = {}
+        if stop:
+            params["stop"] = stop
+        if frequency_penalty is not None:
+            params["frequency_penalty"] = frequency_penalty
+        return params
+
     def generate_completion(
         self,
         messages: List[Dict[str, str]],
         temperature: float = 0.7,
         max_tokens: int = 2000,
+        stop: Optional[List[str]] = None,
+        frequency_penalty: Optional[float] = None,
+        model: Optional[str] = None,
     ) -> str:
         """
         Generate completion using OpenRouter.
@@ -52,24 +170,90 @@ class OpenRouterClient:
             messages: List of message dicts with 'role' and 'content'
             temperature: Sampling temperature (0-1)
             max_tokens: Maximum tokens to generate
+            stop: Sequences that end generation when produced
+            frequency_penalty: Penalty for repeating tokens (-2 to 2)
+            model: Model to use instead of the client default
 
         Returns:
             Generated text response
+
+        Raises:
+            OpenRouterUnavailableError: If the circuit breaker is open
         """
+        self._check_circuit()
         try:
-            logger.info(f"Calling OpenRouter API with model {self.model}")
+            routing = self._routing_params(model)
+            logger.info("Calling OpenRouter API with model %s", routing["model"])
             response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
+                messages=self._with_prompt_caching(messages, routing["model"]),
                 temperature=temperature,
                 max_tokens=max_tokens,
+                **self._optional_params(stop, frequency_penalty),
+                **routing,
             )
 
             content = response.choices[0].message.content
-            logger.info(f"Received response: {len(content)} characters")
+            logger.info("Received response: %s characters", len(content))
+            self._record_success()
             return content
 
         except Exception as e:
-            logger.error(f"Error generating completion: {str(e)}", exc_info=True)
+            self._record_failure()
+            logger.error("Error generating completion: %s", e, exc_info=True)
             raise
 
+    def stream_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        stop: Optional[List[str]] = None,
+        frequency_penalty: Optional[float] = None,
+        model: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Generate completion using OpenRouter, yielding text as it arrives.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            temperature: Sampling temperature (0-1)
+            max_tokens: Maximum tokens to generate
+            stop: Sequences that end generation when produced
+            frequency_penalty: Penalty for repeating tokens (-2 to 2)
+            model: Model to use instead of the client default
+
+        Yields:
+            Pieces of the generated text in order
+
+        Raises:
+            OpenRouterUnavailableError: If the circuit breaker is open
+            TimeoutError: If the stream runs past REQUEST_DEADLINE
+        """
+        self._check_circuit()
+        routing = self._routing_params(model)
+        logger.info("Streaming from OpenRouter API with model %s", routing["model"])
+        deadline = time.monotonic() + self.REQUEST_DEADLINE
+        try:
+            stream = self.client.chat.completions.create(
+                messages=self._with_prompt_caching(messages, routing["model"]),
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+                timeout=self.STREAM_TIMEOUT,
+                **self._optional_params(stop, frequency_penalty),
+                **routing,
+            )
+            for chunk in stream:
+                if time.monotonic() > deadline:
+                    stream.close()
+                    raise TimeoutError(
+                        f"OpenRouter stream exceeded {self.REQUEST_DEADLINE:.0f}s"
+                    )
+                if chunk.choices:
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        yield delta
+        except Exception:
+            self._record_failure()
+            raise
+        self._record_success()
@@ -1,8 +1,9 @@
 """Conversation handlers for collecting user birth data."""
 
+import asyncio
 import logging
 import re
-from datetime import datetime
+from datetime import date, datetime, time
 from typing import Optional
 
 from telegram import Update
@@ -12,6 +13,7 @@ from geopy.geocoders import Nominatim
 from geopy.exc import GeocoderTimedOut, GeocoderServiceError
 from timezonefinder import TimezoneFinder
 
+from src.database.models import NATAL_CHART_CACHE_VERSION
 from src.database.service import DatabaseService
 from src.database.database import get_session
 from src.api.nocturna_client import NocturnaClient
@@ -59,7 +61,7 @@ class BirthDataConversation:
         logger.info(f"User {user.id} started natal chart setup")
 
         # Check if user already has birth data
-        async for session in get_session():
+        async with get_session() as session:
             db_service = DatabaseService(session)
             has_data = await db_service.has_birth_data(user.id)
         
@@ -221,8 +223,9 @@ class BirthDataConversation:
         )
 
         try:
-            # Geocode with timeout
-            location = self.geolocator.geocode(
+            # Geocode with timeout (blocking HTTP, keep it off the event loop)
+            location = await asyncio.to_thread(
+                self.geolocator.geocode,
                 location_name,
                 timeout=10,
                 language="ru",
@@ -340,29 +343,19 @@ class BirthDataConversation:
             
             logger.info(f"Calculating natal chart for user {user_id} using direct calculation endpoints")
             
-            # Use direct calculation endpoints instead of creating a stored chart
-            positions_result = self.nocturna_client.calculate_planetary_positions(
+            # Use direct calculation endpoints instead of creating a stored chart;
+            # the three requests are independent, so run them concurrently off the event loop
+            chart_kwargs = dict(
                 date=birth_date,
                 time=birth_time_full,
                 latitude=latitude,
                 longitude=longitude,
                 timezone=timezone_str,
             )
-            
-            houses_result = self.nocturna_client.calculate_houses_direct(
-                date=birth_date,
-                time=birth_time_full,
-                latitude=latitude,
-                longitude=longitude,
-                timezone=timezone_str,
-            )
-            
-            aspects_result = self.nocturna_client.calculate_aspects_direct(
-                date=birth_date,
-                time=birth_time_full,
-                latitude=latitude,
-                longitude=longitude,
-                timezone=timezone_str,
+            positions_result, houses_result, aspects_result = await asyncio.gather(
+                asyncio.to_thread(self.nocturna_client.calculate_planetary_positions, **chart_kwargs),
+                asyncio.to_thread(self.nocturna_client.calculate_houses_direct, **chart_kwargs),
+                asyncio.to_thread(self.nocturna_client.calculate_aspects_direct, **chart_kwargs),
             )
             
             # Build complete chart data from direct calculations
@@ -376,6 +369,7 @@ class BirthDataConversation:
                 "houses": houses_result.get("houses", []),
                 "aspects": aspects_result.get("aspects", []),
                 "calculated_at": None,  # Will be set by database
+                "cache_version": NATAL_CHART_CACHE_VERSION,
             }
             
             logger.info(f"Successfully calculated natal chart for user {user_id}")
@@ -384,12 +378,12 @@ class BirthDataConversation:
                         f"{len(complete_chart_data.get('aspects', []))} aspects")
 
             # Now save to database with cached chart data
-            async for session in get_session():
+            async with get_session() as session:
                 db_service = DatabaseService(session)
                 await db_service.save_birth_data(
                     telegram_id=user_id,
-                    birth_date=birth_date,
-                    birth_time=birth_time_full,
+                    birth_date=date.fromisoformat(birth_date),
+                    birth_time=time.fromisoformat(birth_time_full),
                     timezone=timezone_str,
                     location_name=location_name,
                     latitude=latitude,
@@ -397,7 +391,6 @@ class BirthDataConversation:
                     chart_id=None,  # No chart_id needed with direct calculations
                     natal_chart_cache=complete_chart_data,  # Cache the complete chart data
                 )
-                break
 
             await processing_msg.edit_text(
                 "✅ <b>Данные успешно сохранены!</b>\n\n"
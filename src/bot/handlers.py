@@ -1,12 +1,20 @@
 """Telegram bot command handlers."""
 
+import asyncio
+import functools
+import html
+import json
 import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from io import BytesIO
-from telegram import Update
+from telegram import Message, Update
 from telegram.ext import ContextTypes
 from telegram.constants import ParseMode
 from aiohttp import web
-from typing import Optional
+from typing import Iterator, Optional, Tuple
 
 from src.services.transit_service import TransitService
 from src.services.chart_service import ChartService
@@ -14,6 +22,7 @@ from src.services.natal_service import NatalChartService
 from src.services.personal_transit_service import PersonalTransitService
 from src.api.chart_service_client import ChartServiceError
 from src.formatters.russian_formatter import RussianFormatter
+from src.database.models import NATAL_CHART_CACHE_VERSION
 from src.database.service import DatabaseService
 from src.database.database import get_session
 
@@ -21,9 +30,121 @@ from src.database.database import get_session
 logger = logging.getLogger(__name__)
 
 
+_WELCOME_TEMPLATE = (
+    "Привет, {mention}!\n\n"
+    "🌟 Я <b>Nocturna Bot</b> — твой астрологический помощник.\n\n"
+    "<b>Мои возможности:</b>\n"
+    "• Натальные карты и персональные транзиты\n"
+    "• Текущие позиции планет\n"
+    "• Анализ аспектов между планетами\n"
+    "• Транзиты в реальном времени\n"
+    "• Визуализация карт\n\n"
+    "<b>Доступные команды:</b>\n"
+    "/transit - Текущая карта транзитов\n"
+    "/natal - Настроить натальную карту\n"
+    "/my_natal - Посмотреть свою натальную карту\n"
+    "/my_transit - Персональные транзиты\n"
+    "/profile - Просмотр сохраненных данных\n"
+    "/help - Справка по командам\n\n"
+    "Для персональных прогнозов сначала настройте натальную карту: /natal"
+)
+
+_HELP_MESSAGE = (
+    "📚 <b>Справка по командам</b>\n\n"
+    "<b>Персональные команды:</b>\n"
+    "/natal - Настроить натальную карту\n"
+    "/my_natal - Посмотреть натальную карту\n"
+    "/my_transit - Персональные транзиты\n"
+    "/profile - Просмотр сохраненных данных\n"
+    "/clear_profile - Удалить свои данные\n\n"
+    "<b>Общие транзиты:</b>\n"
+    "/transit - Текущая карта транзитов\n"
+    "/transit_planets - Позиции планет\n"
+    "/transit_aspects - Текущие аспекты\n\n"
+    "<b>О боте:</b>\n"
+    "Бот использует сервер расчетов Nocturna для получения точных "
+    "астрологических данных. Все расчеты выполняются в реальном времени.\n\n"
+    "<b>Приватность:</b>\n"
+    "Мы храним только необходимые данные для астрологических расчетов: "
+    "дату, время и место рождения. Вы можете удалить свои данные в любой момент."
+)
+
+# Static health check payload, serialized once
+_HEALTH_BODY = json.dumps({
+    "status": "healthy",
+    "service": "nocturna-telegram-bot"
+}).encode()
+
+# Minimum seconds between edits of a reply that shows streamed text
+_STREAM_EDIT_INTERVAL = 1.0
+
+# HTML tags in streamed text, including one still cut off at the end
+_HTML_TAG = re.compile(r"<[^>]*(?:>|$)")
+
+
+class _SendRateLimiter:
+    """Token bucket spacing outgoing Telegram requests to a steady rate."""
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Args:
+            rate: Requests allowed per second on average
+            burst: Requests that may go out back to back after an idle period
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        # Waiters take tokens one at a time, in arrival order
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+class _TextStream:
+    """Text produced in a worker thread and read piece by piece on the event loop."""
+
+    def __init__(self):
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.text = ""
+        self.done = False
+
+    async def next_chunk(self) -> Optional[str]:
+        """Wait for the next piece of text; None once the stream has ended."""
+        if self.done:
+            return None
+        chunk = await self.queue.get()
+        if chunk is None:
+            self.done = True
+            return None
+        self.text += chunk
+        return chunk
+
+    async def read_all(self) -> str:
+        """Wait for the stream to end and return the whole text."""
+        while await self.next_chunk() is not None:
+            pass
+        return self.text
+
+
 class BotHandlers:
     """Handles Telegram bot commands and interactions."""
 
+    # Threads for LLM calls, which can block for tens of seconds each
+    LLM_WORKERS = 8
+
     def __init__(
         self,
         transit_service: TransitService,
@@ -45,6 +166,23 @@ class BotHandlers:
         self.natal_service = natal_service
         self.personal_transit_service = personal_transit_service
         self.formatter = RussianFormatter()
+        # Paces bulk sends and streamed edits across all handlers
+        # (Telegram allows ~30 msg/s per bot, leave room for plain replies)
+        self._send_limiter = _SendRateLimiter(rate=25, burst=25)
+        # LLM calls get their own threads so they don't starve the default
+        # executor used for chart rendering, Nocturna and geocoding calls
+        self._llm_executor = ThreadPoolExecutor(
+            max_workers=self.LLM_WORKERS, thread_name_prefix="llm"
+        )
+        # Strong references to fire-and-forget tasks until they finish
+        self._background_tasks = set()
+        # Current transit report cached per minute (minute bucket, report)
+        self._transit_cache: Optional[Tuple[datetime, str]] = None
+        self._transit_lock = asyncio.Lock()
+
+    def shutdown(self) -> None:
+        """Stop the LLM worker threads, dropping calls that have not started."""
+        self._llm_executor.shutdown(wait=False, cancel_futures=True)
 
     def _split_message(self, text: str, max_length: int = 4000) -> list:
         """
@@ -60,42 +198,248 @@ class BotHandlers:
         if len(text) <= max_length:
             return [text]
 
-        # Try to split by double newline (sections)
-        sections = text.split("\n\n")
+        # No section breaks: go straight to line splitting
+        if "\n\n" not in text:
+            *chunks, tail = self._split_by_lines(text, max_length)
+            if tail:
+                chunks.append(tail)
+            return chunks
+
+        # Accumulate pieces in a list and join once per chunk instead of
+        # growing a string with += (quadratic for long reports)
         chunks = []
-        current_chunk = ""
-
-        for section in sections:
-            if len(current_chunk) + len(section) + 2 <= max_length:
-                if current_chunk:
-                    current_chunk += "\n\n" + section
-                else:
-                    current_chunk = section
+        buf = []
+        buf_len = 0
+
+        def push(piece: str, separator: str) -> None:
+            nonlocal buf_len
+            if buf_len:
+                buf.append(separator)
+                buf_len += len(separator)
+            buf.append(piece)
+            buf_len += len(piece)
+
+        def flush() -> None:
+            nonlocal buf_len
+            if buf_len:
+                chunks.append("".join(buf))
+            buf.clear()
+            buf_len = 0
+
+        # Try to split by double newline (sections)
+        for section in text.split("\n\n"):
+            if buf_len + len(section) + 2 <= max_length:
+                push(section, "\n\n")
+                continue
+
+            flush()
+
+            # If single section is too long, split by lines
+            if len(section) > max_length:
+                *line_chunks, tail = self._split_by_lines(section, max_length)
+                chunks.extend(line_chunks)
+                push(tail, "\n")
             else:
-                if current_chunk:
-                    chunks.append(current_chunk)
-                current_chunk = section
-
-                # If single section is too long, split by lines
-                if len(section) > max_length:
-                    lines = section.split("\n")
-                    current_chunk = ""
-                    for line in lines:
-                        if len(current_chunk) + len(line) + 1 <= max_length:
-                            if current_chunk:
-                                current_chunk += "\n" + line
-                            else:
-                                current_chunk = line
-                        else:
-                            if current_chunk:
-                                chunks.append(current_chunk)
-                            current_chunk = line
+                push(section, "\n\n")
 
-        if current_chunk:
-            chunks.append(current_chunk)
+        flush()
 
         return chunks
 
+    @staticmethod
+    def _split_by_lines(text: str, max_length: int) -> list:
+        """
+        Split text by lines into chunks of at most max_length.
+
+        Args:
+            text: Text to split
+            max_length: Maximum length per chunk
+
+        Returns:
+            List of full chunks followed by the unfinished tail (may be empty)
+        """
+        chunks = []
+        lines = []
+        buf_len = 0
+
+        for line in text.split("\n"):
+            if buf_len and buf_len + len(line) + 1 > max_length:
+                chunks.append("\n".join(lines))
+                lines = []
+                buf_len = 0
+
+            if buf_len:
+                lines.append(line)
+                buf_len += len(line) + 1
+            else:
+                lines = [line]
+                buf_len = len(line)
+
+        chunks.append("\n".join(lines))
+        return chunks
+
+    async def _get_current_transit_report(self) -> str:
+        """
+        Get current transit report, reusing the one computed in the same minute.
+
+        Concurrent callers wait on a lock so only one of them calculates
+        the report for a given minute.
+
+        Returns:
+            Formatted transit report
+        """
+        bucket = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+        cached = self._transit_cache
+        if cached and cached[0] == bucket:
+            return cached[1]
+
+        async with self._transit_lock:
+            cached = self._transit_cache
+            if cached and cached[0] == bucket:
+                return cached[1]
+
+            # Service call does blocking HTTP requests, run it off the event loop
+            report = await asyncio.to_thread(self.transit_service.get_current_transit)
+            # Don't cache error reports so the next request retries
+            if not report.startswith("❌"):
+                self._transit_cache = (bucket, report)
+            return report
+
+    def _delete_in_background(self, message: Message) -> None:
+        """
+        Delete message without waiting for the request to complete.
+
+        Args:
+            message: Message to delete (e.g. "processing" placeholder)
+        """
+        task = asyncio.create_task(message.delete())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._on_background_task_done)
+
+    def _start_in_thread(self, func, /, *args, **kwargs) -> asyncio.Future:
+        """
+        Start a blocking LLM call in a worker thread without awaiting it yet.
+
+        Lets slow calls (e.g. LLM interpretation) overlap with chart
+        rendering; await the returned future where the result is needed.
+        """
+        loop = asyncio.get_running_loop()
+        task = loop.run_in_executor(self._llm_executor, functools.partial(func, *args, **kwargs))
+        # Mark errors as retrieved if the handler bails out before awaiting
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return task
+
+    def _start_stream(self, chunks: Iterator[str]) -> _TextStream:
+        """
+        Drain a blocking text iterator in an LLM worker thread.
+
+        Args:
+            chunks: Iterator yielding pieces of text (e.g. a streamed LLM reply)
+
+        Returns:
+            Stream to read the pieces from on the event loop
+        """
+        loop = asyncio.get_running_loop()
+        stream = _TextStream()
+
+        def pump() -> None:
+            try:
+                for chunk in chunks:
+                    loop.call_soon_threadsafe(stream.queue.put_nowait, chunk)
+            finally:
+                loop.call_soon_threadsafe(stream.queue.put_nowait, None)
+
+        task = loop.run_in_executor(self._llm_executor, pump)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._on_background_task_done)
+        return stream
+
+    async def _reply_streaming(
+        self, message: Message, header: str, stream: _TextStream
+    ) -> Optional[Message]:
+        """
+        Show streamed text in a plain-text reply, editing it as more arrives.
+
+        HTML markup is stripped from the preview until _finish_streamed_reply
+        swaps in the formatted text. Once the preview outgrows a message it
+        ends with "…" and is no longer edited.
+
+        Args:
+            message: Message to reply to
+            header: Plain-text prefix shown above the streamed text
+            stream: Stream to read from until it ends
+
+        Returns:
+            The preview message, or None if nothing was sent
+        """
+        preview_msg = None
+        last_edit = 0.0
+        truncated = False
+        loop = asyncio.get_running_loop()
+        while await stream.next_chunk() is not None:
+            now = loop.time()
+            if truncated or now - last_edit < _STREAM_EDIT_INTERVAL:
+                continue
+            preview = header + html.unescape(_HTML_TAG.sub("", stream.text))
+            # Telegram limit is 4096 characters per message
+            if len(preview) > 4096:
+                preview = preview[:4095] + "…"
+                truncated = True
+            try:
+                async with self._send_limiter:
+                    if preview_msg is None:
+                        preview_msg = await message.reply_text(preview)
+                    else:
+                        await preview_msg.edit_text(preview)
+            except Exception as e:
+                logger.debug("Could not update streamed reply: %s", e)
+            last_edit = now
+        return preview_msg
+
+    async def _finish_streamed_reply(
+        self, message: Message, preview_msg: Optional[Message], text: str
+    ) -> None:
+        """
+        Replace a streamed preview with the final HTML text.
+
+        Args:
+            message: Message the preview replied to
+            preview_msg: Preview returned by _reply_streaming, if any
+            text: Final HTML text
+        """
+        if preview_msg is not None and len(text) <= 4096:
+            try:
+                async with self._send_limiter:
+                    await preview_msg.edit_text(text, parse_mode=ParseMode.HTML)
+                return
+            except Exception as e:
+                logger.debug("Could not finalize streamed reply: %s", e)
+        if preview_msg is not None:
+            self._delete_in_background(preview_msg)
+        await self._reply_html(message, text)
+
+    def _on_background_task_done(self, task: asyncio.Future) -> None:
+        """Release finished background task and log its error, if any."""
+        self._background_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.warning("Background task failed: %s", task.exception())
+
+    async def _reply_html(self, message: Message, text: str) -> None:
+        """
+        Reply with HTML text, splitting it into several messages if needed.
+
+        Chunks are sent in order, since they are parts of one report.
+
+        Args:
+            message: Message to reply to
+            text: HTML text to send
+        """
+        # Telegram limit is 4096 characters per message
+        chunks = [text] if len(text) <= 4096 else self._split_message(text, max_length=4000)
+        for chunk in chunks:
+            async with self._send_limiter:
+                await message.reply_text(chunk, parse_mode=ParseMode.HTML)
+
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """
         Handle /start command.
@@ -105,28 +449,12 @@ class BotHandlers:
             context: Telegram context object
         """
         user = update.effective_user
-        logger.info(f"User {user.id} started the bot")
-
-        welcome_message = (
-            f"Привет, {user.mention_html()}!\n\n"
-            "🌟 Я <b>Nocturna Bot</b> — твой астрологический помощник.\n\n"
-            "<b>Мои возможности:</b>\n"
-            "• Натальные карты и персональные транзиты\n"
-            "• Текущие позиции планет\n"
-            "• Анализ аспектов между планетами\n"
-            "• Транзиты в реальном времени\n"
-            "• Визуализация карт\n\n"
-            "<b>Доступные команды:</b>\n"
-            "/transit - Текущая карта транзитов\n"
-            "/natal - Настроить натальную карту\n"
-            "/my_natal - Посмотреть свою натальную карту\n"
-            "/my_transit - Персональные транзиты\n"
-            "/profile - Просмотр сохраненных данных\n"
-            "/help - Справка по командам\n\n"
-            "Для персональных прогнозов сначала настройте натальную карту: /natal"
-        )
+        msg = update.message
+        logger.info("User %s started the bot", user.id)
+
+        welcome_message = _WELCOME_TEMPLATE.format(mention=user.mention_html())
 
-        await update.message.reply_text(
+        await msg.reply_text(
             welcome_message, parse_mode=ParseMode.HTML # Change to HTML
         )
 
@@ -134,30 +462,11 @@ class BotHandlers:
         """
         Handle /help command.
         """
-        logger.info(f"User {update.effective_user.id} requested help")
-
-        help_message = (
-            "📚 <b>Справка по командам</b>\n\n"
-            "<b>Персональные команды:</b>\n"
-            "/natal - Настроить натальную карту\n"
-            "/my_natal - Посмотреть натальную карту\n"
-            "/my_transit - Персональные транзиты\n"
-            "/profile - Просмотр сохраненных данных\n"
-            "/clear_profile - Удалить свои данные\n\n"
-            "<b>Общие транзиты:</b>\n"
-            "/transit - Текущая карта транзитов\n"
-            "/transit_planets - Позиции планет\n"
-            "/transit_aspects - Текущие аспекты\n\n"
-            "<b>О боте:</b>\n"
-            "Бот использует сервер расчетов Nocturna для получения точных "
-            "астрологических данных. Все расчеты выполняются в реальном времени.\n\n"
-            "<b>Приватность:</b>\n"
-            "Мы храним только необходимые данные для астрологических расчетов: "
-            "дату, время и место рождения. Вы можете удалить свои данные в любой момент."
-        )
+        msg = update.message
+        logger.info("User %s requested help", update.effective_user.id)
 
-        await update.message.reply_text(
-            help_message, parse_mode=ParseMode.HTML # Change to HTML
+        await msg.reply_text(
+            _HELP_MESSAGE, parse_mode=ParseMode.HTML # Change to HTML
         )
 
     async def transit_command(
@@ -167,27 +476,36 @@ class BotHandlers:
         Handle /transit command - generate chart image or fallback to text report.
         """
         user_id = update.effective_user.id
-        logger.info(f"User {user_id} requested transit chart")
+        msg = update.message
+        logger.info("User %s requested transit chart", user_id)
 
         # Send "calculating" message
-        processing_msg = await update.message.reply_text(
+        processing_msg = await msg.reply_text(
             "⏳ Генерирую изображение текущей карты транзитов..."
         )
 
         try:
+            # Start the interpretation now so it overlaps with chart rendering
+            interpretation_stream = self._start_stream(self.transit_service.stream_interpretation())
+
             # Try to generate chart image if service is available
             if self.chart_service:
                 try:
-                    image_bytes = self.chart_service.generate_current_transit_chart()
+                    image_bytes = await asyncio.to_thread(
+                        self.chart_service.generate_current_transit_chart
+                    )
 
                     # Send image
-                    sent_photo = await update.message.reply_photo(
+                    sent_photo = await msg.reply_photo(
                         photo=BytesIO(image_bytes),
                         caption="🌟 Текущая карта транзитов"
                     )
 
-                    # Try to get and send interpretation
-                    interpretation_raw = self.transit_service.get_interpretation()
+                    # Show the interpretation while it is being generated
+                    preview_msg = await self._reply_streaming(
+                        msg, "📖 Интерпретация дня:\n\n", interpretation_stream
+                    )
+                    interpretation_raw = interpretation_stream.text
                     if interpretation_raw:
                         interpretation_text = f"📖 <b>Интерпретация дня:</b>\n\n{interpretation_raw}"
                         
@@ -199,49 +517,42 @@ class BotHandlers:
                                 caption=combined_caption,
                                 parse_mode=ParseMode.HTML
                             )
+                            if preview_msg is not None:
+                                self._delete_in_background(preview_msg)
                         else:
-                            # Split if too long, and send as separate message
-                            if len(interpretation_text) <= 4096:
-                                await update.message.reply_text(
-                                    interpretation_text, parse_mode=ParseMode.HTML
-                                )
-                            else:
-                                messages = self._split_message(interpretation_text, max_length=4000)
-                                for msg in messages:
-                                    await update.message.reply_text(msg, parse_mode=ParseMode.HTML)
-
-                    await processing_msg.delete() # Delete processing message only if everything is successful
+                            # Turn the preview into the final message (split if too long)
+                            await self._finish_streamed_reply(msg, preview_msg, interpretation_text)
+                    elif preview_msg is not None:
+                        self._delete_in_background(preview_msg)
+
+                    self._delete_in_background(processing_msg)
                     return
                 except ChartServiceError as e:
-                    logger.warning(f"Chart service error, falling back to text: {str(e)}")
+                    logger.warning("Chart service error, falling back to text: %s", e)
                     # Fall through to text report
                 except Exception as e:
-                    logger.warning(f"Error generating chart image, falling back to text: {str(e)}")
+                    logger.warning("Error generating chart image, falling back to text: %s", e)
                     # Fall through to text report
 
             # Fallback to text report if image generation failed or unavailable
             await processing_msg.edit_text("⏳ Рассчитываю текущий транзит планет...")
 
             # Get transit report
-            report = self.transit_service.get_current_transit()
+            report = await self._get_current_transit_report()
             # Try to get and send interpretation for fallback
-            interpretation_raw = self.transit_service.get_interpretation()
+            interpretation_raw = await interpretation_stream.read_all()
             if interpretation_raw:
                 report += f"\n\n<b>Интерпретация дня:</b>\n\n{interpretation_raw}" # Use HTML bold tag
             
             # Split long messages (Telegram limit is 4096 characters)
-            if len(report) <= 4096:
-                await update.message.reply_text(report, parse_mode=ParseMode.HTML)
-            else:
-                # Split into multiple messages
-                messages = self._split_message(report, max_length=4000)
-                for msg in messages:
-                    await update.message.reply_text(msg, parse_mode=ParseMode.HTML)
-                
-                await processing_msg.delete() # Delete processing message only if everything is successful
+            await self._reply_html(msg, report)
+
+            # Remove the placeholder only once the report is delivered, so the
+            # error path below can still edit it
+            self._delete_in_background(processing_msg)
 
         except Exception as e:
-            logger.error(f"Error processing transit command: {str(e)}", exc_info=True)
+            logger.error("Error processing transit command: %s", e, exc_info=True)
             await processing_msg.edit_text(
                 f"❌ Произошла ошибка при расчете транзита.\n\n"
                 f"Детали: {str(e)}\n\n"
@@ -255,27 +566,28 @@ class BotHandlers:
         Handle /transit_planets command - show planetary positions.
         """
         user_id = update.effective_user.id
-        logger.info(f"User {user_id} requested transit planets")
+        msg = update.message
+        logger.info("User %s requested transit planets", user_id)
 
         # Send "calculating" message
-        processing_msg = await update.message.reply_text(
+        processing_msg = await msg.reply_text(
             "⏳ Рассчитываю текущие позиции планет..."
         )
 
         try:
             # Get positions
-            positions = self.transit_service.get_current_positions()
+            positions = await asyncio.to_thread(self.transit_service.get_current_positions)
 
             # Format positions
             positions_text = self.formatter.format_positions_list(positions)
 
             # Send message
-            await update.message.reply_text(positions_text, parse_mode=ParseMode.HTML)
+            await msg.reply_text(positions_text, parse_mode=ParseMode.HTML)
             
             await processing_msg.delete() # Delete processing message only if everything is successful
 
         except Exception as e:
-            logger.error(f"Error processing transit_planets command: {str(e)}", exc_info=True)
+            logger.error("Error processing transit_planets command: %s", e, exc_info=True)
             await processing_msg.edit_text(
                 f"❌ Произошла ошибка при расчете позиций планет.\n\n"
                 f"Детали: {str(e)}\n\n"
@@ -289,27 +601,28 @@ class BotHandlers:
         Handle /transit_aspects command - show planetary aspects.
         """
         user_id = update.effective_user.id
-        logger.info(f"User {user_id} requested transit aspects")
+        msg = update.message
+        logger.info("User %s requested transit aspects", user_id)
 
         # Send "calculating" message
-        processing_msg = await update.message.reply_text(
+        processing_msg = await msg.reply_text(
             "⏳ Рассчитываю текущие аспекты..."
         )
 
         try:
             # Get aspects
-            aspects = self.transit_service.get_current_aspects()
+            aspects = await asyncio.to_thread(self.transit_service.get_current_aspects)
 
             # Format aspects
             aspects_text = self.formatter.format_aspects_list(aspects)
 
             # Send message
-            await update.message.reply_text(aspects_text, parse_mode=ParseMode.HTML)
+            await msg.reply_text(aspects_text, parse_mode=ParseMode.HTML)
             
             await processing_msg.delete() # Delete processing message only if everything is successful
 
         except Exception as e:
-            logger.error(f"Error processing transit_aspects command: {str(e)}", exc_info=True)
+            logger.error("Error processing transit_aspects command: %s", e, exc_info=True)
             await processing_msg.edit_text(
                 f"❌ Произошла ошибка при расчете аспектов.\n\n"
                 f"Детали: {str(e)}\n\n"
@@ -323,9 +636,10 @@ class BotHandlers:
         Handle /my_natal command - show user's natal chart with image and interpretation.
         """
         user_id = update.effective_user.id
-        logger.info(f"User {user_id} requested their natal chart")
+        msg = update.message
+        logger.info("User %s requested their natal chart", user_id)
 
-        processing_msg = await update.message.reply_text(
+        processing_msg = await msg.reply_text(
             "⏳ Генерирую изображение вашей натальной карты..."
         )
 
@@ -338,11 +652,9 @@ class BotHandlers:
                 return
 
             # Get user's birth data from database
-            birth_data = None
-            async for session in get_session():
+            async with get_session() as session:
                 db_service = DatabaseService(session)
-                birth_data = await db_service.get_birth_data(user_id)
-                break
+                birth_data = await db_service.get_birth_data(user_id, with_chart_cache=True)
 
             if not birth_data:
                 await processing_msg.edit_text(
@@ -359,15 +671,26 @@ class BotHandlers:
                 )
                 return
             
-            logger.info(f"Using cached chart data for user {user_id}")
+            logger.info("Using cached chart data for user %s", user_id)
             chart_data = birth_data.natal_chart_cache
             positions = chart_data.get("positions", [])
             houses = chart_data.get("houses", [])
 
+            # Start the interpretation now so it overlaps with chart rendering
+            interpretation_task = None
+            if self.natal_service.interpretation_service:
+                logger.info("Generating LLM interpretation for natal chart...")
+                interpretation_task = self._start_in_thread(
+                    self.natal_service.interpretation_service.interpret_natal_chart,
+                    positions=positions,
+                    houses=houses,
+                )
+
             # Try to generate chart image if service is available
             if self.chart_service:
                 try:
-                    image_bytes = self.chart_service.generate_natal_chart(
+                    image_bytes = await asyncio.to_thread(
+                        self.chart_service.generate_natal_chart,
                         positions=positions,
                         houses=houses,
                     )
@@ -379,44 +702,33 @@ class BotHandlers:
                     )
 
                     # Send image
-                    sent_photo = await update.message.reply_photo(
+                    sent_photo = await msg.reply_photo(
                         photo=BytesIO(image_bytes),
                         caption=caption
                     )
 
                     # Try to get and send interpretation
-                    if self.natal_service.interpretation_service:
+                    if interpretation_task:
                         try:
-                            logger.info("Generating LLM interpretation for natal chart...")
-                            interpretation = self.natal_service.interpretation_service.interpret_natal_chart(
-                                positions=positions,
-                                houses=houses,
-                            )
+                            interpretation = await interpretation_task
                             
                             if interpretation:
                                 interpretation_text = f"📖 <b>Интерпретация натальной карты:</b>\n\n{interpretation}"
                                 
                                 # Send interpretation as separate message
-                                if len(interpretation_text) <= 4096:
-                                    await update.message.reply_text(
-                                        interpretation_text, parse_mode=ParseMode.HTML
-                                    )
-                                else:
-                                    messages = self._split_message(interpretation_text, max_length=4000)
-                                    for msg in messages:
-                                        await update.message.reply_text(msg, parse_mode=ParseMode.HTML)
+                                await self._reply_html(msg, interpretation_text)
                         except Exception as e:
-                            logger.warning(f"Error generating interpretation: {str(e)}")
+                            logger.warning("Error generating interpretation: %s", e)
                             # Continue without interpretation
 
                     await processing_msg.delete()
                     return
 
                 except ChartServiceError as e:
-                    logger.warning(f"Chart service error, falling back to text: {str(e)}")
+                    logger.warning("Chart service error, falling back to text: %s", e)
                     # Fall through to text report
                 except Exception as e:
-                    logger.warning(f"Error generating chart image, falling back to text: {str(e)}")
+                    logger.warning("Error generating chart image, falling back to text: %s", e)
                     # Fall through to text report
 
             # Fallback to text report if image generation failed or unavailable
@@ -426,35 +738,26 @@ class BotHandlers:
             report = self.natal_service.format_natal_chart_report(
                 positions=positions,
                 houses=houses,
-                birth_date=birth_data.birth_date,
-                birth_time=birth_data.birth_time,
+                birth_date=birth_data.birth_date.isoformat(),
+                birth_time=birth_data.birth_time.isoformat(),
             )
 
             # Try to add interpretation to text report
-            if self.natal_service.interpretation_service:
+            if interpretation_task:
                 try:
-                    logger.info("Generating LLM interpretation for natal chart...")
-                    interpretation = self.natal_service.interpretation_service.interpret_natal_chart(
-                        positions=positions,
-                        houses=houses,
-                    )
+                    interpretation = await interpretation_task
                     if interpretation:
                         report += f"\n\n<b>Интерпретация натальной карты:</b>\n\n{interpretation}"
                 except Exception as e:
-                    logger.warning(f"Error generating interpretation: {str(e)}")
+                    logger.warning("Error generating interpretation: %s", e)
 
             # Send report
-            if len(report) <= 4096:
-                await update.message.reply_text(report, parse_mode=ParseMode.HTML)
-            else:
-                messages = self._split_message(report, max_length=4000)
-                for msg in messages:
-                    await update.message.reply_text(msg, parse_mode=ParseMode.HTML)
+            await self._reply_html(msg, report)
 
             await processing_msg.delete()
 
         except Exception as e:
-            logger.error(f"Error processing my_natal command: {str(e)}", exc_info=True)
+            logger.error("Error processing my_natal command: %s", e, exc_info=True)
             await processing_msg.edit_text(
                 f"❌ Произошла ошибка при получении натальной карты.\n\n"
                 f"Детали: {str(e)}\n\n"
@@ -468,9 +771,10 @@ class BotHandlers:
         Handle /my_transit command - show user's personal transits with chart and interpretation.
         """
         user_id = update.effective_user.id
-        logger.info(f"User {user_id} requested their personal transits")
+        msg = update.message
+        logger.info("User %s requested their personal transits", user_id)
 
-        processing_msg = await update.message.reply_text(
+        processing_msg = await msg.reply_text(
             "⏳ Рассчитываю персональные транзиты..."
         )
 
@@ -483,11 +787,9 @@ class BotHandlers:
                 return
 
             # Get user's birth data from database
-            birth_data = None
-            async for session in get_session():
+            async with get_session() as session:
                 db_service = DatabaseService(session)
-                birth_data = await db_service.get_birth_data(user_id)
-                break
+                birth_data = await db_service.get_birth_data(user_id, with_chart_cache=True)
 
             if not birth_data:
                 await processing_msg.edit_text(
@@ -496,39 +798,57 @@ class BotHandlers:
                 )
                 return
 
+            # Reuse natal positions and houses cached at /natal setup
+            natal_cache = birth_data.natal_chart_cache or {}
+            if natal_cache.get("cache_version", 1) != NATAL_CHART_CACHE_VERSION:
+                natal_cache = {}
+
             # Calculate personal transits
             transit_data = await self.personal_transit_service.calculate_personal_transits(
                 natal_chart_id=birth_data.chart_id or "cached",
                 latitude=birth_data.latitude,
                 longitude=birth_data.longitude,
                 timezone=birth_data.timezone,
-                natal_birth_date=birth_data.birth_date,
-                natal_birth_time=birth_data.birth_time,
+                natal_birth_date=birth_data.birth_date.isoformat(),
+                natal_birth_time=birth_data.birth_time.isoformat(),
                 natal_latitude=birth_data.latitude,
                 natal_longitude=birth_data.longitude,
                 natal_timezone=birth_data.timezone,
+                natal_positions=natal_cache.get("positions") or None,
+                natal_houses=natal_cache.get("houses") or None,
             )
 
-            transit_positions = transit_data.get("transit_positions", [])
-            transit_houses = transit_data.get("transit_houses", [])
-            natal_positions = transit_data.get("natal_positions", [])
-            natal_houses = transit_data.get("natal_houses", [])
-            transit_aspects = transit_data.get("transit_aspects", [])
-            transit_date = transit_data.get("transit_date", "N/A")
-            transit_time = transit_data.get("transit_time", "N/A")
+            transit_positions = transit_data.transit_positions
+            transit_houses = transit_data.transit_houses
+            natal_positions = transit_data.natal_positions
+            natal_houses = transit_data.natal_houses
+            transit_aspects = transit_data.transit_aspects
+            transit_date = transit_data.transit_date
+            transit_time = transit_data.transit_time
 
             # Debug logging
-            logger.info(f"Chart service available: {self.chart_service is not None}")
-            logger.info(f"Natal positions count: {len(natal_positions) if natal_positions else 0}")
-            logger.info(f"Natal houses count: {len(natal_houses) if natal_houses else 0}")
-            logger.info(f"Transit positions count: {len(transit_positions) if transit_positions else 0}")
+            logger.info("Chart service available: %s", self.chart_service is not None)
+            logger.info("Natal positions count: %s", len(natal_positions) if natal_positions else 0)
+            logger.info("Natal houses count: %s", len(natal_houses) if natal_houses else 0)
+            logger.info("Transit positions count: %s", len(transit_positions) if transit_positions else 0)
+
+            # Start the interpretation now so it overlaps with chart rendering
+            interpretation_task = None
+            if self.personal_transit_service.interpretation_service and natal_positions and transit_aspects:
+                logger.info("Generating LLM interpretation for personal transits...")
+                interpretation_task = self._start_in_thread(
+                    self.personal_transit_service.interpretation_service.interpret_personal_transits,
+                    natal_positions=natal_positions,
+                    transit_aspects=transit_aspects,
+                )
 
             # Try to generate biwheel chart if service is available
             if self.chart_service and natal_positions and natal_houses and transit_positions:
                 try:
                     await processing_msg.edit_text("⏳ Генерирую биколесную карту транзитов...")
                     
-                    image_bytes = self.chart_service.generate_personal_transit_chart(
+                    image_bytes = await asyncio.to_thread(
+                        self.chart_service.generate_personal_transit_chart,
                         natal_positions=natal_positions,
                         natal_houses=natal_houses,
                         transit_positions=transit_positions,
@@ -543,44 +863,33 @@ class BotHandlers:
                     )
 
                     # Send image
-                    sent_photo = await update.message.reply_photo(
+                    sent_photo = await msg.reply_photo(
                         photo=BytesIO(image_bytes),
                         caption=caption
                     )
 
                     # Try to get and send interpretation
-                    if self.personal_transit_service.interpretation_service and natal_positions and transit_aspects:
+                    if interpretation_task:
                         try:
-                            logger.info("Generating LLM interpretation for personal transits...")
-                            interpretation = self.personal_transit_service.interpretation_service.interpret_personal_transits(
-                                natal_positions=natal_positions,
-                                transit_aspects=transit_aspects,
-                            )
+                            interpretation = await interpretation_task
                             
                             if interpretation:
                                 interpretation_text = f"📖 <b>Интерпретация персональных транзитов:</b>\n\n{interpretation}"
                                 
                                 # Send interpretation as separate message
-                                if len(interpretation_text) <= 4096:
-                                    await update.message.reply_text(
-                                        interpretation_text, parse_mode=ParseMode.HTML
-                                    )
-                                else:
-                                    messages = self._split_message(interpretation_text, max_length=4000)
-                                    for msg in messages:
-                                        await update.message.reply_text(msg, parse_mode=ParseMode.HTML)
+                                await self._reply_html(msg, interpretation_text)
                         except Exception as e:
-                            logger.warning(f"Error generating interpretation: {str(e)}")
+                            logger.warning("Error generating interpretation: %s", e)
                             # Continue without interpretation
 
                     await processing_msg.delete()
                     return
 
                 except ChartServiceError as e:
-                    logger.warning(f"Chart service error, falling back to text: {str(e)}")
+                    logger.warning("Chart service error, falling back to text: %s", e)
                     # Fall through to text report
                 except Exception as e:
-                    logger.warning(f"Error generating chart image, falling back to text: {str(e)}")
+                    logger.warning("Error generating chart image, falling back to text: %s", e)
                     # Fall through to text report
 
             # Fallback to text report if image generation failed or unavailable
@@ -590,30 +899,21 @@ class BotHandlers:
             report = self.personal_transit_service.format_personal_transit_report(transit_data)
 
             # Try to add interpretation to text report
-            if self.personal_transit_service.interpretation_service and natal_positions and transit_aspects:
+            if interpretation_task:
                 try:
-                    logger.info("Generating LLM interpretation for personal transits...")
-                    interpretation = self.personal_transit_service.interpretation_service.interpret_personal_transits(
-                        natal_positions=natal_positions,
-                        transit_aspects=transit_aspects,
-                    )
+                    interpretation = await interpretation_task
                     if interpretation:
                         report += f"\n\n<b>📖 Интерпретация персональных транзитов:</b>\n\n{interpretation}"
                 except Exception as e:
-                    logger.warning(f"Error generating interpretation: {str(e)}")
+                    logger.warning("Error generating interpretation: %s", e)
 
             # Send report
-            if len(report) <= 4096:
-                await update.message.reply_text(report, parse_mode=ParseMode.HTML)
-            else:
-                messages = self._split_message(report, max_length=4000)
-                for msg in messages:
-                    await update.message.reply_text(msg, parse_mode=ParseMode.HTML)
+            await self._reply_html(msg, report)
 
             await processing_msg.delete()
 
         except Exception as e:
-            logger.error(f"Error processing my_transit command: {str(e)}", exc_info=True)
+            logger.error("Error processing my_transit command: %s", e, exc_info=True)
             await processing_msg.edit_text(
                 f"❌ Произошла ошибка при расчете персональных транзитов.\n\n"
                 f"Детали: {str(e)}\n\n"
@@ -627,15 +927,16 @@ class BotHandlers:
         Handle /profile command - show user's saved data.
         """
         user_id = update.effective_user.id
-        logger.info(f"User {user_id} requested their profile")
+        msg = update.message
+        logger.info("User %s requested their profile", user_id)
 
         try:
-            async for session in get_session():
+            async with get_session() as session:
                 db_service = DatabaseService(session)
                 birth_data = await db_service.get_birth_data(user_id)
 
             if not birth_data:
-                await update.message.reply_text(
+                await msg.reply_text(
                     "❌ У вас еще нет сохраненных данных.\n\n"
                     "Используйте /natal для настройки натальной карты."
                 )
@@ -653,11 +954,11 @@ class BotHandlers:
                 "💡 Используйте /clear_profile для удаления данных"
             )
 
-            await update.message.reply_text(message, parse_mode=ParseMode.HTML)
+            await msg.reply_text(message, parse_mode=ParseMode.HTML)
 
         except Exception as e:
-            logger.error(f"Error processing profile command: {str(e)}", exc_info=True)
-            await update.message.reply_text(
+            logger.error("Error processing profile command: %s", e, exc_info=True)
+            await msg.reply_text(
                 "❌ Ошибка при получении профиля.\n\n"
                 "Пожалуйста, попробуйте позже."
             )
@@ -669,46 +970,39 @@ class BotHandlers:
         Handle /clear_profile command - delete user's data.
         """
         user_id = update.effective_user.id
-        logger.info(f"User {user_id} requested to clear their profile")
+        msg = update.message
+        logger.info("User %s requested to clear their profile", user_id)
 
         try:
-            async for session in get_session():
+            async with get_session() as session:
                 db_service = DatabaseService(session)
-                birth_data = await db_service.get_birth_data(user_id)
-
-                if not birth_data:
-                    await update.message.reply_text(
-                        "ℹ️ У вас нет сохраненных данных для удаления."
-                    )
-                    return
-
-                # Delete chart from API if exists
-                if birth_data.chart_id:
-                    try:
-                        # We should use nocturna_client here, but we don't have access to it
-                        # from handlers. This is a design issue we can fix later.
-                        logger.info(f"Chart {birth_data.chart_id} should be deleted from API")
-                    except Exception as e:
-                        logger.warning(f"Failed to delete chart from API: {str(e)}")
-
                 # Delete birth data from database
-                deleted = await db_service.delete_birth_data(user_id)
+                deleted, chart_id = await db_service.delete_birth_data(user_id)
 
-            if deleted:
-                await update.message.reply_text(
-                    "✅ <b>Ваши данные удалены</b>\n\n"
-                    "Вы можете настроить новую натальную карту с помощью /natal",
-                    parse_mode=ParseMode.HTML
-                )
-            else:
-                await update.message.reply_text(
-                    "❌ Не удалось удалить данные.\n\n"
-                    "Пожалуйста, попробуйте позже."
+            if not deleted:
+                await msg.reply_text(
+                    "ℹ️ У вас нет сохраненных данных для удаления."
                 )
+                return
+
+            # Delete chart from API if exists
+            if chart_id:
+                try:
+                    # We should use nocturna_client here, but we don't have access to it
+                    # from handlers. This is a design issue we can fix later.
+                    logger.info("Chart %s should be deleted from API", chart_id)
+                except Exception as e:
+                    logger.warning("Failed to delete chart from API: %s", e)
+
+            await msg.reply_text(
+                "✅ <b>Ваши данные удалены</b>\n\n"
+                "Вы можете настроить новую натальную карту с помощью /natal",
+                parse_mode=ParseMode.HTML
+            )
 
         except Exception as e:
-            logger.error(f"Error processing clear_profile command: {str(e)}", exc_info=True)
-            await update.message.reply_text(
+            logger.error("Error processing clear_profile command: %s", e, exc_info=True)
+            await msg.reply_text(
                 "❌ Ошибка при удалении данных.\n\n"
                 "Пожалуйста, попробуйте позже."
             )
@@ -723,10 +1017,11 @@ class BotHandlers:
             update: Telegram update object
             context: Telegram context object
         """
-        logger.error(f"Exception while handling an update: {context.error}")
+        logger.error("Exception while handling an update: %s", context.error)
 
-        if isinstance(update, Update) and update.effective_message:
-            await update.effective_message.reply_text(
+        msg = update.effective_message if isinstance(update, Update) else None
+        if msg:
+            await msg.reply_text(
                 "❌ Произошла ошибка при обработке команды.\n"
                 "Пожалуйста, попробуйте позже."
             )
@@ -742,8 +1037,7 @@ class BotHandlers:
         Returns:
             JSON response with health status
         """
-        return web.json_response({
-            "status": "healthy",
-            "service": "nocturna-telegram-bot"
-        })
+        return web.Response(
+            body=_HEALTH_BODY, content_type="application/json", charset="utf-8"
+        )
 
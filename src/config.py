@@ -1,6 +1,7 @@
 """Configuration management for Nocturna Telegram Bot."""
 
 import os
+from functools import lru_cache
 from typing import Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field, ConfigDict
@@ -26,6 +27,9 @@ class Settings(BaseSettings):
     openrouter_model: str = Field(
         default="anthropic/claude-haiku-4.5", alias="OPENROUTER_MODEL"
     )
+    # Per-task overrides; fall back to OPENROUTER_MODEL when unset
+    openrouter_transit_model: Optional[str] = Field(None, alias="OPENROUTER_TRANSIT_MODEL")
+    openrouter_natal_model: Optional[str] = Field(None, alias="OPENROUTER_NATAL_MODEL")
 
     # Chart Service Configuration
     chart_service_url: str = Field(
@@ -44,6 +48,13 @@ class Settings(BaseSettings):
         alias="DATABASE_URL"
     )
     database_echo: bool = Field(default=False, alias="DATABASE_ECHO")
+    # asyncpg prepared statement cache; set to 0 behind PgBouncer in transaction mode
+    database_statement_cache_size: int = Field(
+        default=1024, alias="DATABASE_STATEMENT_CACHE_SIZE"
+    )
+    # Connection pool sized for peak concurrent handlers
+    database_pool_size: int = Field(default=20, alias="DATABASE_POOL_SIZE")
+    database_max_overflow: int = Field(default=10, alias="DATABASE_MAX_OVERFLOW")
 
     # Bot Mode Configuration
     bot_mode: str = Field(default="polling", alias="BOT_MODE")  # polling or webhook
@@ -52,12 +63,16 @@ class Settings(BaseSettings):
     webhook_port: int = Field(default=8080, alias="WEBHOOK_PORT")
     webhook_host: str = Field(default="0.0.0.0", alias="WEBHOOK_HOST")
     webhook_secret: Optional[str] = Field(None, alias="WEBHOOK_SECRET")
+    # Updates processed concurrently / queued before shedding load (webhook mode)
+    webhook_workers: int = Field(default=16, alias="WEBHOOK_WORKERS")
+    webhook_queue_size: int = Field(default=500, alias="WEBHOOK_QUEUE_SIZE")
 
     model_config = ConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",  # Ignore extra fields from environment
+        frozen=True,  # Settings are shared process-wide; no runtime mutation
     )
 
     def validate(self) -> None:
@@ -76,6 +91,12 @@ class Settings(BaseSettings):
             raise ValueError("DATABASE_URL is required")
         if not self.database_url.startswith(("postgresql://", "postgresql+asyncpg://")):
             raise ValueError("DATABASE_URL must be a PostgreSQL connection string")
+        if self.database_statement_cache_size < 0:
+            raise ValueError("DATABASE_STATEMENT_CACHE_SIZE must be non-negative")
+        if self.database_pool_size <= 0:
+            raise ValueError("DATABASE_POOL_SIZE must be positive")
+        if self.database_max_overflow < 0:
+            raise ValueError("DATABASE_MAX_OVERFLOW must be non-negative")
 
         # Validate bot mode
         if self.bot_mode not in ["polling", "webhook"]:
@@ -89,10 +110,20 @@ class Settings(BaseSettings):
                 raise ValueError("WEBHOOK_URL must use HTTPS")
             if self.webhook_port <= 0 or self.webhook_port > 65535:
                 raise ValueError("WEBHOOK_PORT must be between 1 and 65535")
+            if self.webhook_workers <= 0:
+                raise ValueError("WEBHOOK_WORKERS must be positive")
+            if self.webhook_queue_size <= 0:
+                raise ValueError("WEBHOOK_QUEUE_SIZE must be positive")
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings instance."""
+    """
+    Get application settings instance.
+
+    Settings are loaded and validated once per process; use
+    get_settings.cache_clear() to force a reload (e.g. in tests).
+    """
     settings = Settings()
     settings.validate()
     return settings
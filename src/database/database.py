@@ -1,8 +1,12 @@
 """Database configuration and session management."""
 
 import logging
-from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
 from sqlalchemy.pool import NullPool
 
 from src.database.models import Base
@@ -10,34 +14,108 @@ from src.database.models import Base
 logger = logging.getLogger(__name__)
 
 
-# Global engine and session maker
-_engine = None
-_async_session_maker = None
+@dataclass
+class _DBState:
+    """Engine and session maker created by init_db()."""
 
+    engine: AsyncEngine
+    session_maker: async_sessionmaker
 
-def get_engine(database_url: str, echo: bool = False):
+
+# Global database state, set by init_db() and cleared by close_db()
+_state: Optional[_DBState] = None
+
+# Session.info key set once a session has sent a write to the database
+_WROTE = "wrote"
+
+
+class _WriteTrackingSession(Session):
+    """Session that records whether it has written anything."""
+
+
+@event.listens_for(_WriteTrackingSession, "after_flush")
+def _mark_flush(session, flush_context) -> None:
+    """Record ORM changes sent by a flush (including autoflush)."""
+    session.info[_WROTE] = True
+
+
+@event.listens_for(_WriteTrackingSession, "do_orm_execute")
+def _mark_dml(orm_execute_state) -> None:
+    """Record INSERT/UPDATE/DELETE statements run via session.execute()."""
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info[_WROTE] = True
+
+
+@event.listens_for(_WriteTrackingSession, "after_commit")
+@event.listens_for(_WriteTrackingSession, "after_rollback")
+def _clear_wrote(session) -> None:
+    """Forget writes once the transaction has ended."""
+    session.info.pop(_WROTE, None)
+
+
+def get_engine(
+    database_url: str,
+    echo: bool = False,
+    pool_size: int = 20,
+    max_overflow: int = 10,
+    pool_recycle: int = 1800,
+    use_null_pool: bool = False,
+    statement_cache_size: int = 1024,
+):
     """
     Create and return SQLAlchemy async engine.
     
+    Returns the initialized engine if init_db() has already run.
+    
+    Connections are kept in a pool and reused across handler invocations,
+    so commands don't pay a new connection handshake each time. With
+    asyncpg, repeated queries also reuse their prepared statements.
+    
     Args:
         database_url: Database connection URL
         echo: Enable SQL query logging
+        pool_size: Number of persistent connections kept in the pool
+        max_overflow: Extra connections allowed above pool_size under load
+        pool_recycle: Recycle connections older than this many seconds
+        use_null_pool: Disable pooling (open a new connection per session, for tests)
+        statement_cache_size: asyncpg prepared statement cache size per
+            connection (0 disables it, required behind PgBouncer in transaction mode)
         
     Returns:
         AsyncEngine instance
     """
-    global _engine
-    
-    if _engine is None:
-        _engine = create_async_engine(
-            database_url,
-            echo=echo,
-            poolclass=NullPool,  # Use NullPool for simplicity, adjust based on load
-            future=True,
-        )
-        logger.info("Database engine created")
+    if _state is not None:
+        return _state.engine
+
+    connect_args = {}
+    if database_url.startswith("postgresql+asyncpg://"):
+        connect_args = {
+            "statement_cache_size": statement_cache_size,
+            "prepared_statement_cache_size": statement_cache_size,
+        }
+    else:
+        logger.warning("DATABASE_URL does not use the asyncpg driver")
+
+    if use_null_pool:
+        pool_kwargs = {"poolclass": NullPool}
+    else:
+        pool_kwargs = {
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_pre_ping": True,
+            "pool_recycle": pool_recycle,
+        }
+
+    engine = create_async_engine(
+        database_url,
+        echo=echo,
+        future=True,
+        connect_args=connect_args,
+        **pool_kwargs,
+    )
+    logger.info("Database engine created")
     
-    return _engine
+    return engine
 
 
 def get_session_maker(engine):
@@ -50,57 +128,81 @@ def get_session_maker(engine):
     Returns:
         async_sessionmaker instance
     """
-    global _async_session_maker
-    
-    if _async_session_maker is None:
-        _async_session_maker = async_sessionmaker(
-            engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-        )
-        logger.info("Session maker created")
+    session_maker = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        sync_session_class=_WriteTrackingSession,
+        expire_on_commit=False,
+    )
+    logger.info("Session maker created")
     
-    return _async_session_maker
+    return session_maker
 
 
-async def get_session() -> AsyncGenerator[AsyncSession, None]:
+@asynccontextmanager
+async def get_session() -> AsyncIterator[AsyncSession]:
     """
-    Get async database session (dependency injection pattern).
+    Get async database session.
+    
+    On a clean exit the session commits if it wrote anything not yet
+    committed: pending ORM changes, flushed (or autoflushed) ones, and
+    INSERT/UPDATE/DELETE statements run via session.execute(). Sessions
+    that only read skip the commit and are rolled back on close.
+    
+    Usage:
+        async with get_session() as session:
+            ...
     
     Yields:
         AsyncSession instance
     """
-    global _async_session_maker
-    
-    if _async_session_maker is None:
+    state = _state
+    if state is None:
         raise RuntimeError("Database not initialized. Call init_db() first.")
     
-    async with _async_session_maker() as session:
+    async with state.session_maker() as session:
         try:
             yield session
-            await session.commit()
+            if session.new or session.dirty or session.deleted or session.info.get(_WROTE):
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await session.close()
 
 
-async def init_db(database_url: str, echo: bool = False) -> None:
+async def init_db(
+    database_url: str,
+    echo: bool = False,
+    statement_cache_size: int = 1024,
+    pool_size: int = 20,
+    max_overflow: int = 10,
+) -> None:
     """
     Initialize database: create engine, session maker, and tables.
     
     Args:
         database_url: Database connection URL
         echo: Enable SQL query logging
+        statement_cache_size: asyncpg prepared statement cache size per connection
+        pool_size: Number of persistent connections kept in the pool
+        max_overflow: Extra connections allowed above pool_size under load
     """
+    global _state
+
     logger.info("Initializing database...")
     
-    engine = get_engine(database_url, echo)
-    get_session_maker(engine)
+    if _state is None:
+        engine = get_engine(
+            database_url,
+            echo,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            statement_cache_size=statement_cache_size,
+        )
+        _state = _DBState(engine=engine, session_maker=get_session_maker(engine))
     
     # Create all tables
-    async with engine.begin() as conn:
+    async with _state.engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     
     logger.info("Database initialized successfully")
@@ -108,11 +210,11 @@ async def init_db(database_url: str, echo: bool = False) -> None:
 
 async def close_db() -> None:
     """Close database connection and cleanup resources."""
-    global _engine, _async_session_maker
+    global _state
     
-    if _engine:
-        await _engine.dispose()
-        _engine = None
-        _async_session_maker = None
+    if _state is not None:
+        engine = _state.engine
+        _state = None
+        await engine.dispose()
         logger.info("Database connection closed")
 
@@ -1,12 +1,21 @@
 """SQLAlchemy models for Nocturna Telegram Bot."""
 
-from datetime import datetime
-from typing import Optional
-from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Float, ForeignKey
+from datetime import date, datetime, time
+from typing import Any, Dict, Optional
+from sqlalchemy import BigInteger, String, Date, Time, DateTime, Float, ForeignKey, func
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
-Base = declarative_base()
+
+class Base(DeclarativeBase):
+    """Declarative base for all models."""
+
+
+# Layout version of BirthData.natal_chart_cache; bump when its structure changes
+NATAL_CHART_CACHE_VERSION = 1
+
+# Naive UTC timestamp computed by the database
+utc_now = func.timezone("UTC", func.now())
 
 
 class User(Base):
@@ -18,39 +27,43 @@ class User(Base):
     """
     
     __tablename__ = "users"
+    # Fetch server-generated timestamps via RETURNING instead of a lazy refresh
+    __mapper_args__ = {"eager_defaults": True}
 
-    telegram_id = Column(
+    telegram_id: Mapped[int] = mapped_column(
         BigInteger,
         primary_key=True,
         unique=True,
         index=True,
         comment="Telegram user ID (unique identifier)"
     )
-    username = Column(
+    username: Mapped[Optional[str]] = mapped_column(
         String(255),
         nullable=True,
         comment="Telegram username (optional, for convenience)"
     )
-    created_at = Column(
+    created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=utc_now,
         nullable=False,
         comment="Account creation timestamp"
     )
-    updated_at = Column(
+    updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=utc_now,
+        onupdate=utc_now,
         nullable=False,
         comment="Last update timestamp"
     )
 
-    # Relationship
-    birth_data = relationship(
+    # Relationship (load explicitly, e.g. joinedload; rows are removed by ON DELETE CASCADE)
+    birth_data: Mapped[Optional["BirthData"]] = relationship(
         "BirthData",
         back_populates="user",
         uselist=False,
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
 
     def __repr__(self) -> str:
@@ -62,27 +75,24 @@ class BirthData(Base):
     Birth data model for storing user's natal chart information.
     
     Stores birth date, time, location for natal chart calculations.
-    Includes JSONB fields for flexible data storage and caching.
+    Includes JSONB fields for flexible data storage and caching; these are
+    deferred and only loaded when a query asks for them (undefer).
     """
     
     __tablename__ = "birth_data"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(
-        Integer,
-        primary_key=True,
-        autoincrement=True
-    )
-    user_id = Column(
+    # One birth data row per user, so the user reference is the primary key
+    user_id: Mapped[int] = mapped_column(
         BigInteger,
         ForeignKey("users.telegram_id", ondelete="CASCADE"),
-        unique=True,
-        index=True,
-        nullable=False,
+        primary_key=True,
+        autoincrement=False,
         comment="Foreign key to users table"
     )
     
     # Nocturna API chart ID
-    chart_id = Column(
+    chart_id: Mapped[Optional[str]] = mapped_column(
         String(255),
         nullable=True,
         unique=True,
@@ -91,68 +101,70 @@ class BirthData(Base):
     )
 
     # Birth date and time
-    birth_date = Column(
-        String(10),
+    birth_date: Mapped[date] = mapped_column(
+        Date,
         nullable=False,
-        comment="Birth date in YYYY-MM-DD format"
+        comment="Birth date"
     )
-    birth_time = Column(
-        String(8),
+    birth_time: Mapped[time] = mapped_column(
+        Time,
         nullable=False,
-        comment="Birth time in HH:MM:SS format"
+        comment="Birth time (local to timezone)"
     )
-    timezone = Column(
+    timezone: Mapped[str] = mapped_column(
         String(50),
         nullable=False,
         comment="Timezone name (e.g., 'Europe/Moscow')"
     )
 
     # Location
-    location_name = Column(
+    location_name: Mapped[Optional[str]] = mapped_column(
         String(255),
         nullable=True,
         comment="Human-readable location name (e.g., 'Москва, Россия')"
     )
-    latitude = Column(
+    latitude: Mapped[float] = mapped_column(
         Float,
         nullable=False,
         comment="Geographic latitude"
     )
-    longitude = Column(
+    longitude: Mapped[float] = mapped_column(
         Float,
         nullable=False,
         comment="Geographic longitude"
     )
 
     # Additional data stored as JSONB for flexibility
-    natal_chart_cache = Column(
+    natal_chart_cache: Mapped[Optional[Dict[str, Any]]] = mapped_column(
         JSONB,
         nullable=True,
+        deferred=True,
         comment="Cached natal chart calculation data"
     )
-    preferences = Column(
+    preferences: Mapped[Optional[Dict[str, Any]]] = mapped_column(
         JSONB,
         nullable=True,
+        deferred=True,
         comment="User preferences (aspect orbs, display settings, etc.)"
     )
 
     # Timestamps
-    created_at = Column(
+    created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=utc_now,
         nullable=False,
         comment="Birth data creation timestamp"
     )
-    updated_at = Column(
+    updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=utc_now,
+        onupdate=utc_now,
         nullable=False,
         comment="Last update timestamp"
     )
 
     # Relationship
-    user = relationship("User", back_populates="birth_data")
+    user: Mapped["User"] = relationship("User", back_populates="birth_data")
 
     def __repr__(self) -> str:
         return (
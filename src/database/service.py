@@ -1,12 +1,14 @@
 """Database service for CRUD operations."""
 
 import logging
-from typing import Optional, Dict, Any
-from datetime import datetime
-from sqlalchemy import select
+from typing import Optional, Dict, Any, Tuple
+from datetime import date, time
+from sqlalchemy import select, exists, delete, insert, update, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
-from src.database.models import User, BirthData
+from src.database.models import User, BirthData, NATAL_CHART_CACHE_VERSION, utc_now
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +18,9 @@ class DatabaseService:
     Service for database operations.
     
     Handles all CRUD operations for users and birth data.
+    
+    Lookups by telegram_id are memoized for the lifetime of the service
+    (one session, i.e. one request) and invalidated by writes.
     """
 
     def __init__(self, session: AsyncSession):
@@ -26,6 +31,14 @@ class DatabaseService:
             session: SQLAlchemy async session
         """
         self.session = session
+        self._user_cache: Dict[int, Optional[User]] = {}
+        self._birth_data_cache: Dict[Tuple[int, bool], Optional[BirthData]] = {}
+
+    def _invalidate(self, telegram_id: int) -> None:
+        """Drop memoized lookups for a user after a write."""
+        self._user_cache.pop(telegram_id, None)
+        self._birth_data_cache.pop((telegram_id, False), None)
+        self._birth_data_cache.pop((telegram_id, True), None)
 
     async def get_or_create_user(
         self, telegram_id: int, username: Optional[str] = None
@@ -41,26 +54,25 @@ class DatabaseService:
             User instance
         """
         # Try to get existing user
-        result = await self.session.execute(
-            select(User).where(User.telegram_id == telegram_id)
-        )
-        user = result.scalar_one_or_none()
+        user = await self.get_user(telegram_id)
 
         if user:
             # Update username if changed
             if username and user.username != username:
                 user.username = username
-                user.updated_at = datetime.utcnow()
                 await self.session.commit()
-                logger.info(f"Updated username for user {telegram_id}")
+                logger.info("Updated username for user %s", telegram_id)
             return user
 
-        # Create new user
-        user = User(telegram_id=telegram_id, username=username)
-        self.session.add(user)
+        # Create new user; RETURNING hands back the row without a refresh query
+        user = await self.session.scalar(
+            insert(User)
+            .values(telegram_id=telegram_id, username=username)
+            .returning(User)
+        )
         await self.session.commit()
-        await self.session.refresh(user)
-        logger.info(f"Created new user: {telegram_id}")
+        self._user_cache[telegram_id] = user
+        logger.info("Created new user: %s", telegram_id)
         return user
 
     async def get_user(self, telegram_id: int) -> Optional[User]:
@@ -73,25 +85,54 @@ class DatabaseService:
         Returns:
             User instance or None
         """
+        if telegram_id in self._user_cache:
+            return self._user_cache[telegram_id]
+
         result = await self.session.execute(
             select(User).where(User.telegram_id == telegram_id)
         )
-        return result.scalar_one_or_none()
+        user = result.scalar_one_or_none()
+        self._user_cache[telegram_id] = user
+        return user
 
-    async def get_birth_data(self, telegram_id: int) -> Optional[BirthData]:
+    async def get_birth_data(
+        self, telegram_id: int, with_chart_cache: bool = False
+    ) -> Optional[BirthData]:
         """
         Get birth data for user.
         
         Args:
             telegram_id: Telegram user ID
+            with_chart_cache: Also load the deferred natal_chart_cache column
             
         Returns:
             BirthData instance or None
         """
-        result = await self.session.execute(
-            select(BirthData).where(BirthData.user_id == telegram_id)
+        key = (telegram_id, with_chart_cache)
+        if key in self._birth_data_cache:
+            return self._birth_data_cache[key]
+
+        stmt = select(BirthData).where(BirthData.user_id == telegram_id)
+        if with_chart_cache:
+            stmt = stmt.options(undefer(BirthData.natal_chart_cache))
+        result = await self.session.execute(stmt)
+        birth_data = result.scalar_one_or_none()
+        self._birth_data_cache[key] = birth_data
+        return birth_data
+
+    async def get_chart_id(self, telegram_id: int) -> Optional[str]:
+        """
+        Get Nocturna chart ID for user without loading the full birth data row.
+        
+        Args:
+            telegram_id: Telegram user ID
+            
+        Returns:
+            Chart ID or None
+        """
+        return await self.session.scalar(
+            select(BirthData.chart_id).where(BirthData.user_id == telegram_id)
         )
-        return result.scalar_one_or_none()
 
     async def has_birth_data(self, telegram_id: int) -> bool:
         """
@@ -103,14 +144,22 @@ class DatabaseService:
         Returns:
             True if birth data exists, False otherwise
         """
-        birth_data = await self.get_birth_data(telegram_id)
-        return birth_data is not None
+        for with_chart_cache in (False, True):
+            key = (telegram_id, with_chart_cache)
+            if key in self._birth_data_cache:
+                return self._birth_data_cache[key] is not None
+
+        return bool(
+            await self.session.scalar(
+                select(exists().where(BirthData.user_id == telegram_id))
+            )
+        )
 
     async def save_birth_data(
         self,
         telegram_id: int,
-        birth_date: str,
-        birth_time: str,
+        birth_date: date,
+        birth_time: time,
         timezone: str,
         latitude: float,
         longitude: float,
@@ -121,10 +170,13 @@ class DatabaseService:
         """
         Save or update birth data for user.
         
+        Upserts the user and birth data with INSERT ... ON CONFLICT, so
+        concurrent saves can't race between a lookup and the write.
+        
         Args:
             telegram_id: Telegram user ID
-            birth_date: Birth date in YYYY-MM-DD format
-            birth_time: Birth time in HH:MM:SS format
+            birth_date: Birth date
+            birth_time: Birth time (local to timezone)
             timezone: Timezone name
             latitude: Geographic latitude
             longitude: Geographic longitude
@@ -135,44 +187,37 @@ class DatabaseService:
         Returns:
             BirthData instance
         """
-        # Ensure user exists
-        await self.get_or_create_user(telegram_id)
-
-        # Check if birth data already exists
-        existing = await self.get_birth_data(telegram_id)
+        self._invalidate(telegram_id)
 
-        if existing:
-            # Update existing birth data
-            existing.birth_date = birth_date
-            existing.birth_time = birth_time
-            existing.timezone = timezone
-            existing.latitude = latitude
-            existing.longitude = longitude
-            existing.location_name = location_name
-            existing.chart_id = chart_id
-            existing.natal_chart_cache = natal_chart_cache
-            existing.updated_at = datetime.utcnow()
-            await self.session.commit()
-            await self.session.refresh(existing)
-            logger.info(f"Updated birth data for user {telegram_id}")
-            return existing
+        # Ensure user exists
+        await self.session.execute(
+            pg_insert(User)
+            .values(telegram_id=telegram_id)
+            .on_conflict_do_nothing(index_elements=[User.telegram_id])
+        )
 
-        # Create new birth data
-        birth_data = BirthData(
-            user_id=telegram_id,
-            birth_date=birth_date,
-            birth_time=birth_time,
-            timezone=timezone,
-            latitude=latitude,
-            longitude=longitude,
-            location_name=location_name,
-            chart_id=chart_id,
-            natal_chart_cache=natal_chart_cache,
+        # Insert or update birth data in one statement
+        values = {
+            "birth_date": birth_date,
+            "birth_time": birth_time,
+            "timezone": timezone,
+            "latitude": latitude,
+            "longitude": longitude,
+            "location_name": location_name,
+            "chart_id": chart_id,
+            "natal_chart_cache": natal_chart_cache,
+        }
+        stmt = pg_insert(BirthData).values(user_id=telegram_id, **values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[BirthData.user_id],
+            # ON CONFLICT DO UPDATE does not apply onupdate defaults
+            set_={**values, "updated_at": utc_now},
+        )
+        birth_data = await self.session.scalar(
+            stmt.returning(BirthData).execution_options(populate_existing=True)
         )
-        self.session.add(birth_data)
         await self.session.commit()
-        await self.session.refresh(birth_data)
-        logger.info(f"Created birth data for user {telegram_id}")
+        logger.info("Saved birth data for user %s", telegram_id)
         return birth_data
 
     async def update_natal_chart_cache(
@@ -181,16 +226,23 @@ class DatabaseService:
         """
         Update cached natal chart data.
         
+        Issues a single UPDATE without loading the birth data row.
+        
         Args:
             telegram_id: Telegram user ID
             natal_chart_data: Natal chart calculation data
         """
-        birth_data = await self.get_birth_data(telegram_id)
-        if birth_data:
-            birth_data.natal_chart_cache = natal_chart_data
-            birth_data.updated_at = datetime.utcnow()
-            await self.session.commit()
-            logger.info(f"Updated natal chart cache for user {telegram_id}")
+        self._invalidate(telegram_id)
+        natal_chart_data = {**natal_chart_data, "cache_version": NATAL_CHART_CACHE_VERSION}
+        result = await self.session.execute(
+            update(BirthData)
+            .where(BirthData.user_id == telegram_id)
+            .values(natal_chart_cache=natal_chart_data)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+        if result.rowcount > 0:
+            logger.info("Updated natal chart cache for user %s", telegram_id)
 
     async def update_preferences(
         self, telegram_id: int, preferences: Dict[str, Any]
@@ -198,34 +250,49 @@ class DatabaseService:
         """
         Update user preferences.
         
+        Issues a single UPDATE without loading the birth data row.
+        
         Args:
             telegram_id: Telegram user ID
             preferences: User preferences dictionary
         """
-        birth_data = await self.get_birth_data(telegram_id)
-        if birth_data:
-            birth_data.preferences = preferences
-            birth_data.updated_at = datetime.utcnow()
-            await self.session.commit()
-            logger.info(f"Updated preferences for user {telegram_id}")
+        self._invalidate(telegram_id)
+        result = await self.session.execute(
+            update(BirthData)
+            .where(BirthData.user_id == telegram_id)
+            .values(preferences=preferences)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+        if result.rowcount > 0:
+            logger.info("Updated preferences for user %s", telegram_id)
 
-    async def delete_birth_data(self, telegram_id: int) -> bool:
+    async def delete_birth_data(self, telegram_id: int) -> Tuple[bool, Optional[str]]:
         """
         Delete birth data for user.
         
+        A single DELETE ... RETURNING hands back the chart ID of the deleted
+        row, so no write can slip in between a lookup and the delete.
+        
         Args:
             telegram_id: Telegram user ID
             
         Returns:
-            True if deleted, False if not found
+            Whether birth data was deleted, and the Nocturna chart ID it had
         """
-        birth_data = await self.get_birth_data(telegram_id)
-        if birth_data:
-            await self.session.delete(birth_data)
-            await self.session.commit()
-            logger.info(f"Deleted birth data for user {telegram_id}")
-            return True
-        return False
+        self._invalidate(telegram_id)
+        result = await self.session.execute(
+            delete(BirthData)
+            .where(BirthData.user_id == telegram_id)
+            .returning(BirthData.chart_id)
+            .execution_options(synchronize_session=False)
+        )
+        row = result.first()
+        await self.session.commit()
+        if row is None:
+            return False, None
+        logger.info("Deleted birth data for user %s", telegram_id)
+        return True, row.chart_id
 
     async def delete_user(self, telegram_id: int) -> bool:
         """
@@ -241,7 +308,8 @@ class DatabaseService:
         if user:
             await self.session.delete(user)
             await self.session.commit()
-            logger.info(f"Deleted user {telegram_id} and associated data")
+            self._invalidate(telegram_id)
+            logger.info("Deleted user %s and associated data", telegram_id)
             return True
         return False
 
@@ -252,9 +320,7 @@ class DatabaseService:
         Returns:
             Number of users in database
         """
-        result = await self.session.execute(select(User))
-        users = result.scalars().all()
-        return len(users)
+        return await self.session.scalar(select(func.count(User.telegram_id)))
 
     async def get_users_with_birth_data_count(self) -> int:
         """
@@ -263,7 +329,5 @@ class DatabaseService:
         Returns:
             Number of users with birth data
         """
-        result = await self.session.execute(select(BirthData))
-        birth_data_list = result.scalars().all()
-        return len(birth_data_list)
+        return await self.session.scalar(select(func.count(BirthData.user_id)))
 
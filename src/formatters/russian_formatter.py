@@ -1,6 +1,8 @@
 """Russian language formatter for astrological data."""
 
-from typing import Dict, List, Any
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, List, Any, Optional
 
 
 class RussianFormatter:
@@ -58,25 +60,31 @@ class RussianFormatter:
         "QUINTILE": "Q",
     }
 
+    # Aspect name and symbol in one lookup
+    _ASPECT_INFO = dict(zip(ASPECTS, zip(ASPECTS.values(), map(ASPECT_SYMBOLS.get, ASPECTS))))
+
+    # Lookups try the key as-is first: API values are already upper case,
+    # so .upper() only runs for unexpected spellings
+
     @classmethod
     def format_planet_name(cls, planet: str) -> str:
         """Format planet name in Russian."""
-        return cls.PLANETS.get(planet.upper(), planet)
+        return cls.PLANETS.get(planet) or cls.PLANETS.get(planet.upper(), planet)
 
     @classmethod
     def format_sign_name(cls, sign: str) -> str:
         """Format zodiac sign name in Russian."""
-        return cls.SIGNS.get(sign.upper(), sign)
+        return cls.SIGNS.get(sign) or cls.SIGNS.get(sign.upper(), sign)
 
     @classmethod
     def format_aspect_name(cls, aspect: str) -> str:
         """Format aspect name in Russian."""
-        return cls.ASPECTS.get(aspect.upper(), aspect)
+        return cls.ASPECTS.get(aspect) or cls.ASPECTS.get(aspect.upper(), aspect)
 
     @classmethod
     def format_aspect_symbol(cls, aspect: str) -> str:
         """Get aspect symbol."""
-        return cls.ASPECT_SYMBOLS.get(aspect.upper(), "")
+        return cls.ASPECT_SYMBOLS.get(aspect) or cls.ASPECT_SYMBOLS.get(aspect.upper(), "")
 
     @classmethod
     def format_position(cls, position: Dict[str, Any]) -> str:
@@ -89,12 +97,22 @@ class RussianFormatter:
         Returns:
             Formatted position string
         """
-        planet = cls.format_planet_name(position.get("planet", ""))
-        sign = cls.format_sign_name(position.get("sign", ""))
-        degree = int(position.get("degree", 0))
-        minute = int(position.get("minute", 0))
-        is_retrograde = position.get("is_retrograde", False)
+        return cls._format_position(
+            position.get("planet", ""),
+            position.get("sign", ""),
+            int(position.get("degree", 0)),
+            int(position.get("minute", 0)),
+            bool(position.get("is_retrograde", False)),
+        )
 
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _format_position(
+        cls, planet: str, sign: str, degree: int, minute: int, is_retrograde: bool
+    ) -> str:
+        """Format planetary position from hashable fields (memoized)."""
+        planet = cls.format_planet_name(planet)
+        sign = cls.format_sign_name(sign)
         retrograde_mark = " ℞" if is_retrograde else ""
 
         return f"{planet} в {sign} {degree}°{minute:02d}'{retrograde_mark}"
@@ -113,11 +131,7 @@ class RussianFormatter:
         if not positions:
             return "Нет данных о позициях планет."
 
-        lines = ["🌟 *Позиции планет:*\n"]
-        for pos in positions:
-            lines.append(cls.format_position(pos))
-
-        return "\n".join(lines)
+        return "🌟 *Позиции планет:*\n\n" + "\n".join(map(cls.format_position, positions))
 
     @classmethod
     def format_aspect(cls, aspect: Dict[str, Any]) -> str:
@@ -130,17 +144,30 @@ class RussianFormatter:
         Returns:
             Formatted aspect string
         """
-        planet1 = cls.format_planet_name(aspect.get("planet1", ""))
-        planet2 = cls.format_planet_name(aspect.get("planet2", ""))
-        aspect_type = aspect.get("aspect_type", "")
-        aspect_name = cls.format_aspect_name(aspect_type)
-        aspect_symbol = cls.format_aspect_symbol(aspect_type)
-        orb = aspect.get("orb", 0)
         applying = aspect.get("applying")
 
+        return cls._format_aspect(
+            aspect.get("planet1", ""),
+            aspect.get("planet2", ""),
+            aspect.get("aspect_type", ""),
+            f"{aspect.get('orb', 0):.1f}",
+            bool(applying) if applying or applying is False else None,
+        )
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _format_aspect(
+        cls, planet1: str, planet2: str, aspect_type: str, orb: str, applying: Optional[bool]
+    ) -> str:
+        """Format aspect from hashable fields, orb pre-rounded to text (memoized)."""
+        planet1 = cls.format_planet_name(planet1)
+        planet2 = cls.format_planet_name(planet2)
+        aspect_info = cls._ASPECT_INFO.get(aspect_type) or cls._ASPECT_INFO.get(aspect_type.upper())
+        aspect_name, aspect_symbol = aspect_info or (aspect_type, "")
+
         applying_text = " (сходящийся)" if applying else " (расходящийся)" if applying is False else ""
 
-        return f"{planet1} {aspect_symbol} {planet2} ({aspect_name}, орб {orb:.1f}°){applying_text}"
+        return f"{planet1} {aspect_symbol} {planet2} ({aspect_name}, орб {orb}°){applying_text}"
 
     @classmethod
     def format_aspects_list(cls, aspects: List[Dict[str, Any]]) -> str:
@@ -156,11 +183,7 @@ class RussianFormatter:
         if not aspects:
             return "\n🔮 *Аспекты:*\nНет значимых аспектов."
 
-        lines = ["\n🔮 *Аспекты:*\n"]
-        for asp in aspects:
-            lines.append(cls.format_aspect(asp))
-
-        return "\n".join(lines)
+        return "\n🔮 *Аспекты:*\n\n" + "\n".join(map(cls.format_aspect, aspects))
 
     @classmethod
     def format_transit_report(
@@ -176,8 +199,17 @@ class RussianFormatter:
         Returns:
             Complete formatted report
         """
-        positions_text = cls.format_positions_list(positions)
-        aspects_text = cls.format_aspects_list(aspects)
-
-        return f"{positions_text}\n{aspects_text}"
+        # Same text as format_positions_list + "\n" + format_aspects_list,
+        # built with a single join
+        if positions:
+            positions_lines = chain(("🌟 *Позиции планет:*\n",), map(cls.format_position, positions))
+        else:
+            positions_lines = ("Нет данных о позициях планет.",)
+
+        if aspects:
+            aspects_lines = chain(("\n🔮 *Аспекты:*\n",), map(cls.format_aspect, aspects))
+        else:
+            aspects_lines = ("\n🔮 *Аспекты:*\nНет значимых аспектов.",)
+
+        return "\n".join(chain(positions_lines, aspects_lines))
 
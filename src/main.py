@@ -3,8 +3,11 @@
 import asyncio
 import logging
 import sys
-import jwt
-from datetime import datetime
+import time
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Sequence
 from telegram import Update
 from telegram.ext import Application, CommandHandler, ConversationHandler, MessageHandler, filters
 from aiohttp import web
@@ -35,6 +38,20 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _token_expiry(payload: Dict[str, Any]) -> Optional[float]:
+    """
+    Get the expiration timestamp from a decoded JWT payload.
+
+    Args:
+        payload: Decoded JWT claims
+
+    Returns:
+        Expiration as a Unix timestamp, or None if the token has no exp claim
+    """
+    exp_timestamp = payload.get("exp")
+    return float(exp_timestamp) if exp_timestamp else None
+
+
 def check_token_expiry(token: str) -> None:
     """
     Check service token expiration and warn if expiring soon.
@@ -45,66 +62,166 @@ def check_token_expiry(token: str) -> None:
     Raises:
         SystemExit: If token is expired
     """
+    # Only needed when a service token is configured
+    import jwt
+
     try:
         payload = jwt.decode(token, options={"verify_signature": False})
-        exp_timestamp = payload.get("exp")
+        exp_timestamp = _token_expiry(payload)
         
-        if not exp_timestamp:
+        if exp_timestamp is None:
             logger.warning("Could not determine token expiration")
             return
         
-        exp_date = datetime.fromtimestamp(exp_timestamp)
-        days_left = (exp_date - datetime.now()).days
+        days_left = int((exp_timestamp - time.time()) // 86400)
         
         if days_left <= 0:
             logger.error("Service token has expired")
             logger.error("Generate new token: cd nocturna-calculations && make service-token-create")
             sys.exit(1)
         elif days_left <= 7:
-            logger.warning(f"Service token expires in {days_left} days")
+            logger.warning("Service token expires in %s days", days_left)
             logger.warning("Consider refreshing token soon")
         else:
-            logger.info(f"Service token valid for {days_left} days")
+            logger.info("Service token valid for %s days", days_left)
             
     except jwt.DecodeError:
         logger.warning("Could not decode service token")
     except Exception as e:
-        logger.warning(f"Token validation error: {e}")
+        logger.warning("Token validation error: %s", e)
+
 
+def warm_up_connections(warmups: List[Callable[[], bool]]) -> None:
+    """
+    Run client warm-up calls concurrently so the first user request
+    finds open keep-alive connections. Failures are only logged.
 
-async def run_polling(application: Application, settings) -> None:
+    Args:
+        warmups: Callables that return True when the service answered
+    """
+
+    def run(warmup: Callable[[], bool]) -> bool:
+        try:
+            return bool(warmup())
+        except Exception as e:
+            logger.warning("Connection warm-up failed: %s", e)
+            return False
+
+    with ThreadPoolExecutor(max_workers=len(warmups)) as executor:
+        results = list(executor.map(run, warmups))
+    logger.info("Warmed up %s of %s API connections", sum(results), len(warmups))
+
+
+async def refresh_transit_interpretation(
+    transit_service: TransitService,
+    interval: float = InterpretationService.TRANSIT_CACHE_TTL / 2,
+) -> None:
+    """
+    Regenerate the daily transit interpretation in the background.
+
+    The /transit reading is the same for every user, so computing it once
+    per interval lets user requests be answered from the interpretation
+    cache instead of waiting on the LLM. Each refresh bypasses the cache,
+    and the interval is shorter than the cache TTL, so the cached reading
+    never expires between refreshes.
+
+    Args:
+        transit_service: Service whose interpretation to refresh
+        interval: Seconds between refreshes
+    """
+    while True:
+        try:
+            refreshed = await asyncio.to_thread(transit_service.refresh_interpretation)
+        except Exception:
+            logger.exception("Could not refresh daily transit interpretation")
+        else:
+            if refreshed:
+                logger.info("Refreshed daily transit interpretation")
+            else:
+                logger.warning("Could not refresh daily transit interpretation")
+        await asyncio.sleep(interval)
+
+
+async def sweep_natal_charts(
+    personal_transit_service: PersonalTransitService, interval: float = 300.0
+) -> None:
+    """
+    Delete expired natal charts from the Nocturna API in the background.
+
+    Charts are otherwise only removed when the same birth data is looked up
+    again. When the job is stopped, every chart still cached is deleted.
+
+    Args:
+        personal_transit_service: Service whose natal charts to sweep
+        interval: Seconds between sweeps
+    """
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            swept = personal_transit_service.sweep_natal_charts()
+            if swept:
+                logger.info("Deleted %s expired natal charts", swept)
+    finally:
+        await personal_transit_service.close()
+
+
+async def stop_background_jobs(jobs: List[asyncio.Task]) -> None:
+    """Cancel background jobs and wait for them to finish."""
+    for job in jobs:
+        job.cancel()
+    await asyncio.gather(*jobs, return_exceptions=True)
+
+
+async def run_polling(
+    application: Application,
+    settings,
+    background_jobs: Sequence[Callable[[], Coroutine[Any, Any, None]]] = (),
+) -> None:
     """
     Run bot in polling mode (for local development).
 
     Args:
         application: Telegram application instance
         settings: Application settings
+        background_jobs: Coroutine functions to run while the bot is up
     """
     logger.info("Starting bot in POLLING mode...")
-    logger.info(f"Bot username: {settings.telegram_bot_username or 'Not set'}")
+    logger.info("Bot username: %s", settings.telegram_bot_username or "Not set")
     logger.info("Bot is running. Press Ctrl+C to stop.")
 
     # Initialize database
-    await init_db(settings.database_url, settings.database_echo)
+    await init_db(
+        settings.database_url,
+        settings.database_echo,
+        settings.database_statement_cache_size,
+        settings.database_pool_size,
+        settings.database_max_overflow,
+    )
 
     await application.initialize()
     await application.start()
     await application.updater.start_polling(allowed_updates=Update.ALL_TYPES)
+    jobs = [asyncio.create_task(job()) for job in background_jobs]
 
     # Keep the bot running
     try:
-        import asyncio
         await asyncio.Event().wait()
     except (KeyboardInterrupt, SystemExit):
         logger.info("Stopping bot...")
     finally:
+        await stop_background_jobs(jobs)
         await application.updater.stop()
         await application.stop()
         await application.shutdown()
         await close_db()
 
 
-async def run_webhook(application: Application, settings, handlers: BotHandlers) -> None:
+async def run_webhook(
+    application: Application,
+    settings,
+    handlers: BotHandlers,
+    background_jobs: Sequence[Callable[[], Coroutine[Any, Any, None]]] = (),
+) -> None:
     """
     Run bot in webhook mode (for production).
 
@@ -112,11 +229,12 @@ async def run_webhook(application: Application, settings, handlers: BotHandlers)
         application: Telegram application instance
         settings: Application settings
         handlers: Bot handlers instance
+        background_jobs: Coroutine functions to run while the bot is up
     """
     logger.info("Starting bot in WEBHOOK mode...")
-    logger.info(f"Webhook URL: {settings.webhook_url}{settings.webhook_path}")
-    logger.info(f"Listening on {settings.webhook_host}:{settings.webhook_port}")
-    logger.info(f"Bot username: {settings.telegram_bot_username or 'Not set'}")
+    logger.info("Webhook URL: %s%s", settings.webhook_url, settings.webhook_path)
+    logger.info("Listening on %s:%s", settings.webhook_host, settings.webhook_port)
+    logger.info("Bot username: %s", settings.telegram_bot_username or "Not set")
 
     # Create aiohttp application for webhook
     aiohttp_app = web.Application()
@@ -125,7 +243,13 @@ async def run_webhook(application: Application, settings, handlers: BotHandlers)
     aiohttp_app.router.add_get("/health", handlers.health_check)
     
     # Initialize database
-    await init_db(settings.database_url, settings.database_echo)
+    await init_db(
+        settings.database_url,
+        settings.database_echo,
+        settings.database_statement_cache_size,
+        settings.database_pool_size,
+        settings.database_max_overflow,
+    )
     
     # Initialize and start bot
     await application.initialize()
@@ -139,6 +263,27 @@ async def run_webhook(application: Application, settings, handlers: BotHandlers)
         secret_token=settings.webhook_secret,
     )
     
+    # Bounded queue drained by a fixed number of workers, so at most
+    # settings.webhook_workers updates (and DB sessions) are in flight
+    update_queue: asyncio.Queue = asyncio.Queue(maxsize=settings.webhook_queue_size)
+
+    async def update_worker() -> None:
+        """Process queued updates one at a time."""
+        while True:
+            update = await update_queue.get()
+            try:
+                await application.process_update(update)
+            except Exception as e:
+                logger.error("Error processing update: %s", e, exc_info=True)
+            finally:
+                update_queue.task_done()
+
+    workers = [
+        asyncio.create_task(update_worker())
+        for _ in range(settings.webhook_workers)
+    ]
+    jobs = [asyncio.create_task(job()) for job in background_jobs]
+
     # Configure webhook handler
     async def telegram_webhook(request: web.Request) -> web.Response:
         """Handle incoming webhook requests from Telegram."""
@@ -152,16 +297,21 @@ async def run_webhook(application: Application, settings, handlers: BotHandlers)
             
             # Process update asynchronously without waiting
             # This prevents 504 Gateway Timeout when processing takes long
-            update_data = await request.json()
+            update_data = orjson.loads(await request.read())
             update = Update.de_json(update_data, application.bot)
             
-            # Process update in background task
-            asyncio.create_task(application.process_update(update))
+            # Hand off to the worker pool; shed load when the queue is full
+            # (Telegram retries updates answered with a non-2xx status)
+            try:
+                update_queue.put_nowait(update)
+            except asyncio.QueueFull:
+                logger.warning("Update queue is full, rejecting webhook update")
+                return web.Response(status=503)
             
             # Immediately return 200 OK to Telegram
             return web.Response(status=200)
         except Exception as e:
-            logger.error(f"Error processing webhook: {str(e)}")
+            logger.error("Error processing webhook: %s", e)
             return web.Response(status=500)
     
     # Add webhook endpoint
@@ -177,11 +327,14 @@ async def run_webhook(application: Application, settings, handlers: BotHandlers)
         logger.info("Webhook server started successfully")
         
         # Keep the server running
-        import asyncio
         await asyncio.Event().wait()
     except (KeyboardInterrupt, SystemExit):
         logger.info("Stopping webhook server...")
     finally:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        await stop_background_jobs(jobs)
         await application.stop()
         await application.shutdown()
         await runner.cleanup()
@@ -207,30 +360,35 @@ def main() -> None:
             check_token_expiry(settings.nocturna_service_token)
 
         # Initialize Nocturna API client
-        logger.info(f"Initializing Nocturna API client: {settings.nocturna_api_url}")
+        logger.info("Initializing Nocturna API client: %s", settings.nocturna_api_url)
         nocturna_client = NocturnaClient(
             api_url=settings.nocturna_api_url,
             service_token=settings.nocturna_service_token,
             timeout=settings.nocturna_timeout,
             max_retries=settings.nocturna_max_retries,
         )
+        warmups = [nocturna_client.warm_up]
 
         # Initialize OpenRouter client (optional)
         interpretation_service = None
         if settings.openrouter_api_key:
-            logger.info(f"Initializing OpenRouter client: {settings.openrouter_model}")
+            logger.info("Initializing OpenRouter client: %s", settings.openrouter_model)
             openrouter_client = OpenRouterClient(
                 api_key=settings.openrouter_api_key, model=settings.openrouter_model
             )
-            interpretation_service = InterpretationService(openrouter_client)
+            interpretation_service = InterpretationService(
+                openrouter_client,
+                transit_model=settings.openrouter_transit_model,
+                natal_model=settings.openrouter_natal_model,
+            )
         else:
             logger.warning("OpenRouter API key not found. Interpretation disabled.")
 
         # Initialize Chart Service client (optional)
         chart_service = None
         if settings.chart_service_api_key and settings.chart_service_api_key.strip():
-            logger.info(f"Initializing Chart Service client: {settings.chart_service_url}")
-            logger.debug(f"Chart Service API key length: {len(settings.chart_service_api_key)}")
+            logger.info("Initializing Chart Service client: %s", settings.chart_service_url)
+            logger.debug("Chart Service API key length: %s", len(settings.chart_service_api_key))
             chart_service_client = ChartServiceClient(
                 base_url=settings.chart_service_url,
                 api_key=settings.chart_service_api_key,
@@ -241,9 +399,13 @@ def main() -> None:
                 chart_service_client=chart_service_client,
                 timezone=settings.timezone,
             )
+            warmups.append(chart_service_client.health_check)
         else:
             logger.warning("Chart Service API key not found or empty. Chart image generation disabled.")
-            logger.debug(f"chart_service_api_key value: {repr(settings.chart_service_api_key)}")
+            logger.debug("chart_service_api_key value: %r", settings.chart_service_api_key)
+
+        # Open keep-alive connections before the first user request
+        warm_up_connections(warmups)
 
         # Initialize services
         logger.info("Initializing services...")
@@ -266,6 +428,12 @@ def main() -> None:
         )
         logger.info("Natal chart services initialized")
 
+        # Keep the shared /transit interpretation precomputed, and remove
+        # natal charts from the API once they are no longer reused
+        background_jobs = [partial(sweep_natal_charts, personal_transit_service)]
+        if interpretation_service:
+            background_jobs.append(partial(refresh_transit_interpretation, transit_service))
+
         # Initialize bot handlers
         logger.info("Initializing bot handlers...")
         handlers = BotHandlers(
@@ -323,15 +491,27 @@ def main() -> None:
         # Register error handler
         application.add_error_handler(handlers.error_handler)
 
-        # Start the bot in the appropriate mode
-        import asyncio
-        if settings.bot_mode == "webhook":
-            asyncio.run(run_webhook(application, settings, handlers))
+        # Use uvloop's faster event loop when it is installed (optional)
+        try:
+            import uvloop
+        except ImportError:
+            logger.debug("uvloop not installed, using the default event loop")
         else:
-            asyncio.run(run_polling(application, settings))
+            uvloop.install()
+            logger.info("Using uvloop event loop")
+
+        # Start the bot in the appropriate mode
+        try:
+            if settings.bot_mode == "webhook":
+                asyncio.run(run_webhook(application, settings, handlers, background_jobs))
+            else:
+                asyncio.run(run_polling(application, settings, background_jobs))
+        finally:
+            # Pending LLM calls must not hold up process exit
+            handlers.shutdown()
 
     except Exception as e:
-        logger.error(f"Fatal error: {str(e)}")
+        logger.error("Fatal error: %s", e)
         sys.exit(1)
 
 
@@ -2,6 +2,7 @@
 
 from src.services.transit_service import TransitService
 from src.services.interpretation_service import InterpretationService
+from src.services.chart_service import ChartService
 
-__all__ = ["TransitService", "InterpretationService"]
+__all__ = ["TransitService", "InterpretationService", "ChartService"]
 
@@ -1,16 +1,21 @@
 """Service for chart image generation."""
 
 import logging
+import threading
 from datetime import datetime
 from typing import Dict, Any, Optional, List
-from io import BytesIO
+from operator import itemgetter
 
 from src.api.nocturna_client import NocturnaClient
 from src.api.chart_service_client import ChartServiceClient, ChartServiceError
+from src.services.inflight import InflightCalls
 
 
 logger = logging.getLogger(__name__)
 
+_house_number = itemgetter("number")
+_position_fields = itemgetter("planet", "longitude", "latitude", "is_retrograde")
+
 
 class ChartService:
     """
@@ -34,6 +39,23 @@ class ChartService:
         "PLUTO": "pluto",
     }
 
+    # Accepts the API's upper-case names as well as lower- and title-case
+    # ones without calling .upper() for every position
+    _PLANET_LOOKUP = {
+        variant: chart_name
+        for name, chart_name in PLANET_MAPPING.items()
+        for variant in (name, name.lower(), name.title())
+    }
+
+    # Render options shared by every chart this service requests
+    RENDER_OPTIONS = {"format": "png", "theme": "light"}
+
+    # Upper bound on cached current-transit images within one minute
+    CHART_CACHE_SIZE = 64
+
+    # Seconds a request waits for an identical render already in progress
+    RENDER_WAIT_TIMEOUT = 120.0
+
     def __init__(
         self,
         nocturna_client: NocturnaClient,
@@ -51,6 +73,14 @@ class ChartService:
         self.nocturna_client = nocturna_client
         self.chart_service_client = chart_service_client
         self.timezone = timezone
+        # Current-transit images keyed by (minute, lat, lon, width, height);
+        # cleared whenever the minute changes
+        self._chart_cache: Dict[tuple, bytes] = {}
+        self._chart_cache_minute: Optional[str] = None
+        # Renders run in worker threads, which all share the cache
+        self._chart_cache_lock = threading.Lock()
+        # Renders in progress, so concurrent identical requests share one result
+        self._inflight = InflightCalls()
 
     def _convert_planets_to_chart_format(
         self, positions: List[Dict[str, Any]]
@@ -64,18 +94,26 @@ class ChartService:
         Returns:
             Dictionary in chart service format
         """
+        lookup = self._PLANET_LOOKUP.get
         planets_dict = {}
         for pos in positions:
-            planet_name = pos.get("planet", "").upper()
-            chart_planet_name = self.PLANET_MAPPING.get(planet_name)
-            if chart_planet_name:
+            try:
+                # Nocturna normally sends every field, so read them in one call
+                planet_name, longitude, latitude, retrograde = _position_fields(pos)
+            except KeyError:
+                planet_name = pos.get("planet", "")
                 longitude = pos.get("longitude", 0.0)
                 latitude = pos.get("latitude", 0.0)
-                retrograde = pos.get("is_retrograde", False) # Get retrograde status from Nocturna API
+                retrograde = pos.get("is_retrograde", False) # Retrograde status from Nocturna API
+            chart_planet_name = lookup(planet_name)
+            if chart_planet_name is None and planet_name:
+                # Rare mixed-case spelling
+                chart_planet_name = lookup(planet_name.upper())
+            if chart_planet_name:
                 planets_dict[chart_planet_name] = {
                     "lon": longitude,
                     "lat": latitude,
-                    "retrograde": retrograde, # Add retrograde to dictionary
+                    "retrograde": retrograde,
                 }
         return planets_dict
 
@@ -92,7 +130,10 @@ class ChartService:
             List of house cusps in chart service format
         """
         # Sort houses by number to ensure correct order
-        sorted_houses = sorted(houses, key=lambda h: h.get("number", 0))
+        try:
+            sorted_houses = sorted(houses, key=_house_number)
+        except KeyError:
+            sorted_houses = sorted(houses, key=lambda h: h.get("number", 0))
         return [{"lon": house.get("longitude", 0.0)} for house in sorted_houses]
 
     def generate_current_transit_chart(
@@ -118,70 +159,97 @@ class ChartService:
             ChartServiceError: If chart generation fails
         """
         try:
-            now = datetime.now()
-            date_str = now.strftime("%Y-%m-%d")
-            time_str = now.strftime("%H:%M:%S")
-
-            logger.info(f"Generating transit chart for {date_str} {time_str}")
-
-            # Get planetary positions
-            positions_data = self.nocturna_client.calculate_planetary_positions(
-                date=date_str,
-                time=time_str,
-                latitude=latitude,
-                longitude=longitude,
-                timezone=self.timezone,
-            )
-
-            # Get houses
-            houses_data = self.nocturna_client.calculate_houses(
-                date=date_str,
-                time=time_str,
-                latitude=latitude,
-                longitude=longitude,
-                timezone=self.timezone,
-            )
-
-            positions = positions_data.get("positions", [])
-            houses = houses_data.get("houses", [])
-
-            logger.debug(f"Received positions from Nocturna API: {positions}")
-            logger.debug(f"Received houses from Nocturna API: {houses}")
-
-            if not positions:
-                raise ChartServiceError("No planetary positions received from API")
-
-            if not houses or len(houses) < 12:
-                raise ChartServiceError("Invalid houses data received from API")
-
-            # Convert to chart service format
-            planets_dict = self._convert_planets_to_chart_format(positions)
-            houses_list = self._convert_houses_to_chart_format(houses)
-
-            logger.debug(f"Converted planets for chart service: {planets_dict}")
-            logger.debug(f"Converted houses for chart service: {houses_list}")
-            logger.info(f"Houses data - First house longitude: {houses_list[0]['lon'] if houses_list else 'N/A'}")
-
-            # Render chart
-            image_bytes = self.chart_service_client.render_chart(
-                planets=planets_dict,
-                houses=houses_list,
-                format="png",
-                width=width,
-                height=height,
-                theme="light",
-                aspect_orb=6,
-            )
-
-            logger.info(f"Chart generated successfully: {len(image_bytes)} bytes")
+            date_str, time_str = datetime.now().isoformat(timespec="seconds").split("T")
+
+            minute = time_str[:5]
+            stamp = f"{date_str} {minute}"
+            cache_key = (date_str, minute, round(latitude, 2), round(longitude, 2), width, height)
+            with self._chart_cache_lock:
+                if self._chart_cache_minute != stamp:
+                    self._chart_cache = {}
+                    self._chart_cache_minute = stamp
+                cached = self._chart_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Returning cached transit chart for %s %s", date_str, minute)
+                return cached
+
+            pending, is_owner = self._inflight.claim(cache_key)
+            if not is_owner:
+                logger.debug("Waiting for in-flight transit chart for %s %s", date_str, minute)
+                return pending.result(timeout=self.RENDER_WAIT_TIMEOUT)
+
+            with self._inflight.resolving(cache_key, pending):
+                image_bytes = self._render_current_transit_chart(
+                    date_str, time_str, latitude, longitude, width, height
+                )
+                pending.set_result(image_bytes)
+                with self._chart_cache_lock:
+                    if self._chart_cache_minute == stamp:
+                        if len(self._chart_cache) >= self.CHART_CACHE_SIZE:
+                            self._chart_cache.clear()
+                        self._chart_cache[cache_key] = image_bytes
             return image_bytes
 
         except ChartServiceError:
             raise
         except Exception as e:
-            logger.error(f"Error generating chart: {str(e)}", exc_info=True)
+            logger.error("Error generating chart: %s", e, exc_info=True)
             raise ChartServiceError(f"Failed to generate chart: {str(e)}")
 
+    def _render_current_transit_chart(
+        self,
+        date_str: str,
+        time_str: str,
+        latitude: float,
+        longitude: float,
+        width: int,
+        height: int,
+    ) -> bytes:
+        """Fetch current positions and houses and render them as a chart image."""
+        logger.info("Generating transit chart for %s %s", date_str, time_str)
+
+        # Get planetary positions and houses
+        chart_data = self.nocturna_client.calculate_chart(
+            date=date_str,
+            time=time_str,
+            latitude=latitude,
+            longitude=longitude,
+            timezone=self.timezone,
+        )
+
+        positions = chart_data["positions"]
+        houses = chart_data["houses"]
+
+        logger.debug("Received positions from Nocturna API: %s", positions)
+        logger.debug("Received houses from Nocturna API: %s", houses)
+
+        if not positions:
+            raise ChartServiceError("No planetary positions received from API")
+
+        if not houses or len(houses) < 12:
+            raise ChartServiceError("Invalid houses data received from API")
+
+        # Convert to chart service format
+        planets_dict = self._convert_planets_to_chart_format(positions)
+        houses_list = self._convert_houses_to_chart_format(houses)
+
+        logger.debug("Converted planets for chart service: %s", planets_dict)
+        logger.debug("Converted houses for chart service: %s", houses_list)
+        logger.info("Houses data - First house longitude: %s", houses_list[0]["lon"] if houses_list else "N/A")
+
+        # Render chart
+        image_bytes = self.chart_service_client.render_chart(
+            planets=planets_dict,
+            houses=houses_list,
+            width=width,
+            height=height,
+            aspect_orb=6,
+            **self.RENDER_OPTIONS,
+        )
+
+        logger.info("Chart generated successfully: %s bytes", len(image_bytes))
+        return image_bytes
+
     def generate_natal_chart(
         self,
         positions: List[Dict[str, Any]],
@@ -217,27 +285,26 @@ class ChartService:
             planets_dict = self._convert_planets_to_chart_format(positions)
             houses_list = self._convert_houses_to_chart_format(houses)
 
-            logger.debug(f"Converted planets for chart service: {planets_dict}")
-            logger.debug(f"Converted houses for chart service: {houses_list}")
+            logger.debug("Converted planets for chart service: %s", planets_dict)
+            logger.debug("Converted houses for chart service: %s", houses_list)
 
             # Render chart
             image_bytes = self.chart_service_client.render_chart(
                 planets=planets_dict,
                 houses=houses_list,
-                format="png",
                 width=width,
                 height=height,
-                theme="light",
                 aspect_orb=6,
+                **self.RENDER_OPTIONS,
             )
 
-            logger.info(f"Natal chart generated successfully: {len(image_bytes)} bytes")
+            logger.info("Natal chart generated successfully: %s bytes", len(image_bytes))
             return image_bytes
 
         except ChartServiceError:
             raise
         except Exception as e:
-            logger.error(f"Error generating natal chart: {str(e)}", exc_info=True)
+            logger.error("Error generating natal chart: %s", e, exc_info=True)
             raise ChartServiceError(f"Failed to generate natal chart: {str(e)}")
 
     def generate_personal_transit_chart(
@@ -293,9 +360,9 @@ class ChartService:
             # Create ISO datetime string
             transit_datetime = f"{transit_date}T{transit_time}Z"
 
-            logger.debug(f"Natal planets: {natal_planets_dict}")
-            logger.debug(f"Transit planets: {transit_planets_dict}")
-            logger.debug(f"Transit datetime: {transit_datetime}")
+            logger.debug("Natal planets: %s", natal_planets_dict)
+            logger.debug("Transit planets: %s", transit_planets_dict)
+            logger.debug("Transit datetime: %s", transit_datetime)
 
             # Render biwheel chart using transit endpoint
             image_bytes = self.chart_service_client.render_transit_chart(
@@ -303,18 +370,17 @@ class ChartService:
                 natal_houses=natal_houses_list,
                 transit_planets=transit_planets_dict,
                 transit_datetime=transit_datetime,
-                format="png",
                 width=width,
                 height=height,
-                theme="light",
+                **self.RENDER_OPTIONS,
             )
 
-            logger.info(f"Personal transit biwheel chart generated successfully: {len(image_bytes)} bytes")
+            logger.info("Personal transit biwheel chart generated successfully: %s bytes", len(image_bytes))
             return image_bytes
 
         except ChartServiceError:
             raise
         except Exception as e:
-            logger.error(f"Error generating personal transit chart: {str(e)}", exc_info=True)
+            logger.error("Error generating personal transit chart: %s", e, exc_info=True)
             raise ChartServiceError(f"Failed to generate personal transit chart: {str(e)}")
 
@@ -0,0 +1,63 @@
+"""Sharing one in-progress call between concurrent identical requests."""
+
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Dict, Hashable, Iterator, Tuple
+
+
+class InflightCalls:
+    """
+    Calls in progress, keyed by request identity.
+
+    The first caller for a key owns the call and resolves the shared
+    future inside resolving(); later callers wait on the same future.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def claim(self, key: Hashable) -> Tuple[Future, bool]:
+        """
+        Register a call as in progress, or join the one already running.
+
+        Args:
+            key: Identity of the request
+
+        Returns:
+            The shared future and whether the caller owns it (and so must
+            run the call inside resolving())
+        """
+        with self._lock:
+            pending = self._calls.get(key)
+            if pending is not None:
+                return pending, False
+            pending = self._calls[key] = Future()
+            return pending, True
+
+    @contextmanager
+    def resolving(self, key: Hashable, pending: Future) -> Iterator[None]:
+        """
+        Run the owner's call and forget it once finished.
+
+        The owner sets the result inside the block. An error fails the
+        future with it; leaving the block any other way (a generator closed
+        early, say) fails it with RuntimeError, so waiters never hang.
+
+        Args:
+            key: Identity of the request, as passed to claim()
+            pending: Future returned by claim()
+        """
+        try:
+            yield
+        except Exception as e:
+            if not pending.done():
+                pending.set_exception(e)
+            raise
+        finally:
+            if not pending.done():
+                pending.set_exception(RuntimeError("In-flight call finished without a result"))
+            with self._lock:
+                self._calls.pop(key, None)
@@ -1,14 +1,150 @@
 """Service for LLM-based astrological interpretation."""
 
+import hashlib
 import logging
-from typing import List, Dict, Any
+import threading
+import time
+from typing import Iterator, List, Dict, Any, Optional, Tuple
+
+import orjson
 
 from src.api.openrouter_client import OpenRouterClient
+from src.services.inflight import InflightCalls
 
 
 logger = logging.getLogger(__name__)
 
 
+_TRANSIT_SYSTEM_PROMPT = """Ты — опытный астролог с глубокими знаниями западной астрологии. 
+Твоя задача — дать краткую, но содержательную интерпретацию текущего транзита планет, ориентированную на повседневную жизнь людей.
+
+Это анализ энергий дня, он не учитывает влияние на конкретного человека, поэтому избегай использования личных местоимений. Говори об энергиях дня в целом.
+
+Твой анализ должен:
+- Быть написан на русском языке.
+- Быть понятным для обычного человека (избегай сложной терминологии).
+- Фокусироваться на практических аспектах и влиянии на повседневную жизнь.
+- Быть позитивным, но реалистичным.
+- Быть кратким (максимум 400-500 слов).
+- Выделять наиболее важные влияния.
+- НЕ ИСПОЛЬЗОВАТЬ ЗАГОЛОВКИ ИЛИ MARKDOWN форматирование (например, #, ##, ***, ---). Используй только абзацы и обычный текст.
+
+Структура ответа:
+1. Общая энергия дня (1-2 предложения, ключевая тема).
+2. Влияние на отношения и общение (как планетарные энергии могут отразиться на взаимодействии с окружающими).
+3. Влияние на работу, карьеру и финансы (какие возможности или вызовы могут возникнуть в этих сферах).
+4. Влияние на эмоциональное состояние и внутренний мир (как текущие транзиты сказываются на чувствах и самочувствии).
+5. Практические рекомендации (что благоприятно делать, чего стоит избегать, на что обратить внимание).
+6. Совет дня (краткое вдохновляющее заключение).
+
+Используй эмодзи для визуального акцента (но умеренно и только в начале абзацев)."""
+
+_TRANSIT_USER_PROMPT_TEMPLATE = """Проанализируй следующую астрологическую картину дня:
+
+Текущие позиции планет:
+{positions_text}
+
+Текущие аспекты:
+{aspects_text}
+
+На основе этих данных, пожалуйста, предоставь краткую интерпретацию, следуя указанной выше структуре и правилам форматирования. """
+
+_NATAL_SYSTEM_PROMPT = """Ты — опытный астролог с глубокими знаниями западной астрологии. 
+Твоя задача — дать краткую, но содержательную интерпретацию натальной карты.
+
+Твой анализ должен:
+- Быть написан на русском языке.
+- Быть понятным для обычного человека (избегай сложной терминологии).
+- Фокусироваться на ключевых характеристиках личности.
+- Быть позитивным, но реалистичным.
+- Быть кратким (максимум 500-600 слов).
+- Выделять наиболее важные аспекты карты.
+- НЕ ИСПОЛЬЗОВАТЬ ЗАГОЛОВКИ ИЛИ MARKDOWN форматирование (например, #, ##, ***, ---). Используй только абзацы и обычный текст.
+
+Структура ответа:
+1. Общая характеристика личности (2-3 предложения о ключевых чертах, основанных на положении Солнца, Луны и Асцендента).
+2. Эмоциональная сфера и внутренний мир (как человек чувствует, какие у него эмоциональные потребности).
+3. Стиль общения и мышления (особенности коммуникации и восприятия информации).
+4. Отношения и любовь (как проявляется в романтических отношениях, что важно в партнерстве).
+5. Карьера и самореализация (профессиональные склонности и способы достижения целей).
+6. Сильные стороны и потенциал (на что важно опираться).
+7. Области роста (над чем можно поработать для гармоничного развития).
+
+Используй эмодзи для визуального акцента (но умеренно и только в начале абзацев)."""
+
+_NATAL_USER_PROMPT_TEMPLATE = """Проанализируй следующую натальную карту:
+
+Позиции планет:
+{positions_text}
+
+Дома:
+{houses_text}
+
+На основе этих данных, пожалуйста, предоставь краткую интерпретацию натальной карты, следуя указанной выше структуре и правилам форматирования."""
+
+_PERSONAL_TRANSIT_SYSTEM_PROMPT = """Ты — опытный астролог с глубокими знаниями западной астрологии. 
+Твоя задача — дать краткую, но содержательную интерпретацию персональных транзитов, т.е. текущих планет в аспектах к натальной карте конкретного человека.
+
+Твой анализ должен:
+- Быть написан на русском языке.
+- Обращаться к читателю на "ты" (это персональный прогноз для конкретного человека).
+- Быть понятным для обычного человека (избегай сложной терминологии).
+- Фокусироваться на практических аспектах и влиянии на повседневную жизнь.
+- Быть позитивным, но реалистичным.
+- Быть кратким (максимум 400-500 слов).
+- Выделять наиболее важные транзитные влияния.
+- НЕ ИСПОЛЬЗОВАТЬ ЗАГОЛОВКИ ИЛИ MARKDOWN форматирование (например, #, ##, ***, ---). Используй только абзацы и обычный текст.
+
+Структура ответа:
+1. Общая энергия периода (1-2 предложения о ключевых транзитных влияниях).
+2. Влияние на твои отношения и общение (как транзиты влияют на взаимодействие с окружающими).
+3. Влияние на работу, карьеру и финансы (какие возможности или вызовы могут возникнуть).
+4. Влияние на эмоциональное состояние и внутренний мир (как транзиты сказываются на чувствах).
+5. Практические рекомендации (что благоприятно делать, чего стоит избегать).
+6. Персональный совет (краткое вдохновляющее заключение).
+
+Используй эмодзи для визуального акцента (но умеренно и только в начале абзацев)."""
+
+_PERSONAL_TRANSIT_USER_PROMPT_TEMPLATE = """Проанализируй следующие персональные транзиты:
+
+Натальные позиции планет:
+{natal_text}
+
+Транзитные аспекты к натальной карте:
+{transit_aspects_text}
+
+На основе этих данных, пожалуйста, предоставь краткую интерпретацию персональных транзитов, следуя указанной выше структуре и правилам форматирования."""
+
+
+# System messages shared by every request; treated as read-only
+_TRANSIT_SYSTEM_MESSAGE = {"role": "system", "content": _TRANSIT_SYSTEM_PROMPT}
+_NATAL_SYSTEM_MESSAGE = {"role": "system", "content": _NATAL_SYSTEM_PROMPT}
+_PERSONAL_TRANSIT_SYSTEM_MESSAGE = {"role": "system", "content": _PERSONAL_TRANSIT_SYSTEM_PROMPT}
+
+_INTERPRETATION_ERROR = (
+    "⚠️ К сожалению, не удалось сгенерировать интерпретацию. "
+    "Пожалуйста, попробуйте позже."
+)
+
+# Only these bodies and aspects are worth the model's attention; minor
+# bodies and wide orbs add prompt tokens without changing the reading
+_MAJOR_BODIES = frozenset({
+    "SUN", "MOON", "MERCURY", "VENUS", "MARS", "JUPITER", "SATURN",
+    "URANUS", "NEPTUNE", "PLUTO", "ASCENDANT", "MC",
+})
+_MAJOR_ASPECTS = frozenset({"CONJUNCTION", "OPPOSITION", "SQUARE", "TRINE", "SEXTILE"})
+_MAX_PROMPT_ORB = 6.0
+_MAX_PROMPT_ASPECTS = 15
+
+# Special names for the main angles in house prompts
+_HOUSE_ANGLE_NAMES = {
+    1: "1 дом (Асцендент)",
+    4: "4 дом (IC)",
+    7: "7 дом (Десцендент)",
+    10: "10 дом (MC)",
+}
+
+
 class InterpretationService:
     """
     Service for generating astrological interpretations using LLM.
@@ -17,14 +153,237 @@ class InterpretationService:
     meaningful insights in Russian language.
     """
 
-    def __init__(self, openrouter_client: OpenRouterClient):
+    # How long an identical prompt reuses its completion, in seconds
+    TRANSIT_CACHE_TTL = 6 * 3600.0
+    NATAL_CACHE_TTL = 30 * 24 * 3600.0
+    PERSONAL_TRANSIT_CACHE_TTL = 6 * 3600.0
+    COMPLETION_CACHE_SIZE = 512
+
+    # Output budgets for the 400-600 word limits set by the prompts
+    # (Russian text runs at roughly 3 tokens per word)
+    TRANSIT_MAX_TOKENS = 1500
+    NATAL_MAX_TOKENS = 2000
+    # Discourage the model from looping over the same phrasing
+    FREQUENCY_PENALTY = 0.3
+
+    # Transit readings are templated, so structure matters more than variety
+    TRANSIT_TEMPERATURE = 0.3
+    NATAL_TEMPERATURE = 0.7
+
+    def __init__(
+        self,
+        openrouter_client: OpenRouterClient,
+        transit_model: Optional[str] = None,
+        natal_model: Optional[str] = None,
+    ):
         """
         Initialize interpretation service.
 
         Args:
             openrouter_client: Client for OpenRouter API
+            transit_model: Model for daily and personal transit readings
+                (default: the client's model)
+            natal_model: Model for natal chart readings
+                (default: the client's model)
         """
         self.openrouter_client = openrouter_client
+        self.transit_model = transit_model or openrouter_client.model
+        self.natal_model = natal_model or openrouter_client.model
+        # Request fingerprint -> (expiry on the monotonic clock, interpretation)
+        self._completion_cache: Dict[str, Tuple[float, str]] = {}
+        # Completions run on several worker threads, which all share the cache
+        self._completion_cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # Completions in progress, so concurrent identical requests share one call
+        self._inflight = InflightCalls()
+
+    @staticmethod
+    def _completion_cache_key(
+        model: str, prompt: Any, temperature: float, max_tokens: int
+    ) -> str:
+        """Fingerprint everything that determines a completion."""
+        request = {
+            "model": model,
+            "prompt": prompt,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        return hashlib.sha256(orjson.dumps(request, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+    @staticmethod
+    def _transit_fingerprint(
+        kind: str, positions: List[Dict[str, Any]], aspects: List[Dict[str, Any]]
+    ) -> List[Any]:
+        """
+        Describe a transit prompt by what its interpretation depends on.
+
+        Exact degrees and orbs are left out: a Moon a few minutes of arc
+        further along, or an orb that moved by 0.1°, yields essentially the
+        same reading, so such near-duplicate prompts share a cache entry.
+        Only used for the general daily reading, which is the same for all
+        users; personal readings are keyed on their exact prompt.
+
+        Args:
+            kind: Which interpretation the fingerprint is for
+            positions: Planetary positions in the prompt
+            aspects: Aspects in the prompt
+
+        Returns:
+            JSON-serializable fingerprint
+        """
+        return [
+            kind,
+            sorted(
+                (str(p.get("planet", "")), str(p.get("sign", "")), bool(p.get("is_retrograde")))
+                for p in positions
+            ),
+            sorted(
+                (
+                    str(a.get("planet1", "")),
+                    str(a.get("aspect_type", "")),
+                    str(a.get("planet2", "")),
+                    a.get("applying") if isinstance(a.get("applying"), bool) else None,
+                )
+                for a in aspects
+            ),
+        ]
+
+    def _get_cached_completion(self, key: str) -> Optional[str]:
+        """Return a cached completion if it has not expired."""
+        with self._completion_cache_lock:
+            entry = self._completion_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, interpretation = entry
+            if expires_at < time.monotonic():
+                self._completion_cache.pop(key, None)
+                return None
+            return interpretation
+
+    def _store_cached_completion(self, key: str, interpretation: str, ttl: float) -> None:
+        """Store a completion, evicting expired or oldest entries."""
+        now = time.monotonic()
+        with self._completion_cache_lock:
+            cache = self._completion_cache
+            if len(cache) >= self.COMPLETION_CACHE_SIZE:
+                for stale_key in [k for k, (exp, _) in cache.items() if exp < now]:
+                    del cache[stale_key]
+                while len(cache) >= self.COMPLETION_CACHE_SIZE:
+                    del cache[next(iter(cache))]
+            cache[key] = (now + ttl, interpretation)
+
+    def _generate(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        ttl: float,
+        fingerprint: Optional[List[Any]] = None,
+        refresh: bool = False,
+    ) -> str:
+        """
+        Generate a completion, reusing the cached text for identical requests.
+
+        Args:
+            model: Model to generate with
+            messages: Chat messages for the model
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            ttl: Seconds to keep the result cached
+            fingerprint: Coarser cache identity to use instead of the exact
+                messages, so near-duplicate prompts share one completion
+            refresh: Skip the cache lookup and replace the cached text
+
+        Returns:
+            Generated text
+        """
+        key = self._completion_cache_key(
+            model, messages if fingerprint is None else fingerprint, temperature, max_tokens
+        )
+        cached = None if refresh else self._get_cached_completion(key)
+        if cached is not None:
+            self.cache_hits += 1
+            logger.debug("Using cached interpretation (hits=%s, misses=%s)", self.cache_hits, self.cache_misses)
+            return cached
+
+        pending, is_owner = self._inflight.claim(key)
+        if not is_owner:
+            self.cache_hits += 1
+            logger.debug("Waiting for in-flight interpretation")
+            return pending.result(timeout=OpenRouterClient.REQUEST_DEADLINE)
+
+        self.cache_misses += 1
+        with self._inflight.resolving(key, pending):
+            interpretation = self.openrouter_client.generate_completion(
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                frequency_penalty=self.FREQUENCY_PENALTY,
+                model=model,
+            )
+            # Resolve waiters first so a failing store cannot strand them
+            pending.set_result(interpretation)
+            if interpretation:
+                self._store_cached_completion(key, interpretation, ttl)
+        return interpretation
+
+    @staticmethod
+    def _filter_significant(
+        positions: List[Dict[str, Any]], aspects: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Keep only the data worth putting into a prompt.
+
+        Positions are limited to the major bodies; aspects to major aspects
+        between major bodies within _MAX_PROMPT_ORB, tightest first, at most
+        _MAX_PROMPT_ASPECTS of them.
+
+        Args:
+            positions: Planetary positions data
+            aspects: Aspects data
+
+        Returns:
+            Filtered positions and aspects
+        """
+
+        def is_major(name: Any) -> bool:
+            return str(name).upper() in _MAJOR_BODIES
+
+        def orb(aspect: Dict[str, Any]) -> float:
+            return abs(float(aspect.get("orb") or 0))
+
+        positions = [p for p in positions if is_major(p.get("planet", ""))]
+        aspects = sorted(
+            (
+                a for a in aspects
+                if str(a.get("aspect_type", "")).upper() in _MAJOR_ASPECTS
+                and is_major(a.get("planet1", ""))
+                and is_major(a.get("planet2", ""))
+                and orb(a) <= _MAX_PROMPT_ORB
+            ),
+            key=orb,
+        )
+        return positions, aspects[:_MAX_PROMPT_ASPECTS]
+
+    def _transit_request(
+        self, positions: List[Dict[str, Any]], aspects: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, str]], List[Any]]:
+        """Build the chat messages and cache fingerprint for a transit reading."""
+        positions, aspects = self._filter_significant(positions, aspects)
+        positions_text = self._format_positions_for_prompt(positions)
+        aspects_text = self._format_aspects_for_prompt(aspects)
+
+        user_prompt = _TRANSIT_USER_PROMPT_TEMPLATE.format(
+            positions_text=positions_text, aspects_text=aspects_text
+        )
+
+        messages = [
+            _TRANSIT_SYSTEM_MESSAGE,
+            {"role": "user", "content": user_prompt},
+        ]
+        return messages, self._transit_fingerprint("transit", positions, aspects)
 
     def interpret_transit(
         self, positions: List[Dict[str, Any]], aspects: List[Dict[str, Any]]
@@ -40,102 +399,145 @@ class InterpretationService:
             Interpretation text in Russian
         """
         try:
-            # Format positions for prompt
-            positions_text = self._format_positions_for_prompt(positions)
-            aspects_text = self._format_aspects_for_prompt(aspects)
-
-            # Create prompt
-            system_prompt = """Ты — опытный астролог с глубокими знаниями западной астрологии. 
-Твоя задача — дать краткую, но содержательную интерпретацию текущего транзита планет, ориентированную на повседневную жизнь людей.
+            messages, fingerprint = self._transit_request(positions, aspects)
 
-Это анализ энергий дня, он не учитывает влияние на конкретного человека, поэтому избегай использования личных местоимений. Говори об энергиях дня в целом.
+            # Generate interpretation
+            interpretation = self._generate(
+                self.transit_model,
+                messages,
+                temperature=self.TRANSIT_TEMPERATURE,
+                max_tokens=self.TRANSIT_MAX_TOKENS,
+                ttl=self.TRANSIT_CACHE_TTL,
+                fingerprint=fingerprint,
+            )
 
-Твой анализ должен:
-- Быть написан на русском языке.
-- Быть понятным для обычного человека (избегай сложной терминологии).
-- Фокусироваться на практических аспектах и влиянии на повседневную жизнь.
-- Быть позитивным, но реалистичным.
-- Быть кратким (максимум 400-500 слов).
-- Выделять наиболее важные влияния.
-- НЕ ИСПОЛЬЗОВАТЬ ЗАГОЛОВКИ ИЛИ MARKDOWN форматирование (например, #, ##, ***, ---). Используй только абзацы и обычный текст.
+            return interpretation
 
-Структура ответа:
-1. Общая энергия дня (1-2 предложения, ключевая тема).
-2. Влияние на отношения и общение (как планетарные энергии могут отразиться на взаимодействии с окружающими).
-3. Влияние на работу, карьеру и финансы (какие возможности или вызовы могут возникнуть в этих сферах).
-4. Влияние на эмоциональное состояние и внутренний мир (как текущие транзиты сказываются на чувствах и самочувствии).
-5. Практические рекомендации (что благоприятно делать, чего стоит избегать, на что обратить внимание).
-6. Совет дня (краткое вдохновляющее заключение).
+        except Exception as e:
+            logger.error("Error generating interpretation: %s", e)
+            return _INTERPRETATION_ERROR
 
-Используй эмодзи для визуального акцента (но умеренно и только в начале абзацев)."""
+    def refresh_transit(
+        self, positions: List[Dict[str, Any]], aspects: List[Dict[str, Any]]
+    ) -> bool:
+        """
+        Regenerate the transit interpretation, replacing the cached text.
 
-            user_prompt = f"""Проанализируй следующую астрологическую картину дня:
+        Args:
+            positions: Planetary positions data
+            aspects: Aspects data
 
-Текущие позиции планет:
-{positions_text}
+        Returns:
+            True if a new interpretation was cached
 
-Текущие аспекты:
-{aspects_text}
+        Raises:
+            Exception: If the completion fails
+        """
+        messages, fingerprint = self._transit_request(positions, aspects)
+        interpretation = self._generate(
+            self.transit_model,
+            messages,
+            temperature=self.TRANSIT_TEMPERATURE,
+            max_tokens=self.TRANSIT_MAX_TOKENS,
+            ttl=self.TRANSIT_CACHE_TTL,
+            fingerprint=fingerprint,
+            refresh=True,
+        )
+        return bool(interpretation)
+
+    def interpret_transit_stream(
+        self, positions: List[Dict[str, Any]], aspects: List[Dict[str, Any]]
+    ) -> Iterator[str]:
+        """
+        Generate interpretation of current transit, yielding text as it arrives.
 
-На основе этих данных, пожалуйста, предоставь краткую интерпретацию, следуя указанной выше структуре и правилам форматирования. """
+        A cached interpretation is yielded in one piece; otherwise the
+        streamed completion is cached once it finishes.
 
-            messages = [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ]
+        Args:
+            positions: Planetary positions data
+            aspects: Aspects data
 
-            # Generate interpretation
-            interpretation = self.openrouter_client.generate_completion(
-                messages=messages, temperature=0.7, max_tokens=1500
+        Yields:
+            Pieces of the interpretation text in Russian
+        """
+        yielded = False
+        try:
+            messages, fingerprint = self._transit_request(positions, aspects)
+            key = self._completion_cache_key(
+                self.transit_model, fingerprint, self.TRANSIT_TEMPERATURE, self.TRANSIT_MAX_TOKENS
             )
-
-            return interpretation
+            cached = self._get_cached_completion(key)
+            if cached is not None:
+                self.cache_hits += 1
+                yield cached
+                return
+
+            pending, is_owner = self._inflight.claim(key)
+            if not is_owner:
+                self.cache_hits += 1
+                yield pending.result(timeout=OpenRouterClient.REQUEST_DEADLINE)
+                return
+
+            self.cache_misses += 1
+            parts = []
+            # A stream closed before the end leaves nothing to share, and
+            # resolving() fails the waiters in that case
+            with self._inflight.resolving(key, pending):
+                for delta in self.openrouter_client.stream_completion(
+                    messages=messages,
+                    temperature=self.TRANSIT_TEMPERATURE,
+                    max_tokens=self.TRANSIT_MAX_TOKENS,
+                    frequency_penalty=self.FREQUENCY_PENALTY,
+                    model=self.transit_model,
+                ):
+                    parts.append(delta)
+                    yielded = True
+                    yield delta
+                interpretation = "".join(parts)
+                pending.set_result(interpretation)
+                if interpretation:
+                    self._store_cached_completion(key, interpretation, self.TRANSIT_CACHE_TTL)
 
         except Exception as e:
-            logger.error(f"Error generating interpretation: {str(e)}")
-            return (
-                "⚠️ К сожалению, не удалось сгенерировать интерпретацию. "
-                "Пожалуйста, попробуйте позже."
-            )
+            logger.error("Error streaming interpretation: %s", e)
+            if not yielded:
+                yield _INTERPRETATION_ERROR
+
+    @staticmethod
+    def _position_line(pos: Dict[str, Any]) -> str:
+        """Format a single position as a prompt line."""
+        get = pos.get
+        return "- %s в %s %d°%02d'%s" % (
+            get("planet", ""),
+            get("sign", ""),
+            int(get("degree", 0)),
+            int(get("minute", 0)),
+            " (ретроградный)" if get("is_retrograde") else "",
+        )
+
+    @staticmethod
+    def _applying_text(applying: Any) -> str:
+        """Describe whether an aspect is applying or separating."""
+        if applying:
+            return " (сходящийся)"
+        return " (расходящийся)" if applying is False else ""
 
     def _format_positions_for_prompt(self, positions: List[Dict[str, Any]]) -> str:
         """Format positions data for LLM prompt."""
-        lines = []
-        for pos in positions:
-            planet = pos.get("planet", "")
-            sign = pos.get("sign", "")
-            degree = int(pos.get("degree", 0))
-            minute = int(pos.get("minute", 0))
-            retrograde = " (ретроградный)" if pos.get("is_retrograde") else ""
-
-            lines.append(f"- {planet} в {sign} {degree}°{minute:02d}'{retrograde}")
-
-        return "\n".join(lines)
+        return "\n".join(map(self._position_line, positions))
 
     def _format_aspects_for_prompt(self, aspects: List[Dict[str, Any]]) -> str:
         """Format aspects data for LLM prompt."""
         if not aspects:
             return "Нет значимых аспектов."
 
-        lines = []
-        for asp in aspects:
-            planet1 = asp.get("planet1", "")
-            planet2 = asp.get("planet2", "")
-            aspect_type = asp.get("aspect_type", "")
-            orb = asp.get("orb", 0)
-            applying = asp.get("applying")
-
-            applying_text = (
-                " (сходящийся)"
-                if applying
-                else " (расходящийся)" if applying is False else ""
-            )
-
-            lines.append(
-                f"- {planet1} {aspect_type} {planet2} (орб {orb:.1f}°){applying_text}"
-            )
-
-        return "\n".join(lines)
+        applying_text = self._applying_text
+        return "\n".join(
+            f"- {asp.get('planet1', '')} {asp.get('aspect_type', '')} {asp.get('planet2', '')} "
+            f"(орб {asp.get('orb', 0):.1f}°){applying_text(asp.get('applying'))}"
+            for asp in aspects
+        )
 
     def interpret_natal_chart(
         self, positions: List[Dict[str, Any]], houses: List[Dict[str, Any]]
@@ -151,90 +553,52 @@ class InterpretationService:
             Interpretation text in Russian
         """
         try:
+            positions, _ = self._filter_significant(positions, [])
+
             # Format positions for prompt
             positions_text = self._format_positions_for_prompt(positions)
             houses_text = self._format_houses_for_prompt(houses)
 
-            # Create prompt
-            system_prompt = """Ты — опытный астролог с глубокими знаниями западной астрологии. 
-Твоя задача — дать краткую, но содержательную интерпретацию натальной карты.
-
-Твой анализ должен:
-- Быть написан на русском языке.
-- Быть понятным для обычного человека (избегай сложной терминологии).
-- Фокусироваться на ключевых характеристиках личности.
-- Быть позитивным, но реалистичным.
-- Быть кратким (максимум 500-600 слов).
-- Выделять наиболее важные аспекты карты.
-- НЕ ИСПОЛЬЗОВАТЬ ЗАГОЛОВКИ ИЛИ MARKDOWN форматирование (например, #, ##, ***, ---). Используй только абзацы и обычный текст.
-
-Структура ответа:
-1. Общая характеристика личности (2-3 предложения о ключевых чертах, основанных на положении Солнца, Луны и Асцендента).
-2. Эмоциональная сфера и внутренний мир (как человек чувствует, какие у него эмоциональные потребности).
-3. Стиль общения и мышления (особенности коммуникации и восприятия информации).
-4. Отношения и любовь (как проявляется в романтических отношениях, что важно в партнерстве).
-5. Карьера и самореализация (профессиональные склонности и способы достижения целей).
-6. Сильные стороны и потенциал (на что важно опираться).
-7. Области роста (над чем можно поработать для гармоничного развития).
-
-Используй эмодзи для визуального акцента (но умеренно и только в начале абзацев)."""
-
-            user_prompt = f"""Проанализируй следующую натальную карту:
-
-Позиции планет:
-{positions_text}
-
-Дома:
-{houses_text}
-
-На основе этих данных, пожалуйста, предоставь краткую интерпретацию натальной карты, следуя указанной выше структуре и правилам форматирования."""
+            user_prompt = _NATAL_USER_PROMPT_TEMPLATE.format(
+                positions_text=positions_text, houses_text=houses_text
+            )
 
             messages = [
-                {"role": "system", "content": system_prompt},
+                _NATAL_SYSTEM_MESSAGE,
                 {"role": "user", "content": user_prompt},
             ]
 
             # Generate interpretation
-            interpretation = self.openrouter_client.generate_completion(
-                messages=messages, temperature=0.7, max_tokens=2000
+            interpretation = self._generate(
+                self.natal_model,
+                messages,
+                temperature=self.NATAL_TEMPERATURE,
+                max_tokens=self.NATAL_MAX_TOKENS,
+                ttl=self.NATAL_CACHE_TTL,
             )
 
             return interpretation
 
         except Exception as e:
-            logger.error(f"Error generating natal interpretation: {str(e)}")
-            return (
-                "⚠️ К сожалению, не удалось сгенерировать интерпретацию. "
-                "Пожалуйста, попробуйте позже."
-            )
+            logger.error("Error generating natal interpretation: %s", e)
+            return _INTERPRETATION_ERROR
 
     def _format_houses_for_prompt(self, houses: List[Dict[str, Any]]) -> str:
         """Format houses data for LLM prompt."""
         if not houses:
             return "Дома не указаны."
 
-        lines = []
-        for house in houses:
-            house_num = house.get("number", 0)
-            sign = house.get("sign", "")
-            degree = int(house.get("degree", 0))
-            minute = int(house.get("minute", 0))
-
-            # Special names for main angles
-            if house_num == 1:
-                house_name = "1 дом (Асцендент)"
-            elif house_num == 4:
-                house_name = "4 дом (IC)"
-            elif house_num == 7:
-                house_name = "7 дом (Десцендент)"
-            elif house_num == 10:
-                house_name = "10 дом (MC)"
-            else:
-                house_name = f"{house_num} дом"
-
-            lines.append(f"- {house_name}: {sign} {degree}°{minute:02d}'")
-
-        return "\n".join(lines)
+        return "\n".join(map(self._house_line, houses))
+
+    @staticmethod
+    def _house_line(house: Dict[str, Any]) -> str:
+        """Format a single house cusp as a prompt line."""
+        get = house.get
+        house_num = get("number", 0)
+        house_name = _HOUSE_ANGLE_NAMES.get(house_num) or "%s дом" % house_num
+        return "- %s: %s %d°%02d'" % (
+            house_name, get("sign", ""), int(get("degree", 0)), int(get("minute", 0))
+        )
 
     def interpret_personal_transits(
         self,
@@ -252,88 +616,53 @@ class InterpretationService:
             Interpretation text in Russian
         """
         try:
+            natal_positions, transit_aspects = self._filter_significant(
+                natal_positions, transit_aspects
+            )
+
             # Format natal positions
             natal_text = self._format_positions_for_prompt(natal_positions)
             
             # Format transit aspects (synastry format: planet1=natal, planet2=transit)
             transit_aspects_text = self._format_transit_aspects_for_prompt(transit_aspects)
 
-            # Create prompt
-            system_prompt = """Ты — опытный астролог с глубокими знаниями западной астрологии. 
-Твоя задача — дать краткую, но содержательную интерпретацию персональных транзитов, т.е. текущих планет в аспектах к натальной карте конкретного человека.
-
-Твой анализ должен:
-- Быть написан на русском языке.
-- Обращаться к читателю на "ты" (это персональный прогноз для конкретного человека).
-- Быть понятным для обычного человека (избегай сложной терминологии).
-- Фокусироваться на практических аспектах и влиянии на повседневную жизнь.
-- Быть позитивным, но реалистичным.
-- Быть кратким (максимум 400-500 слов).
-- Выделять наиболее важные транзитные влияния.
-- НЕ ИСПОЛЬЗОВАТЬ ЗАГОЛОВКИ ИЛИ MARKDOWN форматирование (например, #, ##, ***, ---). Используй только абзацы и обычный текст.
-
-Структура ответа:
-1. Общая энергия периода (1-2 предложения о ключевых транзитных влияниях).
-2. Влияние на твои отношения и общение (как транзиты влияют на взаимодействие с окружающими).
-3. Влияние на работу, карьеру и финансы (какие возможности или вызовы могут возникнуть).
-4. Влияние на эмоциональное состояние и внутренний мир (как транзиты сказываются на чувствах).
-5. Практические рекомендации (что благоприятно делать, чего стоит избегать).
-6. Персональный совет (краткое вдохновляющее заключение).
-
-Используй эмодзи для визуального акцента (но умеренно и только в начале абзацев)."""
-
-            user_prompt = f"""Проанализируй следующие персональные транзиты:
-
-Натальные позиции планет:
-{natal_text}
-
-Транзитные аспекты к натальной карте:
-{transit_aspects_text}
-
-На основе этих данных, пожалуйста, предоставь краткую интерпретацию персональных транзитов, следуя указанной выше структуре и правилам форматирования."""
+            user_prompt = _PERSONAL_TRANSIT_USER_PROMPT_TEMPLATE.format(
+                natal_text=natal_text, transit_aspects_text=transit_aspects_text
+            )
 
             messages = [
-                {"role": "system", "content": system_prompt},
+                _PERSONAL_TRANSIT_SYSTEM_MESSAGE,
                 {"role": "user", "content": user_prompt},
             ]
 
-            # Generate interpretation
-            interpretation = self.openrouter_client.generate_completion(
-                messages=messages, temperature=0.7, max_tokens=1500
+            # Generate interpretation. Keyed on the exact prompt: natal degrees
+            # and orbs are what make the reading personal, so a coarse
+            # fingerprint would hand one user's reading to another
+            interpretation = self._generate(
+                self.transit_model,
+                messages,
+                temperature=self.TRANSIT_TEMPERATURE,
+                max_tokens=self.TRANSIT_MAX_TOKENS,
+                ttl=self.PERSONAL_TRANSIT_CACHE_TTL,
             )
 
             return interpretation
 
         except Exception as e:
-            logger.error(f"Error generating personal transit interpretation: {str(e)}")
-            return (
-                "⚠️ К сожалению, не удалось сгенерировать интерпретацию. "
-                "Пожалуйста, попробуйте позже."
-            )
+            logger.error("Error generating personal transit interpretation: %s", e)
+            return _INTERPRETATION_ERROR
 
     def _format_transit_aspects_for_prompt(self, aspects: List[Dict[str, Any]]) -> str:
         """Format transit aspects for LLM prompt."""
         if not aspects:
             return "Нет значимых транзитных аспектов."
 
-        lines = []
-        for asp in aspects:
-            # In synastry format: planet1 is natal, planet2 is transit
-            natal_planet = asp.get("planet1", "")
-            transit_planet = asp.get("planet2", "")
-            aspect_type = asp.get("aspect_type", "")
-            orb = asp.get("orb", 0)
-            applying = asp.get("applying")
-
-            applying_text = (
-                " (сходящийся)"
-                if applying
-                else " (расходящийся)" if applying is False else ""
-            )
-
-            lines.append(
-                f"- Транзитный {transit_planet} {aspect_type} натальный {natal_planet} (орб {orb:.1f}°){applying_text}"
-            )
-
-        return "\n".join(lines)
+        # In synastry format: planet1 is natal, planet2 is transit
+        applying_text = self._applying_text
+        return "\n".join(
+            f"- Транзитный {asp.get('planet2', '')} {asp.get('aspect_type', '')} "
+            f"натальный {asp.get('planet1', '')} "
+            f"(орб {asp.get('orb', 0):.1f}°){applying_text(asp.get('applying'))}"
+            for asp in aspects
+        )
 
@@ -1,5 +1,6 @@
 """Service for natal chart calculations and management."""
 
+import asyncio
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
@@ -9,6 +10,14 @@ from src.formatters.russian_formatter import RussianFormatter
 
 logger = logging.getLogger(__name__)
 
+# Main angles shown in the natal report, in display order
+_ANGLE_NAMES = {
+    1: "Асцендент (1 дом)",
+    4: "IC (4 дом)",
+    7: "Десцендент (7 дом)",
+    10: "MC (10 дом)",
+}
+
 
 class NatalChartService:
     """
@@ -62,7 +71,8 @@ class NatalChartService:
 
         try:
             # Create chart in Nocturna API
-            chart_response = self.nocturna_client.create_chart(
+            chart_response = await asyncio.to_thread(
+                self.nocturna_client.create_chart,
                 date=birth_date,
                 time=birth_time,
                 latitude=latitude,
@@ -96,7 +106,9 @@ class NatalChartService:
             List of planetary positions
         """
         try:
-            positions_data = self.nocturna_client.get_chart_positions(chart_id)
+            positions_data = await asyncio.to_thread(
+                self.nocturna_client.get_chart_positions, chart_id
+            )
             return positions_data.get("positions", [])
         except Exception as e:
             logger.error(f"Error getting chart positions for {chart_id}: {str(e)}")
@@ -113,7 +125,9 @@ class NatalChartService:
             List of house data
         """
         try:
-            houses_data = self.nocturna_client.get_chart_houses(chart_id)
+            houses_data = await asyncio.to_thread(
+                self.nocturna_client.get_chart_houses, chart_id
+            )
             return houses_data.get("houses", [])
         except Exception as e:
             logger.error(f"Error getting chart houses for {chart_id}: {str(e)}")
@@ -139,37 +153,29 @@ class NatalChartService:
             Formatted text report in Russian
         """
         # Format birth information
-        report = "🌟 <b>Натальная карта</b>\n\n"
+        parts = ["🌟 <b>Натальная карта</b>\n\n"]
         if birth_date:
-            report += f"📅 <b>Дата рождения:</b> {birth_date}\n"
+            parts.append(f"📅 <b>Дата рождения:</b> {birth_date}\n")
         if birth_time:
-            report += f"🕐 <b>Время рождения:</b> {birth_time}\n"
+            parts.append(f"🕐 <b>Время рождения:</b> {birth_time}\n")
         
         # Format positions
-        report += "\n" + self.formatter.format_positions_list(positions)
+        parts.append("\n")
+        parts.append(self.formatter.format_positions_list(positions))
         
         # Format houses
         if houses:
-            report += "\n\n🏠 <b>Дома</b>\n\n"
+            parts.append("\n\n🏠 <b>Дома</b>\n\n")
             # Show main angles (1, 4, 7, 10)
-            main_houses = [h for h in houses if h.get("number") in [1, 4, 7, 10]]
-            for house in main_houses:
-                house_num = house.get("number", 0)
-                sign = house.get("sign", "").capitalize()
-                degree = house.get("degree", 0)
-                minute = house.get("minute", 0)
-                
-                if house_num == 1:
-                    house_name = "Асцендент (1 дом)"
-                elif house_num == 4:
-                    house_name = "IC (4 дом)"
-                elif house_num == 7:
-                    house_name = "Десцендент (7 дом)"
-                elif house_num == 10:
-                    house_name = "MC (10 дом)"
-                else:
-                    house_name = f"{house_num} дом"
-                
-                report += f"  • {house_name}: {sign} {int(degree)}°{int(minute):02d}'\n"
-
-        return report
+            houses_by_number = {h.get("number"): h for h in houses}
+            for house_num, house_name in _ANGLE_NAMES.items():
+                house = houses_by_number.get(house_num)
+                if house is None:
+                    continue
+                get = house.get
+                parts.append(
+                    f"  • {house_name}: {get('sign', '').capitalize()} "
+                    f"{int(get('degree', 0))}°{int(get('minute', 0)):02d}'\n"
+                )
+
+        return "".join(parts)
@@ -1,15 +1,56 @@
 """Service for personal transit calculations."""
 
+import asyncio
+import heapq
 import logging
-from typing import Dict, Any, List, Optional
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
-from src.api.nocturna_client import NocturnaClient
+from src.api.nocturna_client import NocturnaAPIError, NocturnaClient
 from src.services.interpretation_service import InterpretationService
 from src.formatters.russian_formatter import RussianFormatter
 
 logger = logging.getLogger(__name__)
 
+# Aspect names for the personal transit report
+_ASPECT_NAMES_RU = {
+    "CONJUNCTION": "Соединение",
+    "OPPOSITION": "Оппозиция",
+    "TRINE": "Трин",
+    "SQUARE": "Квадрат",
+    "SEXTILE": "Секстиль",
+}
+
+# Marker for applying / separating aspects (None: unknown)
+_APPLYING_STATUS = {True: "▶️ ", False: "◀️ ", None: ""}
+
+# Static parts of the personal transit report
+_REPORT_HEADER_TEMPLATE = (
+    "🌟 <b>Персональные транзиты</b>\n\n"
+    "📅 <b>Дата:</b> {date}\n"
+    "🕐 <b>Время:</b> {time}\n\n"
+)
+_ASPECTS_HEADER = "🔮 <b>Транзитные аспекты к натальной карте:</b>\n\n"
+_NO_ASPECTS_FOOTER = "ℹ️ Сейчас нет значимых транзитных аспектов к вашей натальной карте.\n"
+_APPLYING_LEGEND = "\n💡 <i>▶️ - аспект формируется, ◀️ - аспект расходится</i>"
+
+
+@dataclass(frozen=True, slots=True)
+class PersonalTransitResult:
+    """Transits of the current sky to a natal chart."""
+
+    transit_date: str
+    transit_time: str
+    transit_positions: List[Dict[str, Any]]
+    transit_houses: List[Dict[str, Any]]
+    natal_positions: List[Dict[str, Any]]
+    natal_houses: List[Dict[str, Any]]
+    natal_chart_id: str
+    transit_aspects: List[Dict[str, Any]]
+    calculated_at: str
+
 
 class PersonalTransitService:
     """
@@ -19,6 +60,10 @@ class PersonalTransitService:
     providing personalized astrological analysis.
     """
 
+    # How long a natal chart created in the API is reused for synastry
+    NATAL_CHART_TTL = 3600.0
+    NATAL_CHART_CACHE_SIZE = 256
+
     def __init__(
         self,
         nocturna_client: NocturnaClient,
@@ -37,6 +82,10 @@ class PersonalTransitService:
         self.timezone = timezone
         self.interpretation_service = interpretation_service
         self.formatter = RussianFormatter()
+        # Chart cleanups still running; referenced so they aren't garbage collected
+        self._cleanup_tasks: set = set()
+        # Natal birth data -> (expiry on the monotonic clock, API chart ID)
+        self._natal_charts: Dict[Tuple, Tuple[float, str]] = {}
 
     async def calculate_personal_transits(
         self,
@@ -51,7 +100,9 @@ class PersonalTransitService:
         natal_latitude: Optional[float] = None,
         natal_longitude: Optional[float] = None,
         natal_timezone: Optional[str] = None,
-    ) -> Dict[str, Any]:
+        natal_positions: Optional[List[Dict[str, Any]]] = None,
+        natal_houses: Optional[List[Dict[str, Any]]] = None,
+    ) -> PersonalTransitResult:
         """
         Calculate personal transits (transits to natal chart).
         
@@ -70,13 +121,12 @@ class PersonalTransitService:
             natal_latitude: Natal birth latitude (required)
             natal_longitude: Natal birth longitude (required)
             natal_timezone: Natal birth timezone (required)
+            natal_positions: Cached natal positions (optional, skips recalculation)
+            natal_houses: Cached natal houses (optional, skips recalculation)
             
         Returns:
-            Dictionary with transit data including:
-            - transit_date: Date of transit calculation
-            - transit_time: Time of transit calculation
-            - transit_positions: Current planetary positions
-            - transit_aspects: Aspects between transit and natal positions
+            Transit data, including the transit date/time, current planetary
+            positions and the aspects between transit and natal positions
             
         Raises:
             ValueError: If required natal data is missing
@@ -89,51 +139,20 @@ class PersonalTransitService:
         
         # Use current time if not specified
         if not transit_date or not transit_time:
-            now = datetime.now()
-            transit_date = now.strftime("%Y-%m-%d")
-            transit_time = now.strftime("%H:%M:%S")
+            transit_date, transit_time = datetime.now().isoformat(timespec="seconds").split("T")
 
         logger.info(f"Calculating personal transits for chart {natal_chart_id} at {transit_date} {transit_time}")
 
         try:
-            # Recreate natal chart in API (since it doesn't persist long-term)
-            natal_chart_response = self.nocturna_client.create_chart(
+            client = self.nocturna_client
+            natal_kwargs = dict(
                 date=natal_birth_date,
                 time=natal_birth_time,
                 latitude=natal_latitude,
                 longitude=natal_longitude,
                 timezone=natal_timezone,
             )
-            
-            fresh_natal_chart_id = natal_chart_response.get("id")
-            if not fresh_natal_chart_id:
-                raise ValueError("Failed to recreate natal chart")
-            
-            logger.info(f"Recreated natal chart {fresh_natal_chart_id} for transit calculation")
-            
-            # Calculate natal positions and houses directly (API doesn't store them in charts)
-            natal_positions_data = self.nocturna_client.calculate_planetary_positions(
-                date=natal_birth_date,
-                time=natal_birth_time,
-                latitude=natal_latitude,
-                longitude=natal_longitude,
-                timezone=natal_timezone
-            )
-            natal_positions = natal_positions_data.get("positions", [])
-            
-            natal_houses_data = self.nocturna_client.calculate_houses(
-                date=natal_birth_date,
-                time=natal_birth_time,
-                latitude=natal_latitude,
-                longitude=natal_longitude,
-                timezone=natal_timezone
-            )
-            natal_houses = natal_houses_data.get("houses", [])
-            
-            logger.info(f"Calculated natal positions: {len(natal_positions)}, natal houses: {len(natal_houses)}")
-            
-            # Create transit chart in API
-            transit_chart_response = self.nocturna_client.create_chart(
+            transit_kwargs = dict(
                 date=transit_date,
                 time=transit_time,
                 latitude=latitude,
@@ -141,125 +160,240 @@ class PersonalTransitService:
                 timezone=timezone,
             )
 
-            transit_chart_id = transit_chart_response.get("id")
-            if not transit_chart_id:
-                raise ValueError("Failed to create transit chart")
+            # Reuse the user's natal chart if it was created in the API recently,
+            # otherwise recreate it (the API doesn't persist it long-term). Create the
+            # transit chart and calculate positions/houses directly (the API doesn't
+            # store them in charts). None of these depend on each other, so run them
+            # concurrently in worker threads; natal positions/houses are skipped when
+            # passed in from the user's cached natal chart.
+            natal_key = tuple(natal_kwargs.values())
+            cached_natal_chart_id = self._get_cached_natal_chart(natal_key)
 
-            logger.info(f"Created transit chart {transit_chart_id}")
+            calls = {
+                "transit_chart": asyncio.to_thread(client.create_chart, **transit_kwargs),
+                "transit_positions": asyncio.to_thread(
+                    client.calculate_planetary_positions, **transit_kwargs
+                ),
+                "transit_houses": asyncio.to_thread(client.calculate_houses, **transit_kwargs),
+            }
+            if cached_natal_chart_id is None:
+                calls["natal_chart"] = asyncio.to_thread(client.create_chart, **natal_kwargs)
+            if natal_positions is None:
+                calls["natal_positions"] = asyncio.to_thread(
+                    client.calculate_planetary_positions, **natal_kwargs
+                )
+            if natal_houses is None:
+                calls["natal_houses"] = asyncio.to_thread(client.calculate_houses, **natal_kwargs)
 
-            # Calculate transit positions and houses directly (API doesn't store them in charts)
-            transit_positions_data = self.nocturna_client.calculate_planetary_positions(
-                date=transit_date,
-                time=transit_time,
-                latitude=latitude,
-                longitude=longitude,
-                timezone=timezone
+            results = dict(
+                zip(calls, await asyncio.gather(*calls.values(), return_exceptions=True))
             )
-            transit_positions = transit_positions_data.get("positions", [])
-            
-            transit_houses_data = self.nocturna_client.calculate_houses(
-                date=transit_date,
-                time=transit_time,
-                latitude=latitude,
-                longitude=longitude,
-                timezone=timezone
-            )
-            transit_houses = transit_houses_data.get("houses", [])
-            
+
+            def created_chart_id(name: str) -> Optional[str]:
+                response = results.get(name)
+                return response.get("id") if isinstance(response, dict) else None
+
+            transit_chart_id = created_chart_id("transit_chart")
+            # Charts to delete once this request is done with them
+            temporary_chart_ids = [transit_chart_id]
+            created_natal_chart_id = created_chart_id("natal_chart")
+            if created_natal_chart_id and not self._store_natal_chart(
+                natal_key, created_natal_chart_id
+            ):
+                temporary_chart_ids.append(created_natal_chart_id)
+            fresh_natal_chart_id = cached_natal_chart_id or created_natal_chart_id
+
+            errors = [r for r in results.values() if isinstance(r, BaseException)]
+            if errors or not fresh_natal_chart_id or not transit_chart_id:
+                # Don't leave behind charts whose sibling request failed
+                self._delete_charts_in_background(*temporary_chart_ids)
+                if errors:
+                    raise errors[0]
+                if not fresh_natal_chart_id:
+                    raise ValueError("Failed to recreate natal chart")
+                raise ValueError("Failed to create transit chart")
+
+            logger.info(f"Using natal chart {fresh_natal_chart_id} and transit chart {transit_chart_id}")
+
+            transit_positions = results["transit_positions"].get("positions", [])
+            transit_houses = results["transit_houses"].get("houses", [])
+            if natal_positions is None:
+                natal_positions = results["natal_positions"].get("positions", [])
+            if natal_houses is None:
+                natal_houses = results["natal_houses"].get("houses", [])
+
+            logger.info(f"Calculated natal positions: {len(natal_positions)}, natal houses: {len(natal_houses)}")
             logger.info(f"Calculated transit positions: {len(transit_positions)}, transit houses: {len(transit_houses)}")
 
             # Calculate synastry (transits to natal)
-            synastry_data = self.nocturna_client.calculate_synastry(
-                chart_id=fresh_natal_chart_id,
-                target_chart_id=transit_chart_id,
-                aspects=["CONJUNCTION", "OPPOSITION", "TRINE", "SQUARE", "SEXTILE"],
-                orb_multiplier=1.0,
-            )
+            try:
+                try:
+                    synastry_data = await self._calculate_synastry(
+                        fresh_natal_chart_id, transit_chart_id
+                    )
+                except NocturnaAPIError:
+                    if cached_natal_chart_id is None:
+                        raise
+                    # The API may have dropped the reused chart; retry with a new one
+                    logger.info(f"Natal chart {cached_natal_chart_id} unusable, recreating it")
+                    if self._natal_charts.get(natal_key, (0, None))[1] == cached_natal_chart_id:
+                        self._natal_charts.pop(natal_key, None)
+                    natal_chart_response = await asyncio.to_thread(
+                        client.create_chart, **natal_kwargs
+                    )
+                    fresh_natal_chart_id = natal_chart_response.get("id")
+                    if not fresh_natal_chart_id:
+                        raise ValueError("Failed to recreate natal chart")
+                    if not self._store_natal_chart(natal_key, fresh_natal_chart_id):
+                        temporary_chart_ids.append(fresh_natal_chart_id)
+                    synastry_data = await self._calculate_synastry(
+                        fresh_natal_chart_id, transit_chart_id
+                    )
+            finally:
+                # Clean up the transit chart (we don't need to store it); the
+                # result doesn't depend on the delete, so don't wait for it
+                self._delete_charts_in_background(*temporary_chart_ids)
 
             transit_aspects = synastry_data.get("aspects", [])
 
-            # Clean up transit chart (we don't need to store it)
-            try:
-                self.nocturna_client.delete_chart(transit_chart_id)
-                self.nocturna_client.delete_chart(fresh_natal_chart_id)
-            except:
-                pass
-
-            result = {
-                "transit_date": transit_date,
-                "transit_time": transit_time,
-                "transit_positions": transit_positions,
-                "transit_houses": transit_houses,
-                "natal_positions": natal_positions,
-                "natal_houses": natal_houses,
-                "natal_chart_id": natal_chart_id,
-                "transit_aspects": transit_aspects,
-                "calculated_at": datetime.utcnow().isoformat(),
-            }
-
-            return result
+            return PersonalTransitResult(
+                transit_date=transit_date,
+                transit_time=transit_time,
+                transit_positions=transit_positions,
+                transit_houses=transit_houses,
+                natal_positions=natal_positions,
+                natal_houses=natal_houses,
+                natal_chart_id=natal_chart_id,
+                transit_aspects=transit_aspects,
+                calculated_at=datetime.utcnow().isoformat(),
+            )
 
         except Exception as e:
             logger.error(f"Error calculating personal transits: {str(e)}")
             raise
 
+    async def _calculate_synastry(self, natal_chart_id: str, transit_chart_id: str) -> Dict[str, Any]:
+        """Calculate aspects from the transit chart to the natal chart."""
+        return await asyncio.to_thread(
+            self.nocturna_client.calculate_synastry,
+            chart_id=natal_chart_id,
+            target_chart_id=transit_chart_id,
+            aspects=["CONJUNCTION", "OPPOSITION", "TRINE", "SQUARE", "SEXTILE"],
+            orb_multiplier=1.0,
+        )
+
+    def _get_cached_natal_chart(self, key: Tuple) -> Optional[str]:
+        """Return the API chart ID for natal birth data if it is still fresh."""
+        entry = self._natal_charts.get(key)
+        if entry is None:
+            return None
+        expires_at, chart_id = entry
+        if expires_at < time.monotonic():
+            self._natal_charts.pop(key, None)
+            self._delete_charts_in_background(chart_id)
+            return None
+        return chart_id
+
+    def _store_natal_chart(self, key: Tuple, chart_id: str) -> bool:
+        """
+        Remember an API natal chart for reuse.
+
+        Returns:
+            False if a concurrent request already stored a chart for the same
+            birth data; the caller then owns chart_id and must delete it
+        """
+        if self._get_cached_natal_chart(key) is not None:
+            return False
+        while len(self._natal_charts) >= self.NATAL_CHART_CACHE_SIZE:
+            oldest = next(iter(self._natal_charts))
+            self._delete_charts_in_background(self._natal_charts.pop(oldest)[1])
+        self._natal_charts[key] = (time.monotonic() + self.NATAL_CHART_TTL, chart_id)
+        return True
+
+    def sweep_natal_charts(self) -> int:
+        """
+        Forget expired natal charts and delete them from the API.
+
+        Returns:
+            Number of charts removed
+        """
+        now = time.monotonic()
+        expired = [key for key, (expires_at, _) in self._natal_charts.items() if expires_at < now]
+        chart_ids = [self._natal_charts.pop(key)[1] for key in expired]
+        if chart_ids:
+            self._delete_charts_in_background(*chart_ids)
+        return len(chart_ids)
+
+    async def close(self) -> None:
+        """Delete every cached natal chart from the API and wait for pending cleanups."""
+        chart_ids = [chart_id for _, chart_id in self._natal_charts.values()]
+        self._natal_charts.clear()
+        await asyncio.gather(
+            self._delete_charts(*chart_ids), *self._cleanup_tasks, return_exceptions=True
+        )
+
+    def _delete_charts_in_background(self, *chart_ids: Optional[str]) -> None:
+        """Start deleting temporary API charts without waiting for it."""
+        task = asyncio.create_task(self._delete_charts(*chart_ids))
+        self._cleanup_tasks.add(task)
+        task.add_done_callback(self._cleanup_tasks.discard)
+
+    async def _delete_charts(self, *chart_ids: Optional[str]) -> None:
+        """Delete temporary API charts concurrently, ignoring failures."""
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(self.nocturna_client.delete_chart, chart_id)
+                for chart_id in chart_ids
+                if chart_id
+            ),
+            return_exceptions=True,
+        )
+
     def format_personal_transit_report(
-        self, transit_data: Dict[str, Any], max_aspects: int = 10
+        self, transit_data: PersonalTransitResult, max_aspects: int = 10
     ) -> str:
         """
         Format personal transit data as readable text report.
         
         Args:
-            transit_data: Personal transit data dictionary
+            transit_data: Result of calculate_personal_transits
             max_aspects: Maximum number of aspects to display
             
         Returns:
             Formatted text report in Russian
         """
-        transit_date = transit_data.get("transit_date", "N/A")
-        transit_time = transit_data.get("transit_time", "N/A")
-        transit_aspects = transit_data.get("transit_aspects", [])
-
-        report = "🌟 <b>Персональные транзиты</b>\n\n"
-        report += f"📅 <b>Дата:</b> {transit_date}\n"
-        report += f"🕐 <b>Время:</b> {transit_time}\n\n"
+        transit_aspects = transit_data.transit_aspects
+        header = _REPORT_HEADER_TEMPLATE.format(
+            date=transit_data.transit_date, time=transit_data.transit_time
+        )
 
         if not transit_aspects:
-            report += "ℹ️ Сейчас нет значимых транзитных аспектов к вашей натальной карте.\n"
-            return report
+            return header + _NO_ASPECTS_FOOTER
 
-        report += "🔮 <b>Транзитные аспекты к натальной карте:</b>\n\n"
+        parts = [header, _ASPECTS_HEADER]
 
-        # Show only major transits (limited by max_aspects)
-        for aspect in transit_aspects[:max_aspects]:
+        format_planet_name = self.formatter.format_planet_name
+        # Show only the tightest transits (limited by max_aspects)
+        for aspect in heapq.nsmallest(
+            max_aspects, transit_aspects, key=lambda a: abs(a.get("orb") or 0)
+        ):
             # Synastry API returns planet1 (natal) and planet2 (transit)
-            planet1 = self.formatter.format_planet_name(aspect.get("planet1", ""))
-            planet2 = self.formatter.format_planet_name(aspect.get("planet2", ""))
+            planet1 = format_planet_name(aspect.get("planet1", ""))
+            planet2 = format_planet_name(aspect.get("planet2", ""))
             aspect_type = aspect.get("aspect_type", "")
-            orb = aspect.get("orb", 0)
-            applying = aspect.get("applying", None)
-            
-            # Translate aspect type to Russian
-            aspect_names = {
-                "CONJUNCTION": "Соединение",
-                "OPPOSITION": "Оппозиция",
-                "TRINE": "Трин",
-                "SQUARE": "Квадрат",
-                "SEXTILE": "Секстиль",
-            }
-            aspect_name_ru = aspect_names.get(aspect_type, aspect_type)
-            
-            status = ""
-            if applying is not None:
-                status = "▶️ " if applying else "◀️ "
-            
-            report += f"  {status}<b>{planet2}</b> (транзит) {aspect_name_ru} натальный <b>{planet1}</b>\n"
-            report += f"      Орб: {orb:.1f}°\n\n"
+            applying = aspect.get("applying")
+            status = _APPLYING_STATUS[None if applying is None else bool(applying)]
+            aspect_name_ru = _ASPECT_NAMES_RU.get(aspect_type, aspect_type)
+
+            parts.append(
+                f"  {status}<b>{planet2}</b> (транзит) {aspect_name_ru} натальный <b>{planet1}</b>\n"
+                f"      Орб: {aspect.get('orb', 0):.1f}°\n\n"
+            )
 
         if len(transit_aspects) > max_aspects:
-            report += f"\n<i>... и еще {len(transit_aspects) - max_aspects} аспектов</i>\n"
+            parts.append(f"\n<i>... и еще {len(transit_aspects) - max_aspects} аспектов</i>\n")
 
         if any(aspect.get("applying") is not None for aspect in transit_aspects):
-            report += "\n💡 <i>▶️ - аспект формируется, ◀️ - аспект расходится</i>"
+            parts.append(_APPLYING_LEGEND)
 
-        return report
+        return "".join(parts)
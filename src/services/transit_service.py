@@ -2,7 +2,7 @@
 
 import logging
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterator, Optional, List, Tuple
 
 from src.api.nocturna_client import NocturnaClient
 from src.formatters.russian_formatter import RussianFormatter
@@ -38,6 +38,69 @@ class TransitService:
         self.timezone = timezone
         self.formatter = RussianFormatter()
         self.interpretation_service = interpretation_service
+        # Last (date, minute, latitude, longitude) -> (positions, aspects)
+        self._snapshot: Optional[Tuple[tuple, Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]] = None
+
+    @staticmethod
+    def _now_strings() -> Tuple[str, str]:
+        """Current local date and time as API strings."""
+        # isoformat yields "YYYY-MM-DDTHH:MM:SS" in one C call, no format parsing
+        date_str, time_str = datetime.now().isoformat(timespec="seconds").split("T")
+        return date_str, time_str
+
+    def _positions_at(
+        self, date_str: str, time_str: str, latitude: float, longitude: float
+    ) -> List[Dict[str, Any]]:
+        """Calculate planetary positions at the given moment."""
+        logger.info("Calculating positions for %s %s", date_str, time_str)
+
+        positions_data = self.nocturna_client.calculate_planetary_positions(
+            date=date_str,
+            time=time_str,
+            latitude=latitude,
+            longitude=longitude,
+            timezone=self.timezone,
+        )
+
+        return positions_data.get("positions", [])
+
+    def _aspects_at(
+        self, date_str: str, time_str: str, latitude: float, longitude: float
+    ) -> List[Dict[str, Any]]:
+        """Calculate planetary aspects at the given moment."""
+        logger.info("Calculating aspects for %s %s", date_str, time_str)
+
+        aspects_data = self.nocturna_client.calculate_aspects(
+            date=date_str,
+            time=time_str,
+            latitude=latitude,
+            longitude=longitude,
+            timezone=self.timezone,
+        )
+
+        return aspects_data.get("aspects", [])
+
+    def _current_positions_and_aspects(
+        self, latitude: float, longitude: float
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Get positions and aspects for one and the same moment.
+
+        Results are reused within the same minute, so a report and its
+        interpretation requested back to back share the API calls.
+        """
+        date_str, time_str = self._now_strings()
+        key = (date_str, time_str[:5], latitude, longitude)
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot[0] == key:
+            return snapshot[1]
+
+        result = (
+            self._positions_at(date_str, time_str, latitude, longitude),
+            self._aspects_at(date_str, time_str, latitude, longitude),
+        )
+        self._snapshot = (key, result)
+        return result
 
     def get_current_positions(
         self, latitude: float = 55.7558, longitude: float = 37.6173
@@ -53,24 +116,11 @@ class TransitService:
             List of planetary positions
         """
         try:
-            now = datetime.now()
-            date_str = now.strftime("%Y-%m-%d")
-            time_str = now.strftime("%H:%M:%S")
-
-            logger.info(f"Calculating positions for {date_str} {time_str}")
-
-            positions_data = self.nocturna_client.calculate_planetary_positions(
-                date=date_str,
-                time=time_str,
-                latitude=latitude,
-                longitude=longitude,
-                timezone=self.timezone,
-            )
-
-            return positions_data.get("positions", [])
+            date_str, time_str = self._now_strings()
+            return self._positions_at(date_str, time_str, latitude, longitude)
 
         except Exception as e:
-            logger.error(f"Error calculating positions: {str(e)}")
+            logger.error("Error calculating positions: %s", e)
             raise
 
     def get_current_aspects(
@@ -87,24 +137,11 @@ class TransitService:
             List of planetary aspects
         """
         try:
-            now = datetime.now()
-            date_str = now.strftime("%Y-%m-%d")
-            time_str = now.strftime("%H:%M:%S")
-
-            logger.info(f"Calculating aspects for {date_str} {time_str}")
-
-            aspects_data = self.nocturna_client.calculate_aspects(
-                date=date_str,
-                time=time_str,
-                latitude=latitude,
-                longitude=longitude,
-                timezone=self.timezone,
-            )
-
-            return aspects_data.get("aspects", [])
+            date_str, time_str = self._now_strings()
+            return self._aspects_at(date_str, time_str, latitude, longitude)
 
         except Exception as e:
-            logger.error(f"Error calculating aspects: {str(e)}")
+            logger.error("Error calculating aspects: %s", e)
             raise
 
     def get_current_transit(
@@ -121,8 +158,7 @@ class TransitService:
             Formatted transit report in Russian
         """
         try:
-            positions = self.get_current_positions(latitude, longitude)
-            aspects = self.get_current_aspects(latitude, longitude)
+            positions, aspects = self._current_positions_and_aspects(latitude, longitude)
 
             # Format basic report
             basic_report = self.formatter.format_transit_report(positions, aspects)
@@ -136,7 +172,7 @@ class TransitService:
                     )
                     report = f"{basic_report}\n\n📖 *Интерпретация:*\n\n{interpretation}"
                 except Exception as e:
-                    logger.error(f"Error in interpretation: {str(e)}")
+                    logger.error("Error in interpretation: %s", e)
                     report = basic_report
             else:
                 report = basic_report
@@ -144,7 +180,7 @@ class TransitService:
             return report
 
         except Exception as e:
-            logger.error(f"Error calculating transit: {str(e)}")
+            logger.error("Error calculating transit: %s", e)
             return f"❌ Ошибка при расчете транзита: {str(e)}"
 
     def get_interpretation(
@@ -164,8 +200,7 @@ class TransitService:
             return None
 
         try:
-            positions = self.get_current_positions(latitude, longitude)
-            aspects = self.get_current_aspects(latitude, longitude)
+            positions, aspects = self._current_positions_and_aspects(latitude, longitude)
 
             logger.info("Generating LLM interpretation...")
             interpretation = self.interpretation_service.interpret_transit(
@@ -174,6 +209,54 @@ class TransitService:
             return interpretation
 
         except Exception as e:
-            logger.error(f"Error generating interpretation: {str(e)}")
+            logger.error("Error generating interpretation: %s", e)
             return None
 
+    def refresh_interpretation(
+        self, latitude: float = 55.7558, longitude: float = 37.6173
+    ) -> bool:
+        """
+        Regenerate the cached LLM interpretation for current transit.
+
+        Args:
+            latitude: Geographic latitude (default: Moscow)
+            longitude: Geographic longitude (default: Moscow)
+
+        Returns:
+            True if a new interpretation was cached, False if the service
+            is unavailable or returned nothing
+
+        Raises:
+            Exception: If calculating the transit or the completion fails
+        """
+        if not self.interpretation_service:
+            return False
+
+        positions, aspects = self._current_positions_and_aspects(latitude, longitude)
+        return self.interpretation_service.refresh_transit(positions, aspects)
+
+    def stream_interpretation(
+        self, latitude: float = 55.7558, longitude: float = 37.6173
+    ) -> Iterator[str]:
+        """
+        Get LLM interpretation for current transit, piece by piece.
+
+        Args:
+            latitude: Geographic latitude (default: Moscow)
+            longitude: Geographic longitude (default: Moscow)
+
+        Yields:
+            Pieces of the interpretation text; nothing if service unavailable
+        """
+        if not self.interpretation_service:
+            return
+
+        try:
+            positions, aspects = self._current_positions_and_aspects(latitude, longitude)
+        except Exception as e:
+            logger.error("Error generating interpretation: %s", e)
+            return
+
+        logger.info("Streaming LLM interpretation...")
+        yield from self.interpretation_service.interpret_transit_stream(positions, aspects)
+
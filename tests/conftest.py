@@ -0,0 +1,36 @@
+"""Shared fixtures for the test suite."""
+
+import datetime
+
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+
+from src.database import database
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_for_sqlite(type_, compiler, **kw):
+    return "JSON"
+
+
+@pytest_asyncio.fixture
+async def engine(tmp_path):
+    """
+    SQLite engine standing in for PostgreSQL.
+
+    JSONB is stored as JSON, and now()/timezone() are provided as SQL
+    functions, so the models' server defaults work unchanged.
+    """
+    engine = database.get_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", use_null_pool=True)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _register_functions(dbapi_connection, connection_record):
+        dbapi_connection.create_function(
+            "now", 0, lambda: datetime.datetime.utcnow().isoformat(" ")
+        )
+        dbapi_connection.create_function("timezone", 2, lambda zone, value: value)
+
+    yield engine
+    await engine.dispose()
@@ -0,0 +1,83 @@
+"""Tests for database session management."""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import Integer, String, insert, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from src.database import database
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class _Note(_Base):
+    __tablename__ = "notes"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    text: Mapped[str] = mapped_column(String(50))
+
+
+@pytest_asyncio.fixture
+async def db(engine, monkeypatch):
+    """Test database installed as the global session state."""
+    async with engine.begin() as conn:
+        await conn.run_sync(_Base.metadata.create_all)
+    monkeypatch.setattr(
+        database, "_state", database._DBState(engine, database.get_session_maker(engine))
+    )
+
+
+async def _note_texts():
+    async with database.get_session() as session:
+        return list(await session.scalars(select(_Note.text).order_by(_Note.id)))
+
+
+@pytest.mark.asyncio
+async def test_pending_changes_are_committed(db):
+    async with database.get_session() as session:
+        session.add(_Note(id=1, text="pending"))
+
+    assert await _note_texts() == ["pending"]
+
+
+@pytest.mark.asyncio
+async def test_autoflushed_changes_are_committed(db):
+    async with database.get_session() as session:
+        session.add(_Note(id=1, text="autoflushed"))
+        # The query autoflushes, leaving session.new empty
+        await session.scalar(select(_Note).where(_Note.id == 1))
+        assert not session.new
+
+    assert await _note_texts() == ["autoflushed"]
+
+
+@pytest.mark.asyncio
+async def test_core_statements_are_committed(db):
+    async with database.get_session() as session:
+        await session.execute(insert(_Note).values(id=1, text="core"))
+
+    assert await _note_texts() == ["core"]
+
+
+@pytest.mark.asyncio
+async def test_read_only_session_skips_commit(db, monkeypatch):
+    commits = []
+
+    async with database.get_session() as session:
+        monkeypatch.setattr(session, "commit", lambda: commits.append(True))
+        await session.scalar(select(_Note))
+
+    assert commits == []
+
+
+@pytest.mark.asyncio
+async def test_error_rolls_back(db):
+    with pytest.raises(RuntimeError):
+        async with database.get_session() as session:
+            session.add(_Note(id=1, text="lost"))
+            await session.flush()
+            raise RuntimeError("boom")
+
+    assert await _note_texts() == []
@@ -0,0 +1,77 @@
+"""Tests for DatabaseService writes."""
+
+from datetime import date, time
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+
+from src.database import database
+from src.database.models import Base, BirthData, User
+from src.database.service import DatabaseService
+
+
+@pytest_asyncio.fixture
+async def session_maker(engine):
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    return database.get_session_maker(engine)
+
+
+async def _save(service: DatabaseService, **overrides) -> BirthData:
+    values = dict(
+        telegram_id=42,
+        birth_date=date(1990, 5, 17),
+        birth_time=time(14, 30),
+        timezone="Europe/Moscow",
+        latitude=55.75,
+        longitude=37.62,
+        location_name="Москва",
+        chart_id="chart-1",
+        natal_chart_cache={"positions": []},
+    )
+    values.update(overrides)
+    return await service.save_birth_data(**values)
+
+
+@pytest.mark.asyncio
+async def test_save_birth_data_creates_user_and_birth_data(session_maker):
+    async with session_maker() as session:
+        birth_data = await _save(DatabaseService(session))
+
+    assert birth_data.user_id == 42
+    assert birth_data.chart_id == "chart-1"
+    assert birth_data.created_at is not None
+
+    async with session_maker() as session:
+        assert await session.get(User, 42) is not None
+        stored = await DatabaseService(session).get_birth_data(42, with_chart_cache=True)
+        assert stored.location_name == "Москва"
+        assert stored.natal_chart_cache == {"positions": []}
+
+
+@pytest.mark.asyncio
+async def test_save_birth_data_updates_existing_row(session_maker):
+    async with session_maker() as session:
+        await _save(DatabaseService(session))
+    async with session_maker() as session:
+        birth_data = await _save(
+            DatabaseService(session), birth_date=date(1991, 1, 2), chart_id="chart-2"
+        )
+
+    assert birth_data.birth_date == date(1991, 1, 2)
+    assert birth_data.chart_id == "chart-2"
+
+    async with session_maker() as session:
+        assert await session.scalar(select(func.count()).select_from(BirthData)) == 1
+        assert await session.scalar(select(func.count()).select_from(User)) == 1
+
+
+@pytest.mark.asyncio
+async def test_delete_birth_data_returns_chart_id(session_maker):
+    async with session_maker() as session:
+        service = DatabaseService(session)
+        await _save(service)
+
+        assert await service.delete_birth_data(42) == (True, "chart-1")
+        assert await service.delete_birth_data(42) == (False, None)
@@ -0,0 +1,78 @@
+"""Tests for message splitting and streamed replies."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.bot import handlers as handlers_module
+from src.bot.handlers import BotHandlers
+
+
+@pytest.fixture
+def handlers():
+    bot_handlers = BotHandlers(transit_service=MagicMock())
+    yield bot_handlers
+    bot_handlers.shutdown()
+
+
+def test_short_message_is_not_split(handlers):
+    assert handlers._split_message("короткий текст") == ["короткий текст"]
+
+
+def test_split_message_keeps_chunks_within_limit(handlers):
+    sections = ["\n".join(f"Строка {i}.{j} " + "х" * 60 for j in range(10)) for i in range(20)]
+    text = "\n\n".join(sections)
+
+    chunks = handlers._split_message(text, max_length=4000)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 4000 for chunk in chunks)
+    assert "".join(chunks).replace("\n", "") == text.replace("\n", "")
+
+
+def test_split_message_splits_long_section_by_lines(handlers):
+    text = "\n".join("х" * 99 for _ in range(100))
+
+    chunks = handlers._split_message(text, max_length=1000)
+
+    assert all(len(chunk) <= 1000 for chunk in chunks)
+    assert "\n".join(chunks) == text
+
+
+def _message():
+    preview = MagicMock()
+    preview.edit_text = AsyncMock()
+    message = MagicMock()
+    message.reply_text = AsyncMock(return_value=preview)
+    return message, preview
+
+
+@pytest.mark.asyncio
+async def test_streamed_preview_strips_markup(handlers, monkeypatch):
+    monkeypatch.setattr(handlers_module, "_STREAM_EDIT_INTERVAL", 0.0)
+    message, preview = _message()
+    stream = handlers._start_stream(iter(["<b>Жир", "ный</b> &amp; <i", ">курсив</i>"]))
+
+    preview_msg = await handlers._reply_streaming(message, "Заголовок\n\n", stream)
+
+    assert preview_msg is preview
+    assert stream.text == "<b>Жирный</b> &amp; <i>курсив</i>"
+    sent = [message.reply_text.await_args.args[0]]
+    sent += [call.args[0] for call in preview.edit_text.await_args_list]
+    assert all("<" not in text and "&amp;" not in text for text in sent)
+    assert sent[-1] == "Заголовок\n\nЖирный & курсив"
+
+
+@pytest.mark.asyncio
+async def test_streamed_preview_stops_at_message_limit(handlers, monkeypatch):
+    monkeypatch.setattr(handlers_module, "_STREAM_EDIT_INTERVAL", 0.0)
+    message, preview = _message()
+    stream = handlers._start_stream(iter(["а" * 1000 for _ in range(6)]))
+
+    await handlers._reply_streaming(message, "", stream)
+
+    edits = [call.args[0] for call in preview.edit_text.await_args_list]
+    assert len(stream.text) == 6000
+    assert len(edits[-1]) == 4096
+    assert edits[-1].endswith("…")
+    assert sum(len(text) > 4000 for text in edits) == 1
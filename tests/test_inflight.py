@@ -0,0 +1,92 @@
+"""Tests for sharing in-progress calls."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.services.inflight import InflightCalls
+
+
+def test_first_claim_owns_and_later_claims_join():
+    calls = InflightCalls()
+
+    pending, is_owner = calls.claim("key")
+    joined, joined_is_owner = calls.claim("key")
+
+    assert is_owner
+    assert not joined_is_owner
+    assert joined is pending
+
+
+def test_result_reaches_waiters_and_key_is_released():
+    calls = InflightCalls()
+    pending, _ = calls.claim("key")
+    waiter, _ = calls.claim("key")
+
+    with calls.resolving("key", pending):
+        pending.set_result("done")
+
+    assert waiter.result(timeout=0) == "done"
+    _, is_owner = calls.claim("key")
+    assert is_owner
+
+
+def test_error_reaches_waiters_and_owner():
+    calls = InflightCalls()
+    pending, _ = calls.claim("key")
+    waiter, _ = calls.claim("key")
+
+    with pytest.raises(ValueError):
+        with calls.resolving("key", pending):
+            raise ValueError("failed")
+
+    with pytest.raises(ValueError):
+        waiter.result(timeout=0)
+    _, is_owner = calls.claim("key")
+    assert is_owner
+
+
+def test_leaving_without_result_fails_waiters():
+    calls = InflightCalls()
+
+    def stream():
+        pending, _ = calls.claim("key")
+        with calls.resolving("key", pending):
+            yield "partial"
+            pending.set_result("complete")
+
+    chunks = stream()
+    next(chunks)
+    waiter, _ = calls.claim("key")
+    chunks.close()
+
+    with pytest.raises(RuntimeError):
+        waiter.result(timeout=0)
+
+
+def test_concurrent_identical_calls_run_once():
+    calls = InflightCalls()
+    runs = []
+    started = threading.Event()
+
+    def call() -> str:
+        pending, is_owner = calls.claim("key")
+        if not is_owner:
+            return pending.result(timeout=5)
+        with calls.resolving("key", pending):
+            runs.append(1)
+            started.set()
+            time.sleep(0.1)
+            pending.set_result("value")
+        return "value"
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        first = executor.submit(call)
+        started.wait(timeout=5)
+        others = [executor.submit(call) for _ in range(3)]
+        results = [first.result()] + [f.result() for f in others]
+
+    assert results == ["value"] * 4
+    assert runs == [1]
@@ -0,0 +1,91 @@
+"""Tests for the interpretation completion cache."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.services import interpretation_service
+from src.services.interpretation_service import InterpretationService
+
+_POSITIONS = [{"planet": "SUN", "sign": "ARIES", "degree": 10, "minute": 5}]
+_ASPECTS = [
+    {"planet1": "SUN", "planet2": "MOON", "aspect_type": "TRINE", "orb": 1.2},
+]
+
+
+class _Clock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(interpretation_service.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.model = "test-model"
+    client.generate_completion.side_effect = ["first", "second", "third"]
+    return client
+
+
+def test_identical_request_uses_cached_completion(client, clock):
+    service = InterpretationService(client)
+
+    assert service.interpret_transit(_POSITIONS, _ASPECTS) == "first"
+    clock.now += service.TRANSIT_CACHE_TTL - 1
+    assert service.interpret_transit(_POSITIONS, _ASPECTS) == "first"
+
+    assert client.generate_completion.call_count == 1
+    assert (service.cache_hits, service.cache_misses) == (1, 1)
+
+
+def test_expired_completion_is_regenerated(client, clock):
+    service = InterpretationService(client)
+
+    assert service.interpret_transit(_POSITIONS, _ASPECTS) == "first"
+    clock.now += service.TRANSIT_CACHE_TTL + 1
+    assert service.interpret_transit(_POSITIONS, _ASPECTS) == "second"
+
+    assert client.generate_completion.call_count == 2
+
+
+def test_refresh_replaces_cached_completion(client, clock):
+    service = InterpretationService(client)
+
+    assert service.interpret_transit(_POSITIONS, _ASPECTS) == "first"
+    assert service.refresh_transit(_POSITIONS, _ASPECTS)
+    assert service.interpret_transit(_POSITIONS, _ASPECTS) == "second"
+
+
+def test_failed_completion_is_not_cached(client, clock):
+    client.generate_completion.side_effect = [RuntimeError("down"), "recovered"]
+    service = InterpretationService(client)
+
+    assert service.interpret_transit(_POSITIONS, _ASPECTS) == interpretation_service._INTERPRETATION_ERROR
+    assert service.interpret_transit(_POSITIONS, _ASPECTS) == "recovered"
+
+
+def test_cache_evicts_expired_then_oldest_entries(client, clock, monkeypatch):
+    monkeypatch.setattr(InterpretationService, "COMPLETION_CACHE_SIZE", 2)
+    service = InterpretationService(client)
+
+    service._store_cached_completion("old", "a", ttl=10)
+    service._store_cached_completion("live", "b", ttl=100)
+    clock.now += 20
+    service._store_cached_completion("new", "c", ttl=100)
+
+    assert service._get_cached_completion("old") is None
+    assert service._get_cached_completion("live") == "b"
+    service._store_cached_completion("newest", "d", ttl=100)
+    assert service._get_cached_completion("live") is None
+    assert service._get_cached_completion("newest") == "d"